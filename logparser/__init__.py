@@ -19,4 +19,6 @@ __version__ = "1.3"
 __license__ = "Apache"
 __copyright__ = "Copyright 2016 Real-Time Innovations, Inc."
 # pylint: disable=E0603
-__all__ = ("devices", "countset", "logger", "logparser", "logs", "utils")
+__all__ = ("bandwidth", "cache", "devices", "clocks", "countset", "entities",
+           "logger", "logparser", "logs", "message", "parallel",
+           "pendingsamples", "progress", "utils")
@@ -0,0 +1,271 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Bandwidth statistics of the addresses and ports.
+
+Every counter (address, port and type of traffic) has an integer ID that
+indexes flat arrays with its totals. The address counters also add the
+traffic into buckets of one second to get the peak and percentile
+throughput. Only the current bucket is kept: the finished buckets are added
+to a histogram of their throughput with a fixed number of bins, so long
+captures don't use more memory. The percentiles are the center of their bin.
+
+With more than a few addresses, the store uses less memory than a tree of
+dictionaries with a list of the first clock, last clock and bytes for every
+counter: the tree has the IDs of the counters and the totals are in arrays
+without an object for every value. The address + port counters don't have
+a histogram.
+
+Classes:
+  + BandwidthStatistics: Store the bandwidth of every address and port.
+"""
+from __future__ import absolute_import, division
+from array import array
+from math import log
+
+from logparser.clocks import MICROSECONDS, to_seconds
+
+
+class BandwidthStatistics(object):
+    """Store the bandwidth of every address and port.
+
+    The arrays are of doubles since Python 2.7 doesn't have 64-bit integer
+    arrays. They are exact for the clocks and byte counts of any capture.
+    The bins of all the histograms are in a single array of 16-bit counts.
+    When a bin is full, the bins of the histogram are halved, so they keep
+    the proportion of buckets and the number of buckets is kept apart.
+
+    Functions:
+      + __init__: Initialize the store.
+      + add: Add a packet to the address and address + port counters.
+      + get_counters: Get the keys and IDs of the counters.
+      + get_tree: Get the counter IDs by address, port and type.
+      + get_info: Get the totals and throughput of a counter.
+      + _add_counter: Add a packet to a counter.
+      + _create_counter: Create a new counter.
+      + _add_bucket: Add the current bucket to the histogram.
+      + _halve_bins: Halve the bins of a histogram.
+      + _get_bin: Get the histogram bin of a throughput.
+      + _get_percentiles: Get the percentiles of a histogram.
+    """
+
+    # Number of histogram bins for every power of two bytes per second.
+    # The center of a bin is up to 19% from any throughput in the bin.
+    BINS_PER_OCTAVE = 2
+
+    # Power of two of the throughput of the first bin and number of bins:
+    # from 16 B/s to 4 GB/s. The throughput out of the range is added to the
+    # first or last bin.
+    MIN_OCTAVE = 4
+    NUM_BINS = 56
+
+    # Maximum count of a histogram bin.
+    MAX_BIN_COUNT = 0xFFFF
+
+    # Percentiles of the throughput per bucket.
+    PERCENTILES = (50, 90, 99)
+
+    def __init__(self):
+        """Initialize the store."""
+        self._tree = {}
+        self._first = array('d')
+        self._last = array('d')
+        self._bytes = array('d')
+        self._packets = array('d')
+        # Histogram of every counter or -1 for the address + port counters.
+        self._histogram = array('i')
+        # Index and bytes of the current bucket, peak throughput, number of
+        # finished buckets with traffic and bins of every histogram.
+        self._bucket_index = array('I')
+        self._bucket_bytes = array('d')
+        self._peak = array('d')
+        self._traffic = array('I')
+        self._bins = array('H')
+
+    def add(self, address, port, typ, qty, clock):
+        """Add a packet to the address and address + port counters."""
+        counters = self._tree.get(address)
+        if counters is None:
+            counters = self._tree[address] = {}
+        counter = counters.get(typ)
+        if counter is None:
+            counter = counters[typ] = self._create_counter(clock, True)
+        self._add_counter(counter, qty, clock)
+
+        port_counters = counters.get(port)
+        if port_counters is None:
+            port_counters = counters[port] = {}
+        counter = port_counters.get(typ)
+        if counter is None:
+            counter = port_counters[typ] = self._create_counter(clock, False)
+        self._add_counter(counter, qty, clock)
+
+    def _add_counter(self, counter, qty, clock):
+        """Add a packet to a counter."""
+        self._last[counter] = clock
+        self._bytes[counter] += qty
+        self._packets[counter] += 1
+
+        histogram = self._histogram[counter]
+        if histogram < 0:
+            return
+
+        # If the clock goes backward add it to the current bucket.
+        index = (clock - self._first[counter]) // MICROSECONDS
+        if index <= self._bucket_index[histogram]:
+            self._bucket_bytes[histogram] += qty
+        else:
+            self._add_bucket(histogram)
+            self._bucket_index[histogram] = int(index)
+            self._bucket_bytes[histogram] = qty
+
+    def _create_counter(self, clock, histogram):
+        """Create a new counter with or without a histogram.
+
+        Returns:
+            The ID of the counter.
+        """
+        counter = len(self._first)
+        self._first.append(clock)
+        self._last.append(clock)
+        self._bytes.append(0)
+        self._packets.append(0)
+        if not histogram:
+            self._histogram.append(-1)
+            return counter
+
+        self._histogram.append(len(self._peak))
+        self._bucket_index.append(0)
+        self._bucket_bytes.append(0)
+        self._peak.append(0)
+        self._traffic.append(0)
+        self._bins.extend([0] * self.NUM_BINS)
+        return counter
+
+    def _add_bucket(self, histogram):
+        """Add the current bucket to the histogram."""
+        qty = self._bucket_bytes[histogram]
+        if qty > self._peak[histogram]:
+            self._peak[histogram] = qty
+        self._traffic[histogram] += 1
+        index = histogram * self.NUM_BINS + self._get_bin(qty)
+        if self._bins[index] == self.MAX_BIN_COUNT:
+            self._halve_bins(histogram)
+        self._bins[index] += 1
+
+    def _halve_bins(self, histogram):
+        """Halve the bins of a histogram.
+
+        The counts are rounded up so the bins with buckets are never empty.
+        """
+        for i in range(histogram * self.NUM_BINS,
+                       (histogram + 1) * self.NUM_BINS):
+            self._bins[i] = (self._bins[i] + 1) // 2
+
+    def _get_bin(self, rate):
+        """Get the histogram bin of a throughput."""
+        if rate < 2 ** self.MIN_OCTAVE:
+            return 0
+        return min(int((log(rate, 2) - self.MIN_OCTAVE) *
+                       self.BINS_PER_OCTAVE), self.NUM_BINS - 1)
+
+    def get_counters(self):
+        """Get the keys and IDs of the counters.
+
+        Returns:
+            A list with the (address, port, type) key and the ID of every
+            counter. The port is None for the address counters.
+        """
+        counters = []
+        for address, address_counters in self._tree.items():
+            for key, counter in address_counters.items():
+                if isinstance(counter, dict):
+                    counters += [((address, key, typ), port_counter)
+                                 for typ, port_counter in counter.items()]
+                else:
+                    counters.append(((address, None, key), counter))
+        return counters
+
+    def get_tree(self):
+        """Get the counter IDs by address, port and type.
+
+        Returns:
+            A dictionary with the addresses. Every address has the IDs of
+            its counters by type and a dictionary by type for every port.
+            It's the dictionary of the store so it must not be modified.
+        """
+        return self._tree
+
+    def get_info(self, counter):
+        """Get the totals and throughput of a counter.
+
+        Returns:
+            A dictionary with the number of bytes and packets and the
+            seconds between the first and last packet. If the seconds are
+            not zero, it has also the average throughput and, for the
+            address counters, the peak and percentiles of the throughput of
+            the buckets (zero for the buckets without traffic) in bytes per
+            second.
+        """
+        info = {'bytes': int(self._bytes[counter]),
+                'packets': int(self._packets[counter]),
+                'seconds': to_seconds(self._last[counter] -
+                                      self._first[counter])}
+        if info['seconds'] <= 0:
+            return info
+
+        info['throughput'] = info['bytes'] / info['seconds']
+        histogram = self._histogram[counter]
+        if histogram >= 0:
+            qty = self._bucket_bytes[histogram]
+            info['peak'] = max(self._peak[histogram], qty)
+            info['percentiles'] = self._get_percentiles(histogram,
+                                                        info['peak'])
+        return info
+
+    def _get_percentiles(self, histogram, peak):
+        """Get the percentiles of a histogram.
+
+        The current bucket is taken into account without adding it. The
+        percentiles of the bucket with the most traffic are the exact peak.
+
+        Returns:
+            A dictionary with the throughput of every percentile.
+        """
+        start = histogram * self.NUM_BINS
+        bins = self._bins[start:start + self.NUM_BINS].tolist()
+        bins[self._get_bin(self._bucket_bytes[histogram])] += 1
+        num_buckets = int(self._bucket_index[histogram]) + 1
+        num_traffic = self._traffic[histogram] + 1
+        zeros = num_buckets - num_traffic
+
+        percentiles = {}
+        for percentile in self.PERCENTILES:
+            # Nearest-rank percentile
+            rank = max(1, -(-percentile * num_buckets // 100)) - zeros
+            if rank <= 0:
+                percentiles[percentile] = 0
+            elif rank >= num_traffic:
+                percentiles[percentile] = peak
+            else:
+                # The bins may have been halved.
+                rank *= sum(bins) / num_traffic
+                i = 0
+                while rank > bins[i]:
+                    rank -= bins[i]
+                    i += 1
+                percentiles[percentile] = min(2 ** (
+                    self.MIN_OCTAVE + (i + 0.5) / self.BINS_PER_OCTAVE), peak)
+        return percentiles
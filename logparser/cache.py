@@ -0,0 +1,92 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Bounded caches for the decoded log fields.
+
+Classes:
+  + LruCache: Dictionary that keeps only the most recently used items.
+
+Functions:
+  + memoize: Decorator to cache the results of a pure function.
+"""
+from collections import OrderedDict
+
+try:
+    from functools import lru_cache
+except ImportError:  # Python 2.7
+    lru_cache = None
+
+
+class LruCache(object):
+    """Dictionary that keeps only the most recently used items.
+
+    Functions:
+      + __init__: Initialize the cache.
+      + get: Get an item and mark it as the most recently used.
+      + put: Add an item removing the least recently used if it's full.
+      + clear: Remove all the items.
+    """
+
+    def __init__(self, max_size):
+        """Initialize the cache."""
+        self.max_size = max_size
+        self.items = OrderedDict()
+
+    def get(self, key, default=None):
+        """Get an item and mark it as the most recently used."""
+        try:
+            value = self.items.pop(key)
+        except KeyError:
+            return default
+        self.items[key] = value
+        return value
+
+    def put(self, key, value):
+        """Add an item removing the least recently used if it's full."""
+        self.items.pop(key, None)
+        if len(self.items) >= self.max_size:
+            self.items.popitem(last=False)
+        self.items[key] = value
+
+    def clear(self):
+        """Remove all the items."""
+        self.items.clear()
+
+
+def memoize(max_size):
+    """Decorator to cache the results of a pure function.
+
+    The function must have only positional arguments. It uses the C
+    implementation of functools if available.
+    """
+    if lru_cache is not None:
+        return lru_cache(max_size)
+
+    def decorator(function):
+        """Wrap the function with a cache."""
+        cache = LruCache(max_size)
+        missing = object()
+
+        def wrapper(*args):
+            """Get the result from the cache or call the function."""
+            result = cache.get(args, missing)
+            if result is missing:
+                result = function(*args)
+                cache.put(args, result)
+            return result
+        wrapper.__doc__ = function.__doc__
+        wrapper.__name__ = function.__name__
+        return wrapper
+    return decorator
@@ -0,0 +1,134 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Parse and format the log clocks.
+
+The clocks are integers with the microseconds since the epoch. The logs can
+have the system and the monotonic clocks at the beginning of the line:
+"[mm/dd/yyyy hh:mm:ss.ffffff][ssssssssss.ffffff]" or only the system clock:
+"[ssssssssss.ffffff]". The fields have a fixed width so they are parsed by
+slicing the text.
+
+Functions:
+  + exceeds_distance: Check if two clocks are too distant.
+  + format_clock: Convert the system clock into text in ISO format.
+  + get_header: Get the text of the clocks at the beginning of the line.
+  + get_timestamp: Get the text of the current system clock.
+  + parse_clocks: Search and parse the clocks in the line.
+  + parse_header: Parse the clocks from the header text.
+  + to_seconds: Convert a clock difference into seconds.
+  + to_timedelta: Convert a clock difference into a timedelta.
+
+Constants:
+  + CLOCKS_REGEX: Regular expression for the header with the two clocks.
+  + SINGLE_CLOCK_REGEX: Regular expression for the header with one clock.
+  + MICROSECONDS: Number of microseconds in a second.
+  + MAX_DISTANCE: Maximum distance between the clocks of consecutive logs.
+"""
+from __future__ import absolute_import
+import re
+from calendar import timegm
+from datetime import datetime, timedelta
+
+CLOCKS_REGEX = re.compile(r"\[\d{2}/\d{2}/\d{4} \d{2}:\d{2}:\d{2}.\d{6}\]" +
+                          r"\[\d{10}\.\d{6}\]")
+SINGLE_CLOCK_REGEX = re.compile(r"\[\d{10}\.\d{6}\]")
+MICROSECONDS = 1000000
+MAX_DISTANCE = 60 * MICROSECONDS
+
+_CLOCKS_LENGTH = 47
+_SINGLE_CLOCK_LENGTH = 19
+_EPOCH = datetime(1970, 1, 1)
+
+
+def get_header(line):
+    """Get the text of the clocks at the beginning of the line.
+
+    The text is not validated, it only has the length of the header.
+    """
+    if line[:1] != "[":
+        return None
+    if line[27:29] == "][":
+        return line[:_CLOCKS_LENGTH]
+    return line[:_SINGLE_CLOCK_LENGTH]
+
+
+def parse_header(header):
+    """Parse the clocks from the header text.
+
+    Returns:
+        A tuple with the monotonic clock (None if there is only one clock)
+        and the system clock or None if the header is not valid.
+    """
+    if len(header) == _CLOCKS_LENGTH and CLOCKS_REGEX.match(header):
+        system = timegm((int(header[7:11]), int(header[1:3]),
+                         int(header[4:6]), int(header[12:14]),
+                         int(header[15:17]), int(header[18:20])))
+        system = system * MICROSECONDS + int(header[21:27])
+        monotonic = int(header[29:39]) * MICROSECONDS + int(header[40:46])
+        return monotonic, system
+    if len(header) == _SINGLE_CLOCK_LENGTH and \
+            SINGLE_CLOCK_REGEX.match(header):
+        return None, int(header[1:11]) * MICROSECONDS + int(header[12:18])
+    return None
+
+
+def parse_clocks(line):
+    """Search and parse the clocks in the line.
+
+    It's slower than parsing the header but the clocks can be anywhere.
+    """
+    match = CLOCKS_REGEX.search(line)
+    if not match:
+        match = SINGLE_CLOCK_REGEX.search(line)
+    return parse_header(match.group(0)) if match else None
+
+
+def exceeds_distance(old_clocks, new_clocks):
+    """Check if two clocks are too distant.
+
+    The monotonic clocks are only compared if both logs have them.
+    """
+    if abs(new_clocks[1] - old_clocks[1]) > MAX_DISTANCE:
+        return True
+    return bool(new_clocks[0] and old_clocks[0]) and \
+        abs(new_clocks[0] - old_clocks[0]) > MAX_DISTANCE
+
+
+def format_clock(clock):
+    """Convert the system clock into text in ISO format."""
+    return (_EPOCH + timedelta(microseconds=clock)).isoformat()
+
+
+def get_timestamp(state):
+    """Get the text of the current system clock.
+
+    The last text is saved in the state since many consecutive log messages
+    have the same clock.
+    """
+    clock = state['clocks'][1]
+    if state.get('timestamp', (None,))[0] != clock:
+        state['timestamp'] = (clock, format_clock(clock))
+    return state['timestamp'][1]
+
+
+def to_seconds(clock_diff):
+    """Convert a clock difference into seconds."""
+    return clock_diff / float(MICROSECONDS)
+
+
+def to_timedelta(clock_diff):
+    """Convert a clock difference into a timedelta."""
+    return timedelta(microseconds=clock_diff)
@@ -15,33 +15,118 @@
 #   limitations under the License.
 """Logger.
 
-The module contains the CountSet class.
+The module contains the CountSet class and the get_template function.
 """
+import re
+from collections import OrderedDict
+from heapq import heappop, heappush, heapreplace
+
+# Entity names (e.g.: W-K_800000) and GUIDs: an IPv4, IPv6 or obfuscated
+# address with the application and instance IDs, or an assigned name like
+# H1.A1.P1, optionally followed by the entity name.
+_ENTITY = r"[A-Z][A-Z+-]*_[0-9a-f]{6}"
+_GUID = (r"(?:(?:\d{1,3}(?:\.\d{1,3}){3}" +
+         r"|[0-9a-fA-F]{4}(?::[0-9a-fA-F]{4}){7}|[0-9a-f]{15})" +
+         r"(?: [0-9a-f]{5}(?: \d+)?)?" +
+         r"|H\d+(?:\.A\d+(?:\.P\d+)?)?)(?:\." + _ENTITY + r")?")
+
+# Variable fields of the messages: quoted names (e.g.: topics and types),
+# hexadecimal numbers, GUIDs, entity names and numbers. The numbers in a
+# word (e.g.: UDPv4 or LP-12) are part of the message.
+_VARIABLE_FIELDS = re.compile(
+    r"'[^']*'|\b0[xX][0-9a-fA-F]+\b|\b(?:" + _GUID + "|" + _ENTITY + r")\b" +
+    r"|(?<![\w.-])\d+(?:\.\d+)?\b")
+
+
+def get_template(element):
+    """Get the template of a message replacing its variable fields by #."""
+    return _VARIABLE_FIELDS.sub("#", element)
 
 
 class CountSet(object):
-    """Class to keep a list of unique element and count their ocurrencies."""
+    """Class to keep a list of unique element and count their ocurrencies.
 
-    def __init__(self):
-        """Constructor of the class."""
-        self.countset = {}
+    In bounded mode it keeps only the max_size most frequent elements with
+    the Space-Saving algorithm. When it's full, a new element replaces the
+    element with the lowest count and starts with its count. That count is
+    the error of the new element: its real count is between count - error
+    and count. The elements with a real count larger than the total count
+    divided by max_size are always kept. The bounded mode also counts the
+    elements by template in another bounded CountSet.
 
-    def add(self, element):
+    The bounded mode finds the element with the lowest count in a heap.
+    The heap isn't updated when a count increases, so its entries may have
+    an old count. Before evicting an element, the entries with an old
+    count are pushed again with the current count. Since every entry is
+    pushed again once at most for each increment, adding an element takes
+    O(log max_size) amortized time.
+    """
+
+    def __init__(self, max_size=None, rollup=True):
+        """Constructor of the class.
+
+        Args:
+            max_size (int,optional): maximum number of elements to keep or
+                None to keep all of them
+            rollup (bool,optional): count the elements by template in
+                bounded mode
+        """
+        # The values are the ID, the count and the error.
+        self.countset = OrderedDict()
+        # The heap entries are the count, the ID and the element.
+        self._heap = []
+        self.max_size = max_size
+        self.next_id = 0
+        self.templates = None
+        if max_size and rollup:
+            self.templates = CountSet(max_size, False)
+
+    def add(self, element, count=1, template=None):
         """Add an element to the countset.
 
         Args:
             element (obj): new element to add to the countset
+            count (int,optional): number of occurrences to add
+            template (str,optional): template of the element, by default
+                the element with its variable fields replaced by #
         """
-        if element not in self.countset:
-            # First element is the ID and second the number of occurrences.
-            self.countset[element] = [len(self.countset), 0]
-        self.countset[element][1] += 1
+        if self.templates is not None:
+            if template is None:
+                template = get_template(element)
+            self.templates.add(template, count)
+
+        if element in self.countset:
+            self.countset[element][1] += count
+            return
+
+        error = 0
+        if self.max_size and len(self.countset) >= self.max_size:
+            # Replace the element with the lowest count.
+            error = self.countset.pop(self._pop_min())[1]
+        self.countset[element] = [self.next_id, error + count, error]
+        if self.max_size:
+            heappush(self._heap, (error + count, self.next_id, element))
+        self.next_id += 1
+
+    def _pop_min(self):
+        """Remove from the heap the oldest element with the lowest count."""
+        while True:
+            count, element_id, element = self._heap[0]
+            current = self.countset[element][1]
+            if current == count:
+                heappop(self._heap)
+                return element
+            heapreplace(self._heap, (current, element_id, element))
+
+    def get_error(self, element):
+        """Get the maximum overestimation of the count of an element."""
+        return self.countset[element][2]
 
     def elements(self):
-        """Iterate over the elements of the set sorted by ID.
+        """Iterate over the elements of the set in insertion order.
 
         Returns:
             A list of three elements: ID, object and count.
         """
-        for obj in sorted(self.countset, key=lambda k: self.countset[k][0]):
-            yield [self.countset[obj][0], obj, self.countset[obj][1]]
+        for obj, info in self.countset.items():
+            yield [info[0], obj, info[1]]
@@ -31,17 +31,20 @@ class FormatDevice(object):
       + write_configurations: write the configuration messages.
       + write_warnings: write the warning messages.
       + write_errors: write the error messages.
+
+    You can implement the following method if the device has resources:
+      + close: close the device.
     """
 
     def write_header(self, state):
         """Write the header if any."""
         raise NotImplementedError("write_header not implemented")
 
-    def write_message(self, content, state):
+    def write_message(self, message, state):
         """Write the message.
 
-        The content argument is a dictionary with at least 'description' item.
-        The optional items are:
+        The message argument is a Message with at least the description. The
+        optional fields are None if they are not set:
           + kind: the kind or remark for the message.
           + timestamp: the timestamp of the message.
           + input_line: the current input line.
@@ -63,3 +66,7 @@ class FormatDevice(object):
     def write_errors(self, state):
         """Write the error messages."""
         raise NotImplementedError("write_errors not implemented")
+
+    def close(self):
+        """Close the device."""
+        pass
@@ -21,11 +21,24 @@ Classes:
   + InputDevice: Abstract base class for input device implementations
   + InputConsoleDevice: Reads the DDS log messages from the standard input.
   + InputFileDevice: Reads the DDS log messages from a file.
+  + InputMmapDevice: Reads the DDS log messages from a memory-mapped file.
+  + InputThreadDevice: Reads the DDS log messages from a device in a thread.
 """
 from __future__ import absolute_import, print_function
+import mmap
+import os
+from codecs import getincrementaldecoder
+from collections import deque
+from io import IncrementalNewlineDecoder
+from locale import getpreferredencoding
 from os import fstat
-from sys import stdin, stdout
-from time import time
+from sys import stdin
+from threading import Thread
+
+try:
+    from queue import Empty, Queue
+except ImportError:  # Python 2.7
+    from Queue import Empty, Queue
 
 
 class InputDevice(object):
@@ -34,11 +47,20 @@ class InputDevice(object):
     You will need to implement the following methods:
         + read_line: Read and return the next DDS log message from the device.
         + close: Close the device.
+
+    You can implement the following method to read faster:
+        + read_lines: Read and return the next block of DDS log messages.
+
+    The position attribute counts the bytes read from the device to show the
+    progress. The progress reporter reads it from another thread.
     """
 
+    # Default size in characters of the blocks of lines.
+    BLOCK_SIZE = 64 * 1024
+
     def __init__(self, state):
         """Initialize the device."""
-        self.show_progress = state['show_progress']
+        self.position = 0
 
     def read_line(self):
         """Read and return the next DDS log message from the device.
@@ -47,6 +69,21 @@ class InputDevice(object):
         """
         raise NotImplementedError("read_line not implemented")
 
+    def read_lines(self, size=BLOCK_SIZE):
+        """Read and return the next block of DDS log messages.
+
+        The lines don't have the end of line characters. The block has up to
+        about size characters. By default it only reads one line.
+
+        It must return an empty list on EOF.
+        """
+        line = self.read_line()
+        return [] if line is None else [line.rstrip("\r\n")]
+
+    def tell(self):
+        """Get the number of bytes read from the device."""
+        return self.position
+
     def close(self):
         """Close the device."""
         raise NotImplementedError("close not implemented")
@@ -56,28 +93,19 @@ class InputConsoleDevice(InputDevice):
     """Console device. Reads the DDS log messages from the standard input.
 
     Functions:
-      + print_time: Print the execution time.
       + read_line: Read and return the next DDS log message from the device.
+      + read_lines: Read and return the next block of DDS log messages.
       + close: Close the file stream.
     """
 
     def __init__(self, state):
         """Initialize the device."""
         super(InputConsoleDevice, self).__init__(state)
-        self.start_time = time()
-        self.current_time = -1
-
-    def print_time(self, threshold=0):
-        """Print the execution time."""
-        current_time = time()
-        update_time = current_time - self.current_time
-        if self.current_time > 0 and update_time < threshold:
-            return
-
-        self.current_time = current_time
-        diff_time = current_time - self.start_time
-        stdout.write("Running for %.2f sec\r" % diff_time)
-        stdout.flush()
+        self.pending = ""
+        self.decoder = None
+        if hasattr(stdin, "buffer"):  # Python 3.x
+            self.decoder = IncrementalNewlineDecoder(
+                getincrementaldecoder(stdin.encoding)(stdin.errors), True)
 
     def read_line(self):
         """Read and return the next DDS log message from the device.
@@ -87,17 +115,43 @@ class InputConsoleDevice(InputDevice):
         line = None
         try:
             line = stdin.readline()
+            self.position += len(line)
             if line == "":  # On EOF it'll be empty, for empty line it's \n
                 line = None
         except Exception as ex:  # pylint: disable=W0703
             # On error don't return None because we want to continue reading.
             line = ""
             print("[InputError] %s" % ex)
-
-        if self.show_progress:
-            self.print_time(0.2)
         return line
 
+    def read_lines(self, size=InputDevice.BLOCK_SIZE):
+        """Read and return the next block of DDS log messages.
+
+        It only waits for new data if there isn't any available line, so the
+        logs are parsed as soon as they arrive. Return an empty list on EOF.
+        """
+        if not self.decoder:  # Python 2.7
+            return super(InputConsoleDevice, self).read_lines(size)
+
+        lines = []
+        data = True
+        while not lines and data:
+            try:
+                data = stdin.buffer.read1(size)
+                self.position += len(data)
+                text = self.decoder.decode(data, not data)
+            except Exception as ex:  # pylint: disable=W0703
+                # On error don't return EOF because we want to continue.
+                print("[InputError] %s" % ex)
+                return [""]
+
+            lines = (self.pending + text).split("\n")
+            self.pending = lines.pop()
+            if not data and self.pending:
+                lines.append(self.pending)
+                self.pending = ""
+        return lines
+
     def close(self):
         """Close the device."""
         pass
@@ -106,10 +160,14 @@ class InputConsoleDevice(InputDevice):
 class InputFileDevice(InputDevice):
     """Input file device. Reads the DDS log messages from a file.
 
+    The position counts the characters read as an approximation of the bytes
+    since calling tell in a text stream is slow.
+
     Functions:
       + __init__: Initialize the device with the specified file path.
-      + print_progress: Print a terminal progress bar.
       + read_line: Read and return the next DDS log message from the device.
+      + read_lines: Read and return the next block of DDS log messages.
+      + seek: Set the current position in the file.
       + close: Close the file stream.
     """
 
@@ -118,29 +176,7 @@ class InputFileDevice(InputDevice):
         super(InputFileDevice, self).__init__(state)
         self.stream = open(file_path, "r")
         self.file_size = fstat(self.stream.fileno()).st_size
-        self.progress = -1
-
-    def print_progress(self, threshold=0, decimals=1, barLength=100):
-        """Print a terminal progress bar."""
-        # Based on @Greenstick's reply (https://stackoverflow.com/a/34325723)
-        iteration = self.stream.tell()
-        if iteration > self.file_size:
-            return
-        total = self.file_size
-        if total == 0:
-            return
-
-        progress = 100.0 * iteration / total
-        if self.progress and progress - self.progress < threshold:
-            return
-
-        self.progress = progress
-        percents = ("%03." + str(decimals) + "f") % progress
-        filledLength = int(round(barLength * iteration / float(total)))
-
-        barText = '*' * filledLength + '-' * (barLength - filledLength)
-        stdout.write('%s| %s%% Completed\r' % (barText, percents))
-        stdout.flush()
+        self.pending = ""
 
     def read_line(self):
         """Read and return the next DDS log message from the device.
@@ -150,17 +186,300 @@ class InputFileDevice(InputDevice):
         line = None
         try:
             line = self.stream.readline()
+            self.position += len(line)
             if line == "":  # On EOF it'll be empty, for empty line it's \n
                 line = None
         except Exception as ex:  # pylint: disable=W0703
             # On error don't return None because we want to continue reading.
             line = ""
             print("[InputError] %s" % ex)
-
-        if self.show_progress:
-            self.print_progress(0.01, 2, 51)
         return line
 
+    def read_lines(self, size=InputDevice.BLOCK_SIZE):
+        """Read and return the next block of DDS log messages.
+
+        Return an empty list on EOF.
+        """
+        lines = []
+        data = True
+        while not lines and data:
+            try:
+                data = self.stream.read(size)
+                self.position += len(data)
+            except Exception as ex:  # pylint: disable=W0703
+                # On error don't return EOF because we want to continue.
+                print("[InputError] %s" % ex)
+                return [""]
+
+            lines = (self.pending + data).split("\n")
+            self.pending = lines.pop()
+            if not data and self.pending:
+                lines.append(self.pending)
+                self.pending = ""
+
+        # Python 2.7 doesn't convert the Windows end of lines.
+        if str is bytes:
+            lines = [line.rstrip("\r") for line in lines]
+        return lines
+
+    def seek(self, position):
+        """Set the current position in the file."""
+        self.stream.seek(position)
+        self.position = position
+        self.pending = ""
+
     def close(self):
         """Close the device."""
         self.stream.close()
+
+
+class InputMmapDevice(InputFileDevice):
+    """Input memory-mapped file device. Reads the DDS log messages from a file.
+
+    The file is mapped into memory and split into lines by blocks of bytes,
+    avoiding the overhead of reading every line from a text stream. Like the
+    text stream, the lines end with LF, CR or CRLF. The lines are the same
+    as the ones from the text stream except that too long lines are
+    truncated.
+
+    Functions:
+      + __init__: Map the file into memory.
+      + read_line: Read and return the next DDS log message from the device.
+      + read_lines: Read and return the next block of DDS log messages.
+      + seek: Set the current position in the file.
+      + close: Unmap and close the file.
+      + _read_block: Read the lines of the next block of bytes.
+      + _rfind_line_end: Find the end of the last line in a range.
+      + _find_line_end: Find the end of the line after a position.
+      + _decode: Decode the lines from the bytes.
+      + _decode_line: Decode the bytes of a line.
+      + _decode_truncated: Decode the bytes of a truncated line.
+    """
+
+    # Maximum number of bytes of a line. Longer lines are truncated. It's
+    # also the size of the blocks, so no line in a block is too long.
+    MAX_LINE_LENGTH = 1024 * 1024
+
+    def __init__(self, file_path, state):
+        """Map the file into memory."""
+        super(InputMmapDevice, self).__init__(file_path, state)
+        self.lines = deque()
+        self.encoding = getpreferredencoding(False)
+        self.map = None
+        if self.file_size == 0:
+            return
+
+        fileno = self.stream.fileno()
+        self.map = mmap.mmap(fileno, 0, access=mmap.ACCESS_READ)
+
+        # Tell the kernel to read ahead since the access is sequential.
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fileno, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if hasattr(self.map, "madvise"):
+            self.map.madvise(mmap.MADV_SEQUENTIAL)
+
+    def _read_block(self, size):
+        """Read the lines of the next block of bytes."""
+        start = self.position
+        end = self._rfind_line_end(start, start + size)
+        if end is None:
+            # The last line of the file or a line longer than the block.
+            end = self._find_line_end(start + size)
+            self.position = end
+            if end - start > self.MAX_LINE_LENGTH:
+                return [self._decode_truncated(
+                    self.map[start:start + self.MAX_LINE_LENGTH])]
+        else:
+            self.position = end
+        return self._decode(self.map[start:end])
+
+    def _rfind_line_end(self, start, end):
+        """Find the end of the last line in a range.
+
+        Return the position after the end of line or None if there isn't
+        any. A CRLF at the end of the range may end after it.
+        """
+        newline = self.map.rfind(b"\n", start, end)
+        carriage = self.map.rfind(b"\r", start if newline == -1 else newline,
+                                  end)
+        if carriage == -1:
+            return None if newline == -1 else newline + 1
+        if self.map[carriage + 1:carriage + 2] == b"\n":
+            return carriage + 2
+        return carriage + 1
+
+    def _find_line_end(self, start):
+        """Find the end of the line after a position.
+
+        Return the position after the end of line or the file size if it's
+        the last line.
+        """
+        newline = self.map.find(b"\n", start)
+        if newline == -1:
+            newline = self.file_size
+        carriage = self.map.find(b"\r", start, newline)
+        if carriage == -1:
+            return min(newline + 1, self.file_size)
+        if self.map[carriage + 1:carriage + 2] == b"\n":
+            return carriage + 2
+        return carriage + 1
+
+    def _decode(self, data):
+        """Decode the lines from the bytes.
+
+        Like the text stream, a single CR is the end of a line too.
+        """
+        if b"\r" not in data:
+            if str is not bytes:  # Python 3.x
+                try:
+                    data = data.decode(self.encoding)
+                except UnicodeDecodeError:
+                    return [self._decode_line(line)
+                            for line in data.splitlines()]
+            lines = data.split("\n")
+            if not lines[-1]:
+                lines.pop()
+            return lines
+        return [self._decode_line(line) for line in data.splitlines()]
+
+    def _decode_line(self, line):
+        """Decode the bytes of a line."""
+        if str is bytes:  # Python 2.7
+            return line
+        try:
+            return line.decode(self.encoding)
+        except UnicodeDecodeError as ex:
+            print("[InputError] %s" % ex)
+            return ""
+
+    def _decode_truncated(self, line):
+        """Decode the bytes of a truncated line.
+
+        The line may be cut in the middle of a character, so only that
+        character is dropped.
+        """
+        if str is bytes:  # Python 2.7
+            return line
+        try:
+            return getincrementaldecoder(self.encoding)().decode(line)
+        except UnicodeDecodeError as ex:
+            print("[InputError] %s" % ex)
+            return ""
+
+    def read_line(self):
+        """Read and return the next DDS log message from the device.
+
+        Return None on EOF or error.
+        """
+        if not self.lines:
+            if self.position >= self.file_size:
+                return None
+            self.lines.extend(self._read_block(self.MAX_LINE_LENGTH))
+        return self.lines.popleft()
+
+    def read_lines(self, size=InputDevice.BLOCK_SIZE):
+        """Read and return the next block of DDS log messages.
+
+        Return an empty list on EOF.
+        """
+        if self.lines:
+            lines = list(self.lines)
+            self.lines.clear()
+            return lines
+        if self.position >= self.file_size:
+            return []
+        return self._read_block(size)
+
+    def seek(self, position):
+        """Set the current position in the file."""
+        self.position = position
+        self.lines.clear()
+
+    def close(self):
+        """Unmap and close the file."""
+        if self.map is not None:
+            self.map.close()
+        super(InputMmapDevice, self).close()
+
+
+class InputThreadDevice(InputDevice):
+    """Reads the DDS log messages from a device in a thread.
+
+    The thread keeps reading from the device into a bounded queue while the
+    logs are parsed, so the application writing the logs is not blocked.
+
+    Functions:
+      + __init__: Start the thread reading from the device.
+      + read_line: Read and return the next DDS log message from the queue.
+      + read_lines: Read and return the next block of DDS log messages.
+      + tell: Get the number of bytes read from the device.
+      + close: Close the device.
+      + _read_lines: Read the lines from the device into the queue.
+    """
+
+    # Seconds between checks for the SIGINT while waiting for lines.
+    POLL_TIME = 0.5
+
+    def __init__(self, device, max_size, state):
+        """Start the thread reading from the device."""
+        super(InputThreadDevice, self).__init__(state)
+        self.device = device
+        self.queue = Queue(max_size)
+        self.eof = False
+        # The thread may be blocked reading when the program finishes.
+        thread = Thread(target=self._read_lines)
+        thread.daemon = True
+        thread.start()
+
+    def _read_lines(self):
+        """Read the lines from the device into the queue."""
+        lines = self.device.read_lines()
+        while lines:
+            for line in lines:
+                self.queue.put(line)
+            lines = self.device.read_lines()
+        self.queue.put(None)
+
+    def read_line(self):
+        """Read and return the next DDS log message from the queue.
+
+        Return None on EOF or error.
+        """
+        while not self.eof:
+            # Wait with timeout to receive the SIGINT in Python 2.7.
+            try:
+                line = self.queue.get(True, self.POLL_TIME)
+            except Empty:
+                continue
+            self.eof = line is None
+            return line
+        return None
+
+    def read_lines(self, size=InputDevice.BLOCK_SIZE):
+        """Read and return the next block of DDS log messages.
+
+        It only waits if there isn't any line in the queue. Return an empty
+        list on EOF.
+        """
+        line = self.read_line()
+        lines = []
+        length = 0
+        while line is not None:
+            lines.append(line)
+            length += len(line)
+            if length >= size:
+                break
+            try:
+                line = self.queue.get(False)
+            except Empty:
+                break
+            self.eof = line is None
+        return lines
+
+    def tell(self):
+        """Get the number of bytes read from the device."""
+        return self.device.tell()
+
+    def close(self):
+        """Close the device."""
+        self.device.close()
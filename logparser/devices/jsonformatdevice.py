@@ -0,0 +1,209 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Format device to show the output as JSON Lines.
+
+Every line of the output is a JSON object with a 'type' item:
+  + header: the version of the parser.
+  + message: a log message with the fields of the message that are set.
+  + locators: the send and receive locators of every participant.
+  + names: the names assigned to the hosts, apps and participants.
+  + statistics: the bandwidth statistics of every address and port.
+  + statistics_packet: the packet statistics of every GUID.
+  + threads: the threads information.
+  + config, warnings and errors: the list of messages with their count.
+
+Classes:
+  + JsonFormatDevice: Format device for JSON Lines.
+"""
+from __future__ import absolute_import
+from json import JSONEncoder
+
+from logparser.__init__ import __version__
+from logparser.devices.formatdevice import FormatDevice
+
+
+class JsonFormatDevice(FormatDevice):
+    """Format device for JSON Lines.
+
+    Functions:
+      + write_header: write the header.
+      + write_message: write the message.
+      + write_warnings: write the warning messages.
+      + write_errors: write the error messages.
+      + write_configurations: write the configuration messages.
+      + write_countset: write a generic log message list.
+      + get_countset_items: get the messages of a log message list.
+      + write_locators: write the locators.
+      + write_host_summary: write the assigned names.
+      + write_statistics_bandwidth: write the bandwidth statistics.
+      + write_statistics_packets: write the packet statistics.
+      + write_threads_info: write the threads information.
+      + write_object: write an object as a JSON line.
+      + get_throughput: get the throughput information.
+    """
+
+    def __init__(self, state):
+        """Initialize the device."""
+        self.write = state['output_device'].write
+        # The encoder doesn't check circular references and doesn't add
+        # whitespaces to serialize faster.
+        self.encode = JSONEncoder(ensure_ascii=False, check_circular=False,
+                                  separators=(",", ":")).encode
+
+    def write_object(self, obj):
+        """Write an object as a JSON line."""
+        self.write(self.encode(obj))
+
+    def write_header(self, state):
+        """Write the header."""
+        self.write_object({'type': 'header', 'version': __version__})
+
+    def write_message(self, message, state):
+        """Write the message.
+
+        It writes the fields of the message that are set, in the same order,
+        with the timestamp without padding and the list of kinds.
+        """
+        obj = {'type': 'message'}
+        obj.update(message.items())
+        if message.timestamp is not None:
+            obj['timestamp'] = message.timestamp.strip()
+        if message.kind is not None:
+            obj['kind'] = [kind for kind in message.kind.split("|") if kind]
+        self.write_object(obj)
+
+    def write_warnings(self, state):
+        """Write the warning messages."""
+        self.write_countset(state['warnings'], 'warnings')
+
+    def write_errors(self, state):
+        """Write the error messages."""
+        self.write_countset(state['errors'], 'errors')
+
+    def write_configurations(self, state):
+        """Write the configuration messages."""
+        if 'locators' in state:
+            self.write_locators(state)
+        if 'names' in state and 'name_table' in state:
+            self.write_host_summary(state)
+        if 'statistics' in state and not state['no_stats']:
+            self.write_statistics_bandwidth(state)
+        if 'statistics_packet' in state and not state['no_stats']:
+            self.write_statistics_packets(state)
+        if 'threads' in state and not state['no_stats']:
+            self.write_threads_info(state)
+        self.write_countset(state['config'], 'config')
+
+    def write_countset(self, items, title):
+        """Write a generic log message list.
+
+        The error is the maximum overestimation of the count in the bounded
+        lists. These lists have also the items by template.
+        """
+        obj = {'type': title, 'items': self.get_countset_items(items)}
+        if items.templates is not None:
+            obj['templates'] = self.get_countset_items(items.templates)
+        self.write_object(obj)
+
+    @staticmethod
+    def get_countset_items(items):
+        """Get the messages of a generic log message list."""
+        return [{'id': i, 'message': msg, 'count': count,
+                 'error': items.get_error(msg)}
+                for i, msg, count in items.elements()]
+
+    def write_locators(self, state):
+        """Write the locators."""
+        locators = state['locators']
+        self.write_object({
+            'type': 'locators',
+            'participants': [{'participant': part,
+                              'send': list(locators[part]['send']),
+                              'receive': list(locators[part]['receive'])}
+                             for part in locators]})
+
+    def write_host_summary(self, state):
+        """Write the assigned names."""
+        table = state['name_table']
+        names = state['names']
+        hosts = []
+        for host in table:
+            apps = []
+            for app in table[host]:
+                addr = host + " " + app
+                apps.append({
+                    'app': app,
+                    'name': names.get(addr),
+                    'participants': [
+                        {'participant': part,
+                         'name': names.get(addr + " " + part)}
+                        for part in table[host][app]]})
+            hosts.append({'host': host, 'name': names.get(host),
+                          'apps': apps})
+        self.write_object({'type': 'names', 'hosts': hosts})
+
+    def write_statistics_bandwidth(self, state):
+        """Write the bandwidth statistics."""
+        addresses = []
+        stats = state['statistics']
+        tree = stats.get_tree()
+        for addr in tree:
+            types = {}
+            ports = {}
+            for typ in tree[addr]:
+                # If this is a port with dictionary of statistics types
+                if isinstance(tree[addr][typ], dict):
+                    ports[str(typ)] = dict(
+                        (port_typ, self.get_throughput(stats, counter))
+                        for port_typ, counter in tree[addr][typ].items())
+                # If this is the host counter
+                else:
+                    types[typ] = self.get_throughput(stats, tree[addr][typ])
+            addresses.append({'address': addr, 'types': types,
+                              'ports': ports})
+        self.write_object({'type': 'statistics', 'addresses': addresses})
+
+    @staticmethod
+    def get_throughput(stats, counter):
+        """Get the throughput information.
+
+        The throughput items are None if all the packets are in the same
+        time. The ports don't have the peak and the percentiles.
+        """
+        info = stats.get_info(counter)
+        percentiles = info.get('percentiles', {})
+        return {'bytes': info['bytes'], 'packets': info['packets'],
+                'seconds': info['seconds'],
+                'throughput': info.get('throughput'),
+                'peak': info.get('peak'),
+                'percentiles': dict(("p%d" % p, rate)
+                                    for p, rate in percentiles.items())}
+
+    def write_statistics_packets(self, state):
+        """Write the packet statistics."""
+        self.write_object({'type': 'statistics_packet',
+                           'guids': [{'guid': guid, 'packets': packets}
+                                     for guid, packets in
+                                     state['statistics_packet'].items()]})
+
+    def write_threads_info(self, state):
+        """Write the threads information."""
+        info = state['threads']
+        threads = [thread for name, thread in info.items() if name != 'all']
+        self.write_object({
+            'type': 'threads',
+            'count': info['all'] if 'all' in info else len(info),
+            'threads': threads})
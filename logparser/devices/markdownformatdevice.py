@@ -19,6 +19,8 @@ Classes:
   + MarkdownFormatDevice: Format device for Markdown.
 """
 from __future__ import absolute_import
+from operator import attrgetter
+
 from logparser.__init__ import __version__
 from logparser.devices.formatdevice import FormatDevice
 
@@ -33,6 +35,7 @@ class MarkdownFormatDevice(FormatDevice):
       + write_errors: write the warning messages.
       + write_configurations: write the configuration messages.
       + write_countset: write a generic log message list.
+      + write_countset_items: write the messages of a log message list.
       + write_locators: write the locators if any.
       + write_host_summary: write the host summary.
       + write_statistics_bandwidth: write the bandwidth statistics.
@@ -40,13 +43,73 @@ class MarkdownFormatDevice(FormatDevice):
       + write_statistics_packets: write the packet statistics.
       + write_threads_info: write the threads information.
       + bytes_to_string: convert a byte unit value into string.
+      + _create_renderer: create the function that formats the rows.
+      + _get_emphasis: get the Markdown emphasis of a message kind.
     """
 
+    # Cells of the In/Out column.
+    _INOUT = {None: "".ljust(9), 'in': "---> ".center(9),
+              'out': " <---".center(9)}
+
     def __init__(self, state):
         """Initialize the device."""
         self.write = state['output_device'].write
         self.show_timestamp = not state['no_timestamp']
         self.show_lines = state['show_lines']
+        self._emphasis = {None: ("", "")}
+        self._render = self._create_renderer()
+
+    def _create_renderer(self):
+        """Create the function that formats the rows.
+
+        The row format and the getters of its fields are built once for the
+        active columns, so the rows are formatted without checking the
+        options.
+        """
+        inouts = self._INOUT
+        emphases = self._emphasis
+        get_emphasis = self._get_emphasis
+
+        def get_timestamp(msg):
+            """Get the timestamp column."""
+            return ((msg.timestamp or "").center(28),)
+
+        def get_message(msg):
+            """Get the remote, in/out, entity and description columns."""
+            emphasis = emphases.get(msg.kind) or get_emphasis(msg.kind)
+            return ((msg.remote or "").center(24), inouts[msg.inout],
+                    (msg.entity or "").center(16),
+                    emphasis[0], msg.description, emphasis[1])
+
+        columns = []
+        if self.show_lines:
+            columns.append((" %05d/%04d |",
+                            attrgetter('input_line', 'output_line')))
+        if self.show_timestamp:
+            columns.append(("%s|", get_timestamp))
+        columns.append(("%s|%s|%s| %s%s%s", get_message))
+        row = "".join(column for column, _ in columns)
+        getters = tuple(getter for _, getter in columns)
+
+        def render(msg):
+            """Format a row with the active columns."""
+            fields = ()
+            for getter in getters:
+                fields += getter(msg)
+            return row % fields
+        return render
+
+    def _get_emphasis(self, kind):
+        """Get the Markdown emphasis of a message kind."""
+        kinds = kind.split("|")
+        if 'ERROR' in kinds or 'IMPORTANT' in kinds:
+            emphasis = ("**", "**")
+        elif 'WARNING' in kinds:
+            emphasis = ("*", "*")
+        else:
+            emphasis = ("", "")
+        self._emphasis[kind] = emphasis
+        return emphasis
 
     def write_header(self, state):
         """Write the header."""
@@ -82,34 +145,9 @@ class MarkdownFormatDevice(FormatDevice):
         self.write(header)
         self.write(headln)
 
-    def write_message(self, content, state):
+    def write_message(self, message, state):
         """Write the message."""
-        # Create the standard message
-        if 'inout' not in content:
-            inout = "".ljust(9)
-        elif content['inout'] == 'in':
-            inout = "---> ".center(9)
-        else:
-            inout = " <---".center(9)
-        description = content['description']
-        kinds = content.get('kind').split("|") if 'kind' in content else [""]
-        if 'ERROR' in kinds or 'IMPORTANT' in kinds:
-            description = "**" + description + "**"
-        elif 'WARNING' in kinds:
-            description = "*" + description + "*"
-        remote = content.get('remote', '').center(24)
-        entity = content.get('entity', '').center(16)
-        msg = "%s|%s|%s| %s" % (remote, inout, entity, description)
-
-        # Add the optional columns
-        if self.show_timestamp:
-            timestamp = content.get('timestamp', '').center(28)
-            msg = timestamp + "|" + msg
-        if self.show_lines:
-            msg = " %05d/%04d |%s" % (content['input_line'],
-                                      content['output_line'], msg)
-
-        self.write(msg)
+        self.write(self._render(message))
 
     def write_warnings(self, state):
         """Write the warning messages."""
@@ -135,13 +173,28 @@ class MarkdownFormatDevice(FormatDevice):
         self.write_countset(state['config'], 'Config')
 
     def write_countset(self, items, title):
-        """Write a generic log message list."""
+        """Write a generic log message list.
+
+        The approximated counts of the bounded lists are written as the
+        range of the real count.
+        """
         self.write("----------------------")
         self.write("## %s:" % title)
-        for i, msg, count in items.elements():
-            self.write("%2d. %dx %s" % (i, count, msg))
+        self.write_countset_items(items)
+        if items.templates is not None:
+            self.write("### %s by template:" % title)
+            self.write_countset_items(items.templates)
         self.write()
 
+    def write_countset_items(self, items):
+        """Write the messages of a generic log message list."""
+        for i, msg, count in items.elements():
+            error = items.get_error(msg)
+            if error:
+                self.write("%2d. %d-%dx %s" % (i, count - error, count, msg))
+            else:
+                self.write("%2d. %dx %s" % (i, count, msg))
+
     def write_locators(self, state):
         """Write the locators if any."""
         self.write("### Locators:")
@@ -201,33 +254,45 @@ class MarkdownFormatDevice(FormatDevice):
         self.write("### Bandwidth statistics:")
 
         stats = state['statistics']
-        for addr in stats:
+        tree = stats.get_tree()
+        for addr in tree:
             self.write("* Address: %s" % addr)
-            for typ in stats[addr]:
+            for typ in tree[addr]:
                 # If this is a port with dictionary of statistics types
-                if isinstance(stats[addr][typ], dict):
+                if isinstance(tree[addr][typ], dict):
                     if state['verbosity'] < 1:
                         continue
                     port = typ
                     self.write("    * Port %s" % port)
-                    for typ in stats[addr][port]:
-                        info = stats[addr][port][typ]
+                    for typ in tree[addr][port]:
+                        info = stats.get_info(tree[addr][port][typ])
                         self.write_throughput("        * %s: " % typ, info)
                 # If this is the host counter
                 else:
-                    info = stats[addr][typ]
+                    info = stats.get_info(tree[addr][typ])
                     self.write_throughput("    * %s: " % typ, info)
         self.write()
 
     def write_throughput(self, prefix, info):
-        """Write the throughput information."""
-        time_diff = info[1] - info[0]
-        qty = self.bytes_to_string(info[2])
-        if time_diff > 0:
-            throughput = self.bytes_to_string(info[2] / time_diff)
-            self.write("%s%s (%s/s)" % (prefix, qty, throughput))
+        """Write the throughput information.
+
+        It writes the average throughput if the packets are in different
+        times, and the peak and percentiles per second if there are.
+        """
+        qty = self.bytes_to_string(info['bytes'])
+        if 'throughput' in info:
+            rates = [("", info['throughput'])]
+            if 'peak' in info:
+                rates.append(("peak ", info['peak']))
+                rates += [("p%d " % p, info['percentiles'][p])
+                          for p in sorted(info['percentiles'])]
+            self.write("%s%s in %d packets (%s)" % (
+                prefix, qty, info['packets'], ", ".join(
+                    "%s%s/s" % (label, self.bytes_to_string(rate))
+                    for label, rate in rates)))
         else:
-            self.write("%s%s" % (prefix, qty))
+            self.write("%s%s in %d packets" % (
+                prefix, qty, info['packets']))
 
     def write_statistics_packets(self, state):
         """Write the packet statistics."""
@@ -17,12 +17,38 @@
 
 The module contains the output devices to write the logs.
 
+The console and file devices collect the logs into a buffer and write it at
+once depending on the output policy of the state:
+  + low-latency: write every log into the stream as soon as it's parsed,
+    for live logs.
+  + throughput: write the buffer when it has about BUFFER_SIZE characters,
+    for log files.
+
+The streams are flushed after FLUSH_TIME seconds. The parser checks the
+flush time between the blocks of input lines too, so the logs are written
+even if there aren't new logs for a while.
+
 Classes:
   + OutputDevice: Abstract base class for output device implementations
+  + OutputBufferDevice: Abstract base class for buffered output devices.
   + ConsoleDevice: Console device. Writes output into the standard output.
   + FileDevice: File device. Writes the output into a file.
+  + ThreadDevice: Thread device. Writes the output from a thread.
+
+Constants:
+  + OUTPUT_POLICIES: Names of the output policies.
 """
 from __future__ import print_function
+import sys
+from threading import Thread
+from time import time
+
+try:
+    from queue import Empty, Queue
+except ImportError:  # Python 2.7
+    from Queue import Empty, Queue
+
+OUTPUT_POLICIES = ("low-latency", "throughput")
 
 
 class OutputDevice(object):
@@ -31,73 +57,223 @@ class OutputDevice(object):
     You will need to implement the following methods:
         + write: Write the log into the device.
         + close: Close the device.
+
+    You can implement the following methods to buffer the logs:
+        + flush: Write the buffered logs into the device.
+        + check_flush: Write the buffered logs if it's time to do it.
     """
 
     def write(self, text=""):
         """Write the log into the device."""
         raise NotImplementedError("write not implemented")
 
+    def flush(self):
+        """Write the buffered logs into the device."""
+        pass
+
+    def check_flush(self):
+        """Write the buffered logs if it's time to do it."""
+        pass
+
     def close(self):
         """Close the device."""
         raise NotImplementedError("close not implemented")
 
 
-class OutputConsoleDevice(OutputDevice):
+class OutputBufferDevice(OutputDevice):
+    """Abstract base class for buffered output devices.
+
+    You will need to implement the following methods:
+        + _write_text: Write the text of the buffer into the device.
+        + close: Flush the buffer and close the device.
+
+    You can implement the following methods:
+        + _flush_stream: Flush the stream of the device.
+
+    Functions:
+      + __init__: Initialize the buffer with the output policy.
+      + write: Count the log and add it to the buffer.
+      + append: Add the log to the buffer and write it if needed.
+      + flush: Write the buffer and flush the device.
+      + check_flush: Flush the device after FLUSH_TIME seconds.
+    """
+
+    # Number of characters of the buffer before writing it.
+    BUFFER_SIZE = 1024 * 1024
+
+    # Maximum seconds between the writes of the buffer.
+    FLUSH_TIME = 1.0
+
+    def __init__(self, state):
+        """Initialize the buffer with the output policy."""
+        self.state = state
+        self.buffer = []
+        self.buffer_size = 0
+        self.flush_size = self.BUFFER_SIZE
+        if state.get('output_policy') == "low-latency":
+            self.flush_size = 0
+        self.flush_clock = time()
+
+    def write(self, text=""):
+        """Count the log and add it to the buffer."""
+        self.state['output_line'] += 1
+        self.append(text)
+
+    def append(self, text=""):
+        """Add the log to the buffer and write it if needed."""
+        self.buffer.append(text)
+        self.buffer_size += len(text) + 1
+        if self.buffer_size > self.flush_size:
+            self._write_buffer()
+        self.check_flush()
+
+    def flush(self):
+        """Write the buffer and flush the device."""
+        self.flush_clock = time()
+        self._write_buffer()
+        self._flush_stream()
+
+    def check_flush(self):
+        """Flush the device after FLUSH_TIME seconds."""
+        if time() - self.flush_clock > self.FLUSH_TIME:
+            self.flush()
+
+    def _write_buffer(self):
+        """Write the buffer into the device."""
+        if not self.buffer:
+            return
+        text = "\n".join(self.buffer) + "\n"
+        self.buffer = []
+        self.buffer_size = 0
+        self._write_text(text)
+
+    def _write_text(self, text):
+        """Write the text of the buffer into the device."""
+        raise NotImplementedError("_write_text not implemented")
+
+    def _flush_stream(self):
+        """Flush the stream of the device."""
+        pass
+
+
+class OutputConsoleDevice(OutputBufferDevice):
     """Console device. Writes output into the standard output.
 
     Functions:
       + __init__: Initialize the device with the specified file path.
-      + write: Write the log into the standard output.
-      + close: Do nothing, no need to close device.
+      + close: Write the buffer, no need to close device.
+      + _write_text: Write the text into the standard output.
+      + _flush_stream: Flush the standard output.
     """
 
     def __init__(self, state):
         """Initialize the device."""
+        super(OutputConsoleDevice, self).__init__(state)
         self.support_ansi = state['show_progress']
-        self.state = state
 
-    def write(self, text=""):
-        """Write the log into the standard output."""
-        self.state['output_line'] += 1
+    def _write_text(self, text):
+        """Write the text into the standard output."""
         # 33[k is an ANSI code to clear the line
-        # We need it to clear the optional progress bar.
+        # We need it to clear the optional progress bar. The text is written
+        # at once so the progress bar from another thread can't split it.
         if self.support_ansi:
-            print("\033[K" + text)
-        else:
-            # Catch any potential exception when piping the output and
-            # terminating the program.
-            try:
-                print(text)
-            except IOError:
-                # It makes no sense to print the error since we already had
-                # an exception printing a message.
-                pass
+            text = "\033[K" + text
+
+        # Catch any potential exception when piping the output and
+        # terminating the program.
+        try:
+            sys.stdout.write(text)
+        except IOError:
+            # It makes no sense to print the error since we already had
+            # an exception printing a message.
+            pass
+
+    def _flush_stream(self):
+        """Flush the standard output."""
+        try:
+            sys.stdout.flush()
+        except IOError:
+            pass
 
     def close(self):
-        """Do nothing, no need to close device."""
-        pass
+        """Write the buffer, no need to close device."""
+        self.flush()
 
 
-class OutputFileDevice(OutputDevice):
+class OutputFileDevice(OutputBufferDevice):
     """File device. Writes the output into a file.
 
     Functions:
       + __init__: Initialize the device with the specified file path.
-      + write: Write the log into a file stream.
-      + close: Close the file stream.
+      + close: Write the buffer and close the file stream.
+      + _write_text: Write the text into the file stream.
+      + _flush_stream: Flush the file stream.
     """
 
     def __init__(self, state, file_path, overwrite):
         """Initialize the device with the specified file path."""
+        super(OutputFileDevice, self).__init__(state)
         open_mode = "w" if overwrite else "a"
         self.stream = open(file_path, open_mode)
+
+    def _write_text(self, text):
+        """Write the text into the file stream."""
+        self.stream.write(text)
+
+    def _flush_stream(self):
+        """Flush the file stream."""
+        self.stream.flush()
+
+    def close(self):
+        """Write the buffer and close the file stream."""
+        self.flush()
+        self.stream.close()
+
+
+class OutputThreadDevice(OutputDevice):
+    """Thread device. Writes the output into another device from a thread.
+
+    The logs are counted when queued and the thread adds them to the buffer
+    of the device, so the device must be an OutputBufferDevice. The logs are
+    queued in a bounded queue, so slow writes don't block the parsing until
+    the queue is full. When there aren't new logs for the flush time of the
+    device, the thread flushes it.
+
+    Functions:
+      + __init__: Start the thread writing into the device.
+      + write: Queue the log to write it into the device.
+      + close: Write the queued logs and close the device.
+      + _write_lines: Write the queued logs into the device.
+    """
+
+    def __init__(self, state, device, max_size):
+        """Start the thread writing into the device."""
         self.state = state
+        self.device = device
+        self.queue = Queue(max_size)
+        self.thread = Thread(target=self._write_lines)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def _write_lines(self):
+        """Write the queued logs into the device."""
+        while True:
+            try:
+                text = self.queue.get(timeout=self.device.FLUSH_TIME)
+            except Empty:
+                self.device.flush()
+                continue
+            if text is None:
+                break
+            self.device.append(text)
 
     def write(self, text=""):
-        """Write the log into a file stream."""
+        """Queue the log to write it into the device."""
         self.state['output_line'] += 1
-        self.stream.write(text + "\n")
+        self.queue.put(text)
 
     def close(self):
-        """Close the file stream."""
-        self.stream.close()
+        """Write the queued logs and close the device."""
+        self.queue.put(None)
+        self.thread.join()
+        self.device.close()
@@ -0,0 +1,291 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Format device to export the output into a SQLite database.
+
+The messages are inserted in batches and every batch is a transaction. The
+indexes are created at the end since it's faster than updating them on every
+insert. A new database doesn't wait for the disk, so it's faster but it may
+be corrupted by a crash. If the database exists, the rows of a new run are
+added with a write-ahead log, so a crash doesn't corrupt the previous runs.
+Every table has a run_id column with the ID of the run of its rows. The
+database has the following tables:
+  + runs: the ID, the parser version, the input file and the start time of
+    every run.
+  + info: the number of threads.
+  + messages: the log messages, indexed by timestamp, remote and entity.
+  + config, warnings and errors: the list of messages with their count.
+  + templates: the count of those messages by template (--summary-size).
+  + locators: the send and receive locators of every participant.
+  + names: the names assigned to the hosts, apps and participants.
+  + bandwidth: the bandwidth statistics of every address and port.
+  + packets: the packet statistics of every GUID.
+  + threads: the threads information.
+
+Classes:
+  + SqliteFormatDevice: Format device for SQLite databases.
+"""
+from __future__ import absolute_import
+import sqlite3
+from os import remove
+from os.path import exists
+from time import gmtime, strftime
+
+from logparser.__init__ import __version__
+from logparser.devices.formatdevice import FormatDevice
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY, version TEXT, input TEXT, start TEXT);
+CREATE TABLE IF NOT EXISTS info (run_id INTEGER, name TEXT, value TEXT);
+CREATE TABLE IF NOT EXISTS messages (
+    id INTEGER PRIMARY KEY, run_id INTEGER, input_line INTEGER,
+    output_line INTEGER, timestamp TEXT, kind TEXT, inout TEXT, remote TEXT,
+    entity TEXT, description TEXT);
+CREATE TABLE IF NOT EXISTS config (
+    run_id INTEGER, id INTEGER, message TEXT, count INTEGER, error INTEGER);
+CREATE TABLE IF NOT EXISTS warnings (
+    run_id INTEGER, id INTEGER, message TEXT, count INTEGER, error INTEGER);
+CREATE TABLE IF NOT EXISTS errors (
+    run_id INTEGER, id INTEGER, message TEXT, count INTEGER, error INTEGER);
+CREATE TABLE IF NOT EXISTS templates (
+    run_id INTEGER, list TEXT, id INTEGER, template TEXT, count INTEGER,
+    error INTEGER);
+CREATE TABLE IF NOT EXISTS locators (
+    run_id INTEGER, participant TEXT, direction TEXT, locator TEXT);
+CREATE TABLE IF NOT EXISTS names (
+    run_id INTEGER, guid TEXT, kind TEXT, name TEXT, host TEXT, app TEXT,
+    participant TEXT);
+CREATE TABLE IF NOT EXISTS bandwidth (
+    run_id INTEGER, address TEXT, port TEXT, type TEXT, bytes INTEGER,
+    packets INTEGER, seconds REAL, peak REAL, p50 REAL, p90 REAL, p99 REAL);
+CREATE TABLE IF NOT EXISTS packets (
+    run_id INTEGER, guid TEXT, type TEXT, packet TEXT, count INTEGER);
+CREATE TABLE IF NOT EXISTS threads (
+    run_id INTEGER, name TEXT, kind TEXT, priority INTEGER,
+    stack_size INTEGER, tid INTEGER, affinity TEXT);
+"""
+
+_INDEXES = """
+CREATE INDEX IF NOT EXISTS messages_timestamp ON messages (run_id, timestamp);
+CREATE INDEX IF NOT EXISTS messages_remote ON messages (run_id, remote);
+CREATE INDEX IF NOT EXISTS messages_entity ON messages (run_id, entity);
+"""
+
+
+class SqliteFormatDevice(FormatDevice):
+    """Format device for SQLite databases.
+
+    Functions:
+      + __init__: Open the database.
+      + write_header: create the tables and add the run.
+      + write_message: add the message to the next batch.
+      + write_warnings: write the warning messages.
+      + write_errors: write the error messages.
+      + write_configurations: write the configuration messages.
+      + write_countset: write a generic log message list.
+      + write_locators: write the locators.
+      + write_host_summary: write the assigned names.
+      + write_statistics_bandwidth: write the bandwidth statistics.
+      + write_statistics_packets: write the packet statistics.
+      + write_threads_info: write the threads information.
+      + flush: insert the batch of messages.
+      + close: create the indexes and close the database.
+    """
+
+    # Number of messages inserted in every transaction.
+    BATCH_SIZE = 50000
+
+    def __init__(self, state, file_path, overwrite):
+        """Open the database."""
+        self.state = state
+        if overwrite and exists(file_path):
+            remove(file_path)
+        created = not exists(file_path)
+        self.connection = sqlite3.connect(file_path)
+        if created:
+            # A new database only has this run and it can be created again
+            # if there is a crash, so don't wait for the disk.
+            self.connection.execute("PRAGMA synchronous = OFF")
+            self.connection.execute("PRAGMA journal_mode = MEMORY")
+        else:
+            # A crash must not corrupt the rows of the previous runs.
+            self.connection.execute("PRAGMA journal_mode = WAL")
+            self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.messages = []
+        self.run_id = None
+
+    def write_header(self, state):
+        """Create the tables and add the run."""
+        self.connection.executescript(_SCHEMA)
+        with self.connection:
+            self.run_id = self.connection.execute(
+                "INSERT INTO runs (version, input, start) VALUES (?, ?, ?)",
+                (__version__, state['input_file'],
+                 strftime("%Y-%m-%dT%H:%M:%SZ", gmtime()))).lastrowid
+
+    def write_message(self, message, state):
+        """Add the message to the next batch."""
+        # The messages are not written into the output device.
+        state['output_line'] += 1
+        kind = message.kind
+        if kind:
+            kind = "|".join(filter(None, kind.split("|")))
+        timestamp = message.timestamp
+        if timestamp:
+            timestamp = timestamp.strip()
+        self.messages.append((
+            self.run_id, message.input_line, message.output_line, timestamp,
+            kind, message.inout, message.remote, message.entity,
+            message.description))
+        if len(self.messages) >= self.BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """Insert the batch of messages."""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO messages (run_id, input_line, output_line, " +
+                "timestamp, kind, inout, remote, entity, description) " +
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", self.messages)
+        self.messages = []
+
+    def write_warnings(self, state):
+        """Write the warning messages."""
+        self.write_countset(state['warnings'], "warnings")
+
+    def write_errors(self, state):
+        """Write the error messages."""
+        self.write_countset(state['errors'], "errors")
+
+    def write_configurations(self, state):
+        """Write the configuration messages."""
+        self.flush()
+        if 'locators' in state:
+            self.write_locators(state)
+        if 'names' in state and 'name_table' in state:
+            self.write_host_summary(state)
+        if 'statistics' in state and not state['no_stats']:
+            self.write_statistics_bandwidth(state)
+        if 'statistics_packet' in state and not state['no_stats']:
+            self.write_statistics_packets(state)
+        if 'threads' in state and not state['no_stats']:
+            self.write_threads_info(state)
+        self.write_countset(state['config'], "config")
+
+    def write_countset(self, items, table):
+        """Write a generic log message list.
+
+        The error is the maximum overestimation of the count in the bounded
+        lists.
+        """
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO %s VALUES (?, ?, ?, ?, ?)" % table,
+                [(self.run_id, i, msg, count, items.get_error(msg))
+                 for i, msg, count in items.elements()])
+            if items.templates is not None:
+                self.connection.executemany(
+                    "INSERT INTO templates VALUES (?, ?, ?, ?, ?, ?)",
+                    [(self.run_id, table, i, msg, count,
+                      items.templates.get_error(msg))
+                     for i, msg, count in items.templates.elements()])
+
+    def write_locators(self, state):
+        """Write the locators."""
+        rows = []
+        for part in state['locators']:
+            for direction in ("send", "receive"):
+                for loc in state['locators'][part][direction]:
+                    rows.append((self.run_id, part, direction, loc))
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO locators VALUES (?, ?, ?, ?)", rows)
+
+    def write_host_summary(self, state):
+        """Write the assigned names."""
+        table = state['name_table']
+        names = state['names']
+        rows = []
+        for host in table:
+            rows.append((self.run_id, host, "host", names.get(host), host,
+                         None, None))
+            for app in table[host]:
+                addr = host + " " + app
+                rows.append((self.run_id, addr, "app", names.get(addr),
+                             host, app, None))
+                for part in table[host][app]:
+                    guid = addr + " " + part
+                    rows.append((self.run_id, guid, "participant",
+                                 names.get(guid), host, app, part))
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO names VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def write_statistics_bandwidth(self, state):
+        """Write the bandwidth statistics.
+
+        The rows of the host counters have a NULL port. The peak and the
+        percentiles of the throughput are NULL for the ports or if all the
+        packets are in the same time.
+        """
+        stats = state['statistics']
+        rows = []
+        for (addr, port, typ), counter in stats.get_counters():
+            info = stats.get_info(counter)
+            percentiles = info.get('percentiles', {})
+            rows.append((self.run_id, addr,
+                         None if port is None else str(port), typ,
+                         info['bytes'], info['packets'], info['seconds'],
+                         info.get('peak'), percentiles.get(50),
+                         percentiles.get(90), percentiles.get(99)))
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO bandwidth VALUES " +
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def write_statistics_packets(self, state):
+        """Write the packet statistics.
+
+        The packet 'ALL' is the total of every type.
+        """
+        stats = state['statistics_packet']
+        rows = [(self.run_id, guid, typ, packet, count)
+                for guid in stats
+                for typ in stats[guid]
+                for packet, count in stats[guid][typ].items()]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO packets VALUES (?, ?, ?, ?, ?)", rows)
+
+    def write_threads_info(self, state):
+        """Write the threads information."""
+        info = state['threads']
+        num_threads = info['all'] if 'all' in info else len(info)
+        rows = [(self.run_id, thread['name'], thread['kind'],
+                 thread['priority'], thread['stack_size'], thread.get('tid'),
+                 thread.get('affinity'))
+                for name, thread in info.items() if name != 'all']
+        with self.connection:
+            self.connection.execute("INSERT INTO info VALUES (?, ?, ?)",
+                                    (self.run_id, "threads", num_threads))
+            self.connection.executemany(
+                "INSERT INTO threads VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def close(self):
+        """Create the indexes and close the database."""
+        self.flush()
+        self.connection.executescript(_INDEXES)
+        self.connection.close()
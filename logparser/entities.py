@@ -0,0 +1,53 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Registry of the entities.
+
+The module contains the EntityRegistry class.
+"""
+
+
+class EntityRegistry(object):
+    """Registry of the entities with small integer IDs.
+
+    The entities are identified by the hexadecimal fields of their GUID as
+    they are in the logs: host, app, instance and object ID. The fields that
+    the logs don't show are None (e.g.: the prefix of local entities). The
+    last sequence numbers use the IDs as keys, so they don't build the
+    display names of the entities to hash them.
+    """
+
+    def __init__(self):
+        """Constructor of the class."""
+        self.ids = {}
+
+    def get_id(self, host, app, instance, oid):
+        """Get the ID of the entity, registering it the first time.
+
+        Args:
+            host (str): the hexadecimal host ID or None
+            app (str): the hexadecimal app ID or None
+            instance (str): the hexadecimal instance ID or None
+            oid (str): the hexadecimal object ID or None
+
+        Returns:
+            int: the ID of the entity
+        """
+        key = (host, app, instance, oid)
+        entity = self.ids.get(key)
+        if entity is None:
+            entity = len(self.ids)
+            self.ids[key] = entity
+        return entity
@@ -16,7 +16,23 @@
 """Logger.
 
 The module contains the class to log the messages.
+
+The description of the messages can be a template with its arguments. It's
+formatted only if the message is going to be logged, so the discarded
+messages don't format any text. The verbosity level of the message is the
+level keyword argument. The positional level after the description of the
+previous versions is still accepted, but it's deprecated.
 """
+from __future__ import absolute_import
+import re
+import warnings
+
+from logparser.clocks import get_timestamp
+from logparser.message import Message
+
+# Conversion specifiers of the description templates (e.g.: %s or %d) and
+# escaped percent signs.
+_FORMAT_FIELDS = re.compile(r"%%|%[-+ #0-9.]*[a-zA-Z]")
 
 
 class Logger(object):
@@ -33,6 +49,7 @@ class Logger(object):
         formatDevice (:obj:`FormatDevice`): format device to print the logs
         highlight (:obj:`compiled re`): show in bold regex matched logs
         onlyIf (:obj:`compiled re`): show only regex matched logs
+        joinFields (bool): search the regex once in all the fields joined
     """
 
     def __init__(self, state):
@@ -64,6 +81,7 @@ class Logger(object):
         self._formatDevice = self._state['format_device']
         self._highlight = None
         self._onlyIf = None
+        self._joinFields = False
 
     @property
     def verbosity(self):
@@ -173,177 +191,285 @@ class Logger(object):
         """
         self._onlyIf = value
 
-    def _log(self, content, level):
+    @property
+    def joinFields(self):
+        """Search the onlyIf and highlight regex in all the fields joined.
+
+        Returns:
+            bool: True if the regex are searched once in the joined fields
+        """
+        return self._joinFields
+
+    @joinFields.setter
+    def joinFields(self, value):
+        """Search the onlyIf and highlight regex in all the fields joined.
+
+        Args:
+            value (bool): search the regex once in the joined fields
+        """
+        self._joinFields = value
+
+    def _log(self, message, level, args=()):
         """Log the given message.
 
         Args:
-            content (dict): the content argument is a dictionary with at
-                least 'description' item.
-                The optional items are:
-                  + kind: the kind or remark for the message.
-                  + timestamp: the timestamp of the message.
-                  + input_line: the current input line.
-                  + output_line: the current output line.
-                  + inout: [packets-only] 'in' if it's input packet,
-                    'out' otherwise.
-                  + remote: [packets-only] the remote address of
-                    the sender/receiver.
-                  + entity: [packets-only] the local entity sending/receiving.
+            message (:obj:`Message`): the message without the timestamp and
+                the line numbers, with the description formatted with args
             level (int): verbosity level of the log message
+            args (tuple): arguments of the description template
         """
         if self._verbosity < level:
             return
 
+        # The filters search the description, so it's built here.
+        message.description = Logger._format(message.description, args)
+
         # Add the clock if available
-        if 'clocks' in self._state and self._state['clocks'][1]:
-            content['timestamp'] = \
-                " %s " % self._state['clocks'][1].isoformat()
+        if 'clocks' in self._state:
+            message.timestamp = " %s " % get_timestamp(self._state)
         # Add the current line
-        content['input_line'] = self._state['input_line']
+        message.input_line = self._state['input_line']
         # This message count
-        content['output_line'] = self._state['output_line'] + 1
+        message.output_line = self._state['output_line'] + 1
 
         # Apply the filter
-        if self.onlyIf and not Logger._dict_regex_search(content, self.onlyIf):
+        if self.onlyIf and not Logger._message_regex_search(
+                message, self.onlyIf, self._joinFields):
             return
 
         # Highlight the message if match
-        if self.highlight and Logger._dict_regex_search(
-                content, self.highlight):
-            content['kind'] = content.get('kind', "") + "|IMPORTANT"
+        if self.highlight and Logger._message_regex_search(
+                message, self.highlight, self._joinFields):
+            message.kind = (message.kind or "") + "|IMPORTANT"
 
         # Apply color if specified
         if self._showColors:
             color = ""
-            for kind in filter(None, content.get('kind', '').split("|")):
+            for kind in filter(None, (message.kind or "").split("|")):
                 for subkind in self._KIND_TO_COLOR[kind].split("|"):
                     color += self._COLORS[subkind]
             if color:
-                content['description'] = color + content['description'] + \
+                message.description = color + message.description + \
                     self._COLORS['END']
 
         # Write the message
-        self._formatDevice.write_message(content, self._state)
+        self._formatDevice.write_message(message, self._state)
 
-    def recv(self, addr, entity, text, level=0):
+    def recv(self, addr, entity, text, *args, **kwargs):
         """Log a received packet.
 
         Args:
             addr (str): source address of the package
             entity (str): source entity of the package
-            text (str): description
+            text (str): description or template of the description
+            *args: arguments of the description template
             level (int,optional): verbosity level of the log message
         """
+        level, args = Logger._get_level(text, args, kwargs)
         if self._ignorePackets:
             return
-        content = {'description': text, 'remote': addr, 'entity': entity,
-                   'inout': 'in'}
-        self._log(content, level)
+        self._log(Message(text, None, addr, entity, 'in'), level, args)
 
-    def send(self, addr, entity, text, level=0):
+    def send(self, addr, entity, text, *args, **kwargs):
         """Log a sent packet.
 
         Args:
             addr (str): destination address of the package
             entity (str): destination entity of the package
-            text (str): description
+            text (str): description or template of the description
+            *args: arguments of the description template
             level (int,optional): verbosity level of the log message
         """
+        level, args = Logger._get_level(text, args, kwargs)
         if self._ignorePackets:
             return
-        content = {'description': text, 'remote': addr, 'entity': entity,
-                   'inout': 'out'}
-        self._log(content, level)
+        self._log(Message(text, None, addr, entity, 'out'), level, args)
 
-    def process(self, addr, entity, text, level=0):
+    def process(self, addr, entity, text, *args, **kwargs):
         """Log a processed packet.
 
         Args:
             addr (str): source address of the package
             entity (str): source entity of the package
-            text (str): description
+            text (str): description or template of the description
+            *args: arguments of the description template
             level (int,optional): verbosity level of the log message
         """
+        level, args = Logger._get_level(text, args, kwargs)
         if self._ignorePackets:
             return
-        content = {'description': text, 'remote': addr, 'entity': entity}
-        self._log(content, level)
+        self._log(Message(text, None, addr, entity), level, args)
 
-    def cfg(self, text, level=0):
+    def cfg(self, text, *args, **kwargs):
         """Log a configuration message.
 
         Args:
-            text (str): description
+            text (str): description or template of the description
+            *args: arguments of the description template
             level (int,optional): verbosity level of the log message
         """
+        level, args = Logger._get_level(text, args, kwargs)
         if self._verbosity < level:
             return
-        self._state['config'].add(text)
+        Logger._count(self._state['config'], text, args)
 
-    def event(self, text, level=0):
+    def event(self, text, *args, **kwargs):
         """Log an application event.
 
         Args:
-            text (str): description
+            text (str): description or template of the description
+            *args: arguments of the description template
             level (int,optional): verbosity level of the log message
         """
-        content = {'description': text}
-        self._log(content, level)
+        level, args = Logger._get_level(text, args, kwargs)
+        self._log(Message(text), level, args)
 
-    def warning(self, text, level=0):
+    def warning(self, text, *args, **kwargs):
         """Log a warning message.
 
         Args:
-            text (str): description
+            text (str): description or template of the description
+            *args: arguments of the description template
+            level (int,optional): verbosity level of the log message
+        """
+        level, args = Logger._get_level(text, args, kwargs)
+        if self._verbosity < level:
+            return
+
+        text = Logger._count(self._state['warnings'], text, args)
+        if self._inline:
+            self._log(Message("Warning: " + text, 'WARNING'), level)
+
+    def repeated_warning(self, count, summary, text, *args, **kwargs):
+        """Log a warning message that happened several times at once.
+
+        The warning summary counts the summary message several times, but
+        it's logged only once.
+
+        Args:
+            count (int): number of times that the warning happened
+            summary (str): message for the warning summary
+            text (str): description or template of the description
+            *args: arguments of the description template
             level (int,optional): verbosity level of the log message
         """
+        level, args = Logger._get_level(text, args, kwargs)
         if self._verbosity < level:
             return
 
-        self._state['warnings'].add(text)
+        self._state['warnings'].add(summary, count)
         if self._inline:
-            content = {'description': "Warning: " + text, 'kind': 'WARNING'}
-            self._log(content, level)
+            self._log(Message("Warning: " + Logger._format(text, args),
+                              'WARNING'), level)
 
-    def error(self, text, level=0):
+    def error(self, text, *args, **kwargs):
         """Log an error.
 
         Args:
-            text (str): description
+            text (str): description or template of the description
+            *args: arguments of the description template
             level (int,optional): verbosity level of the log message
         """
+        level, args = Logger._get_level(text, args, kwargs)
         if self._verbosity < level:
             return
 
-        self._state['errors'].add(text)
+        text = Logger._count(self._state['errors'], text, args)
         if self._inline:
-            content = {'description': "Error: " + text, 'kind': 'ERROR'}
-            self._log(content, level)
+            self._log(Message("Error: " + text, 'ERROR'), level)
+
+    @staticmethod
+    def _get_level(text, args, kwargs):
+        """Get the verbosity level and the arguments of the template.
+
+        Python 2.7 doesn't support keyword-only arguments after *args, so the
+        level is the only keyword argument that the log methods accept.
+        In the previous versions the level was the positional argument after
+        the description. It's still taken as the level, with a deprecation
+        warning, if the last argument is an integer that doesn't have a
+        conversion specifier in the template.
+
+        Args:
+            text (str): description or template of the description
+            args (tuple): positional arguments after the description
+            kwargs (dict): keyword arguments of the log method
+
+        Returns:
+            tuple: the verbosity level and the arguments of the template
+        """
+        level = kwargs.pop('level', None)
+        if kwargs:
+            raise TypeError("unexpected keyword arguments: %s" %
+                            ", ".join(sorted(kwargs)))
+        if level is not None:
+            return level, args
+        if not args or not isinstance(args[-1], int) or \
+                len(args) <= text.count("%") - 2 * text.count("%%"):
+            return 0, args
+        warnings.warn("the positional level of the log messages is "
+                      "deprecated, pass it as level=%d" % args[-1],
+                      DeprecationWarning, stacklevel=3)
+        return args[-1], args[:-1]
+
+    @staticmethod
+    def _count(countset, text, args):
+        """Count a message in a summary.
+
+        The arguments of a description template are its variable fields,
+        so the template of the message is the description template with
+        its arguments replaced by #.
+
+        Args:
+            countset (:obj:`CountSet`): summary of the messages
+            text (str): description or template of the description
+            args (tuple): arguments of the description template
+
+        Returns:
+            str: the description
+        """
+        template = None
+        if countset.templates is not None and args:
+            template = _FORMAT_FIELDS.sub(Logger._template_field, text)
+        text = Logger._format(text, args)
+        countset.add(text, 1, template)
+        return text
+
+    @staticmethod
+    def _template_field(match):
+        """Replace a conversion specifier of a template by #."""
+        return "%" if match.group() == "%%" else "#"
+
+    @staticmethod
+    def _format(text, args):
+        """Build the description of a message.
+
+        Args:
+            text (str): description or template of the description
+            args (tuple): arguments of the description template
+
+        Returns:
+            str: the description
+        """
+        return text % args if args else text
 
     @staticmethod
-    def _dict_regex_search(content, regex):
-        """Apply the regex over all the fields of the content.
+    def _message_regex_search(message, regex, joined=False):
+        """Apply the regex over all the text fields of the message.
 
         Args:
-            content (dict): the content argument is a dictionary with at
-                least 'description' item.
-                The optional items are:
-                  + kind: the kind or remark for the message.
-                  + timestamp: the timestamp of the message.
-                  + input_line: the current input line.
-                  + output_line: the current output line.
-                  + inout: [packets-only] 'in' if it's input packet,
-                    'out' otherwise.
-                  + remote: [packets-only] the remote address of
-                    the sender/receiver.
-                  + entity: [packets-only] the local entity sending/receiving.
+            message (:obj:`Message`): the message to search
             regex (:obj:`compiled re`): regex to apply
+            joined (bool): apply the regex once over the fields joined by
+                tabs instead of over every field
 
         Returns:
-            bool: True if the regex match with at least one field of content
+            bool: True if the regex match with at least one field of message
         """
-        match = False
-        for field in content:
-            if isinstance(content[field], str):
-                match = match if match else regex.search(content[field])
-        return match
+        fields = [value for name, value in message.items()
+                  if isinstance(value, str)]
+        if joined:
+            return regex.search("\t".join(fields))
+        for field in fields:
+            if regex.search(field):
+                return True
+        return False
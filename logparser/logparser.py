@@ -24,19 +24,30 @@ Classes:
 """
 from __future__ import absolute_import
 import re
-from datetime import datetime, timedelta
 from os import urandom
 from sys import exc_info
 from traceback import extract_tb
 
+from logparser.clocks import (MAX_DISTANCE, get_header, parse_clocks,
+                              parse_header, to_seconds, to_timedelta)
 from logparser.countset import CountSet
-from logparser.devices.inputdevices import InputConsoleDevice, InputFileDevice
+from logparser.devices.inputdevices import (InputConsoleDevice,
+                                            InputFileDevice, InputMmapDevice,
+                                            InputThreadDevice)
+from logparser.devices.jsonformatdevice import JsonFormatDevice
 from logparser.devices.markdownformatdevice import MarkdownFormatDevice
 from logparser.devices.outputdevices import (OutputConsoleDevice,
-                                             OutputFileDevice)
+                                             OutputFileDevice,
+                                             OutputThreadDevice)
+from logparser.devices.sqliteformatdevice import SqliteFormatDevice
 from logparser.logger import Logger
-from logparser.logs.logs import create_regex_list
-from logparser.utils import compare_times
+from logparser.logs.logs import (create_regex_list, load_regex_profile,
+                                  save_regex_profile, sort_regex_list)
+from logparser.logs.matchers import create_matcher
+from logparser.parallel import ERROR, ChunkParser
+from logparser.progress import ProgressReporter
+from logparser.utils import (compare_times, create_obfuscation_hash,
+                             load_obfuscation_map, save_obfuscation_map)
 
 
 class LogParser(object):
@@ -48,11 +59,20 @@ class LogParser(object):
       + _check_time_distance_: check that the distance between logs.
       + _get_urandom: get a cryptographic random value.
       + _initialize_state: initialize the state dictionary.
+      + _initialize_obfuscation: initialize the salt, hash and map.
       + _parse_log: parse a log file.
+      + _flush_outputs: write the buffered logs between the blocks of lines.
+      + _parse_chunks: parse a log file matched in parallel.
       + _match_line: try to match a log line with the regular expressions.
       + _match_data: try to match the log date.
+      + _set_clocks: set the clocks of the current log.
+      + _sort_expressions: sort the expressions by number of hits.
+      + _update_hits: add the hits of the matcher to the regex profile.
     """
 
+    # Number of input lines between the sorts of the adaptive mode.
+    SORT_PERIOD = 100000
+
     def __init__(self, args):
         """Initialize the rtilogparser."""
         self.state = {}
@@ -60,23 +80,32 @@ class LogParser(object):
         self.formatter = self.state['format_device']
         self._logger = Logger(self.state)
         self._initialize_logger(args)
+        self.engine = args.engine
+        self.profile = args.profile
+        self.adaptive = args.adaptive
+        self.jobs = args.jobs
+        self.chunk_parser = None
+        self._lines = iter([])
+        self.hits = load_regex_profile(args.profile) if args.profile else {}
         self.expressions = create_regex_list(self.state)
+        self.matcher = None
+        self._sort_expressions()
         self.originalOutput = None
+        self._clocks_header = None
 
     def _check_time_distance(self, new_clocks, old_clocks):
         """Check that the distance between logs it's not large."""
-        MAX_TIME_SEC = 60
-        result = compare_times(old_clocks[1], new_clocks[1],
-                               timedelta(seconds=MAX_TIME_SEC))
+        result = compare_times(old_clocks[1], new_clocks[1], MAX_DISTANCE)
         if result:
-            self._logger.warning("System clock went %s by %s." %
-                                 (result[0], result[1]))
+            self._logger.warning("System clock went %s by %s.", result[0],
+                                 to_timedelta(result[1]))
 
-        if new_clocks[0]:
-            result = compare_times(old_clocks[0], new_clocks[0], MAX_TIME_SEC)
+        if new_clocks[0] and old_clocks[0]:
+            result = compare_times(old_clocks[0], new_clocks[0],
+                                   MAX_DISTANCE)
             if result:
-                self._logger.warning("Monotonic clock went %s by %.3f." %
-                                     (result[0], result[1]))
+                self._logger.warning("Monotonic clock went %s by %.3f.",
+                                     result[0], to_seconds(result[1]))
 
     @staticmethod
     def _get_urandom():
@@ -90,23 +119,35 @@ class LogParser(object):
 
     def _initialize_state(self, args):
         """Initialize the state dictionary."""
-        self.state['warnings'] = CountSet()
-        self.state['errors'] = CountSet()
-        self.state['config'] = CountSet()
+        self.state['warnings'] = CountSet(args.summary_size)
+        self.state['errors'] = CountSet(args.summary_size)
+        self.state['config'] = CountSet(args.summary_size)
         self.state['no_timestamp'] = not args.show_timestamp
         self.state['obfuscate'] = args.obfuscate
-        self.state['salt'] = args.salt or LogParser._get_urandom()
+        self._initialize_obfuscation(args)
         self.state['assign_names'] = not args.show_ip
         self.state['no_stats'] = args.no_stats
+        self.state['no_network'] = args.no_network
         self.state['show_progress'] = not args.no_progress
         self.state['show_lines'] = args.show_lines
         self.state['write_original'] = args.write_original
         self.state['output_line'] = 0
         self.state['input_line'] = 0
+        self.state['matched_lines'] = 0
         self.state['debug'] = args.debug
+        # Regex that the input lines must match to parse them.
+        self.state['prefilters'] = [re.compile(regex) for regex in (
+            args.only_raw, args.only if args.only_prefilter else None)
+            if regex]
         if args.local_host:
             self.state['local_address'] = tuple(args.local_host.split(","))
-        if args.output:
+        # By default write the live logs from stdin as soon as possible.
+        self.state['output_policy'] = args.output_policy or \
+            ("throughput" if args.input else "low-latency")
+        if args.format == "sqlite":
+            # The output file is the database.
+            self.state['output_device'] = OutputConsoleDevice(self.state)
+        elif args.output:
             self.state['output_device'] = \
                 OutputFileDevice(self.state, args.output, False)
         elif args.overwrite_output:
@@ -114,13 +155,52 @@ class LogParser(object):
                 OutputFileDevice(self.state, args.overwrite_output, True)
         else:
             self.state['output_device'] = OutputConsoleDevice(self.state)
-        if args.input:
+        self.state['input_file'] = args.input
+        if args.input and args.mmap:
+            self.state['input_device'] = \
+                InputMmapDevice(args.input, self.state)
+        elif args.input:
             self.state['input_device'] = \
                 InputFileDevice(args.input, self.state)
         else:
             self.state['input_device'] = InputConsoleDevice(self.state)
+
+        # Read, parse and write the logs from stdin in different threads.
+        if args.pipeline and not args.input:
+            self.state['input_device'] = InputThreadDevice(
+                self.state['input_device'], args.pipeline, self.state)
+            self.state['output_device'] = OutputThreadDevice(
+                self.state, self.state['output_device'], args.pipeline)
+
         self.state['verbosity'] = args.v or 0
-        self.state['format_device'] = MarkdownFormatDevice(self.state)
+        if args.format == "jsonl":
+            self.state['format_device'] = JsonFormatDevice(self.state)
+        elif args.format == "sqlite":
+            self.state['format_device'] = SqliteFormatDevice(
+                self.state, args.output or args.overwrite_output,
+                not args.output)
+        else:
+            self.state['format_device'] = MarkdownFormatDevice(self.state)
+
+    def _initialize_obfuscation(self, args):
+        """Initialize the salt, the hash and the map to obfuscate.
+
+        The map from the file is used only if it has the same salt and hash.
+        Without a salt argument it uses the salt from the file.
+        """
+        self.obfuscation_map = args.obfuscation_map
+        saved = load_obfuscation_map(args.obfuscation_map) \
+            if args.obfuscation_map else {}
+        self.state['salt'] = args.salt or saved.get('salt') or \
+            LogParser._get_urandom()
+        self.state['obfuscation_hash_name'] = args.obfuscation_hash
+        self.state['obfuscation_hash'] = create_obfuscation_hash(
+            args.obfuscation_hash, self.state['salt'])
+        if saved.get('salt') == self.state['salt'] and \
+                saved.get('hash') == args.obfuscation_hash:
+            self.state['obfuscation_map'] = saved.get('mapping', {})
+        else:
+            self.state['obfuscation_map'] = {}
 
     def _initialize_logger(self, args):
         self._logger.verbosity = args.v or 0
@@ -131,6 +211,7 @@ class LogParser(object):
             self._logger.highlight = re.compile(args.highlight)
         if args.only:
             self._logger.onlyIf = re.compile(args.only)
+        self._logger.joinFields = args.only_joined
 
     def process(self):
         """Process all the logs."""
@@ -141,6 +222,12 @@ class LogParser(object):
                 self.state['write_original'],
                 True)
 
+        # Show the progress from another thread
+        progress = None
+        if self.state['show_progress']:
+            progress = ProgressReporter(self.state)
+            progress.start()
+
         # Read log file and parse
         self.formatter.write_header(self.state)
         try:
@@ -159,92 +246,200 @@ class LogParser(object):
                 # log parsing but show the final summary
                 self._logger.warning("Catched SIGINT")
 
+        if progress:
+            progress.stop()
+
+        if self.chunk_parser:
+            self.chunk_parser.close()
+
         if self.originalOutput:
             self.originalOutput.close()
 
+        if self.profile:
+            self._update_hits()
+            save_regex_profile(self.profile, self.hits)
+
+        if self.obfuscation_map:
+            save_obfuscation_map(self.obfuscation_map, self.state)
+
     def _parse_log(self):
         """Parse a log."""
         device = self.state['input_device']
+        if self.jobs != 1 and isinstance(device, InputFileDevice):
+            self._parse_chunks()
+            return
 
-        # While there is a new line, parse it.
-        line = ""
-        while line is not None:
-            # If the line contains non-UTF8 chars it could raise an exception.
-            self.state['input_line'] += 1
-            line = device.read_line()
-
-            # Remove end of lines
-            if line:
-                line = line.rstrip("\r\n")
+        # While there is a new block of lines, parse them. The lines of the
+        # current block are kept to continue after a SIGINT.
+        while True:
+            for line in self._lines:
+                self.state['input_line'] += 1
+
+                # Skip if empty line
+                if not line:
+                    continue
+
+                if self.adaptive and \
+                        self.state['input_line'] % self.SORT_PERIOD == 0:
+                    self._sort_expressions()
+
+                # Write original log if needed
+                if self.state['write_original']:
+                    self.originalOutput.write(line)
+
+                # We can get exceptions if the file contains output from two
+                # different applications since the logs are messed up.
+                try:
+                    self._match_line(line)
+                except Exception as ex:  # pylint: disable=W0703
+                    exc_traceback = exc_info()[2]
+                    stacktraces = extract_tb(exc_traceback)
+                    self._logger.error("[ScriptError] %s %s - log line %d",
+                                       str(stacktraces[-1]), ex,
+                                       self.state['input_line'])
+
+            self._flush_outputs(device)
+            lines = device.read_lines()
+            if not lines:
+                # The last read of EOF
+                self.state['input_line'] += 1
+                break
 
             # Remove strange character
-            if line:
-                line = line.replace("\x00", " ")
+            block = "\n".join(lines)
+            if "\x00" in block:
+                lines = block.replace("\x00", " ").split("\n")
+            self._lines = iter(lines)
+
+    def _flush_outputs(self, device):
+        """Write the buffered logs between the blocks of input lines.
+
+        The console may wait for new lines, so the logs are written before
+        reading it. Otherwise, they are written after the flush time.
+        """
+        output = self.state['output_device']
+        if isinstance(device, InputConsoleDevice):
+            output.flush()
+        else:
+            output.check_flush()
+        if self.originalOutput:
+            self.originalOutput.check_flush()
+
+    def _parse_chunks(self):
+        """Parse a log file matched in parallel.
+
+        The lines are matched by a pool of processes and the functions of
+        the expressions run here in the original order of the lines. The
+        expressions are not sorted in adaptive mode.
+        """
+        if not self.chunk_parser:
+            self.chunk_parser = ChunkParser(
+                self.state['input_device'], self.state['input_file'],
+                self.expressions, self.engine, self.jobs,
+                bool(self.state['write_original']), self.state['prefilters'])
 
-            # Skip if EOF or empty line
-            if not line:
-                continue
+        for record in self.chunk_parser:
+            number, line, clocks, index, groups = record
+            self.state['input_line'] = self.chunk_parser.lines + number
 
             # Write original log if needed
-            if self.state['write_original']:
+            if self.state['write_original'] and line is not None:
                 self.originalOutput.write(line)
 
-            # We can get exceptions if the file contains output from two
-            # different applications since the logs are messed up.
             try:
-                self._match_line(line)
+                if clocks:
+                    # Check the distance from the previous clocks.
+                    self._clocks_header = None
+                    if clocks[0]:
+                        self.state['clocks'] = clocks[0]
+                    self._set_clocks(clocks[1])
+                if index == ERROR:
+                    # Parse it again to get the same error.
+                    self._clocks_header = None
+                    self._match_line(line)
+                elif index is not None:
+                    self.state['matched_lines'] += 1
+                    self.matcher.hits[index] += 1
+                    self.expressions[index][0](
+                        groups, self.state, self._logger)
             except Exception as ex:  # pylint: disable=W0703
                 exc_traceback = exc_info()[2]
                 stacktraces = extract_tb(exc_traceback)
-                self._logger.error(
-                    "[ScriptError] %s %s - log line %d" %
-                    (str(stacktraces[-1]), ex, self.state['input_line']))
+                self._logger.error("[ScriptError] %s %s - log line %d",
+                                   str(stacktraces[-1]), ex,
+                                   self.state['input_line'])
+
+        # The last read of EOF
+        self.state['input_line'] = self.chunk_parser.lines + 1
 
     def _match_line(self, line):
-        """Try to match a log line with the regular expressions."""
+        """Try to match a log line with the regular expressions.
+
+        The clocks are always parsed, but the lines that don't match the
+        prefilters are not matched.
+        """
         self._match_date(line)
-        for expr in self.expressions:
-            match = expr[1].search(line)
-            if match:
-                expr[0](match.groups(), self.state, self._logger)
-                break
+        for regex in self.state['prefilters']:
+            if not regex.search(line):
+                return
+        match = self.matcher.match(line)
+        if match:
+            self.state['matched_lines'] += 1
+            match[0](match[1], self.state, self._logger)
 
     def _match_date(self, line):
         """Try to match the log date."""
-        DATE_REGEX = re.compile(r'\[(\d{2}/\d{2}/\d{4} ' +
-                                r'\d{2}:\d{2}:\d{2}.\d{6})\]' +
-                                r'\[(\d{10}\.\d{6})\]')
-        SINGLE_DATE_REGEX = re.compile(r'\[(\d{10})\.(\d{6})\]')
-
-        # Try to match the two clock format.
-        clocks = DATE_REGEX.search(line)
-        two_clocks = clocks is not None
+        # Consecutive logs usually have the same clocks.
+        header = get_header(line)
+        if header is not None and header == self._clocks_header:
+            return
 
-        # If it doesn't match, try with the single clock format.
-        if not clocks:
-            clocks = SINGLE_DATE_REGEX.search(line)
+        new_clocks = parse_header(header) if header else None
+        if not new_clocks:
+            header = None
+            new_clocks = parse_clocks(line)
 
         # If we don't match the default clock either, nothing to do
-        if not clocks:
+        if not new_clocks:
             return
 
-        # Get clocks
-        if two_clocks:
-            system = datetime.strptime(clocks.group(1), "%m/%d/%Y %H:%M:%S.%f")
-            monotonic = float(clocks.group(2))
-        else:
-            system = datetime.utcfromtimestamp(int(clocks.group(1)))
-            system += timedelta(microseconds=int(clocks.group(2)))
-            monotonic = None
+        self._clocks_header = header
+        self._set_clocks(new_clocks)
 
-        new_clocks = (monotonic, system)
+    def _set_clocks(self, new_clocks):
+        """Set the clocks of the current log."""
         if 'clocks' in self.state:
             self._check_time_distance(new_clocks, self.state['clocks'])
 
         self.state['clocks'] = new_clocks
 
+    def _sort_expressions(self):
+        """Sort the expressions by number of hits and create the matcher.
+
+        The expressions keep their original order unless there is a profile
+        or the adaptive mode is enabled.
+        """
+        if self.profile or self.adaptive:
+            self._update_hits()
+            self.expressions = sort_regex_list(self.expressions, self.hits)
+        self.matcher = create_matcher(self.engine, self.expressions)
+
+    def _update_hits(self):
+        """Add the hits of the matcher to the regex profile."""
+        if not self.matcher:
+            return
+        for expr, hits in zip(self.expressions, self.matcher.hits):
+            if hits:
+                pattern = expr[1].pattern
+                self.hits[pattern] = self.hits.get(pattern, 0) + hits
+        self.matcher.hits = [0] * len(self.expressions)
+
     def write_summary(self):
         """Write results of config, errors and warnings."""
         self.formatter.write_configurations(self.state)
         self.formatter.write_warnings(self.state)
         self.formatter.write_errors(self.state)
+        self.formatter.close()
+
+        # Wait for the output device to write all the logs.
+        self.state['output_device'].close()
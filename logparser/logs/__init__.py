@@ -16,4 +16,5 @@
 """Create the global list of regular expressions and functions."""
 
 # pylint: disable=E0603
-__all__ = ("custom", "debug", "events", "network", "routing", "logs")
+__all__ = ("custom", "debug", "events", "network", "routing", "logs",
+           "matchers", "metadata")
@@ -27,4 +27,4 @@ from __future__ import absolute_import
 
 def on_custom_log(match, state, logger):
     """Parse a log with a custom prefix."""
-    logger.event("[App] " + match[0])
+    logger.event("[App] %s", match[0])
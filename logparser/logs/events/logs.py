@@ -21,6 +21,8 @@ Functions:
 from __future__ import absolute_import
 
 import logparser.logs.events.events as events
+from logparser.logs.metadata import (EVENTS, NAMES, NETWORK, STATE, STATS,
+                                     metadata)
 
 
 def get_regex_list():
@@ -30,242 +32,312 @@ def get_regex_list():
     # Network Interfaces
     regex.append([events.on_query_udpv4_interfaces,
                   r"NDDS_Transport_UDPv4_query_interfaces:(?:RTI0x\w+:)?"
-                  r"interface 0X(\w+), flag 0X(\w+)"])
+                  r"interface 0X(\w+), flag 0X(\w+)",
+                  metadata(2, EVENTS, None)])
     regex.append([events.on_find_valid_interface,
                   r"RTIOsapi_getFirstValidInterface:" +
-                  r"found valid interface (\w+)"])
+                  r"found valid interface (\w+)",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_get_valid_interface,
                   r"NDDS_Transport_UDPv4_InterfaceListener_onInterface:" +
                   r"interface ([\d\.]+) \((\w+)\), enabled=(\d), " +
-                  r"multicast=(\d)"])
+                  r"multicast=(\d)",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_initialize_interface,
                   r"NDDS_Transport_UDPv4_initialize_interfaces:interface " +
-                  r"0X(\w+), flag 0X(\w+)"])
+                  r"0X(\w+), flag 0X(\w+)",
+                  metadata(2, EVENTS, None)])
     regex.append([events.on_valid_listening_port,
-                  r"NDDS_Transport_UDPv4_Socket_bindWithIp:bound to 0X(\w+)"])
+                  r"NDDS_Transport_UDPv4_Socket_bindWithIp:bound to 0X(\w+)",
+                  metadata(2, EVENTS, None)])
     regex.append([events.on_invalid_listening_port,
-                  r"NDDS_Transport_UDPv4_Socket_bindWithIp:0X(\w+) in use"])
+                  r"NDDS_Transport_UDPv4_Socket_bindWithIp:0X(\w+) in use",
+                  metadata(2, EVENTS, None)])
     regex.append([events.on_multicast_disabled,
                   r"COMMENDAnonWriterService_setWriterProperty:"
-                  r"!create domain broadcast multicast destination"])
+                  r"!create domain broadcast multicast destination",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_recv_buffer_size_mismatch,
                   r"NDDS_Transport_UDPv4_SocketFactory_create_receive_socket" +
                   r":The specified recv_socket_buffer_size, (\d+), " +
                   r"was not set. The actual receive socket buffer size " +
-                  r"is (\d+)"])
+                  r"is (\d+)",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_msg_size_reduced,
                   r"NDDS_Transport_(UDPv4)_newI: Reducing message_size_max " +
-                  r"from (\d+) to (\d+), for protocol_overhead_max (\d+)"])
+                  r"from (\d+) to (\d+), for protocol_overhead_max (\d+)",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_set_default_initial_peers,
                   r"DDS_DiscoveryQosPolicy_get_default:value of: " +
-                  r"initial_peers=\"(.+)\""])
+                  r"initial_peers=\"(.+)\"",
+                  metadata(2, EVENTS, None)])
 
     # Create or delete entities
     regex.append([events.on_new_thread,
-                  r"RTIOsapiThread_initializeWithStack"])
+                  r"RTIOsapiThread_initializeWithStack",
+                  metadata(None, EVENTS, STATS)])
     regex.append([events.on_new_thread,
-                  r"RTIOsapiThread_new:spawning thread"])
+                  r"RTIOsapiThread_new:spawning thread",
+                  metadata(None, EVENTS, STATS)])
     regex.append([events.on_new_thread_with_config,
                   r"RTIEventActiveDatabase_new:(database) gc thread starting" +
-                  r" up: name=(\w+), priority=([-\d]+), stack=([-\w]+)"])
+                  r" up: name=(\w+), priority=([-\d]+), stack=([-\w]+)",
+                  metadata(None, EVENTS, STATS)])
     regex.append([events.on_new_thread_with_config,
                   r"RTIEventActiveGenerator_new:(event) thread starting up: " +
-                  r"name=(\w+), priority=([-\d]+), stack=([-\w]+)"])
+                  r"name=(\w+), priority=([-\d]+), stack=([-\w]+)",
+                  metadata(None, EVENTS, STATS)])
     regex.append([events.on_new_thread_with_config,
                   r"COMMENDActiveFacade_addReceiverThread:(receive) thread " +
                   r"starting up: name=(\w+), priority=([-\d]+), " +
-                  r"stack=([-\w]+)"])
+                  r"stack=([-\w]+)",
+                  metadata(None, EVENTS, STATS)])
     regex.append([events.on_new_thread_with_config,
                   r"RTIEventJobDispatcher_createThread:(job dispatcher) " +
                   r"thread starting up: name=(\w+), priority=([-\d]+), " +
-                  r"stack=([-\w]+)"])
+                  r"stack=([-\w]+)",
+                  metadata(None, EVENTS, STATS)])
     regex.append([events.on_new_thread_affinity,
                   r"RTIOsapiThread_logCpuAffinity:thread '(\w+)' \((\d+)\) " +
-                  r"affinity: (.+),"])
+                  r"affinity: (.+),",
+                  metadata(None, EVENTS, STATS)])
     regex.append([events.on_create_participant,
                   r"DDS_DomainParticipantPresentation_reserve_participant_" +
                   r"index_entryports:Domain (\d+):" +
-                  r"USING PARTICIPANT INDEX=(\d+)"])
+                  r"USING PARTICIPANT INDEX=(\d+)",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_enable_participant,
-                  r"DDS_DomainParticipant_enableI:enabled"])
+                  r"DDS_DomainParticipant_enableI:enabled",
+                  metadata(1, EVENTS, None)])
     regex.append([events.on_delete_participant,
                   r"DDS_DomainParticipantFactory_delete_participant:deleted " +
-                  r"participant: domain=(\d+), index=(\d+)"])
+                  r"participant: domain=(\d+), index=(\d+)",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_create_topic,
                   r"DDS_DomainParticipant_create_topic_disabledI:" +
                   r"(?:RTI0x\w+:)?created topic: topic=(.+), " +
-                  r"type=(.+)"])
+                  r"type=(.+)",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_create_cft,
                   r"DDS_DomainParticipant_create_contentfilteredtopic_" +
                   r"with_filter:(?:RTI0x\w+:)?created topic: topic=(.+)" +
-                  r", type="])
+                  r", type=",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_create_builtin_topic,
                   r"DDS_DomainParticipant_create_builtin_topic_disabledI:" +
-                  r"created topic: topic=(.+), type=(.+)"])
+                  r"created topic: topic=(.+), type=(.+)",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_delete_topic,
                   r"DDS_DomainParticipant_delete_topic:deleted topic: " +
-                  r"topic=(.+), type=(.+)"])
+                  r"topic=(.+), type=(.+)",
+                  metadata(1, EVENTS, None)])
     regex.append([events.on_enable_topic,
-                  r"DDS_Topic_enable:enabled"])
+                  r"DDS_Topic_enable:enabled",
+                  metadata(1, EVENTS, None)])
     regex.append([events.on_create_publisher,
                   r"DDS_DomainParticipant_create_publisher_disabledI:" +
-                  r"created publisher"])
+                  r"created publisher",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_enable_publisher,
-                  r"DDS_Publisher_enable:enabled"])
+                  r"DDS_Publisher_enable:enabled",
+                  metadata(1, EVENTS, None)])
     regex.append([events.on_create_subscriber,
                   r"DDS_DomainParticipant_create_subscriber_disabledI:" +
-                  r"created subscriber"])
+                  r"created subscriber",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_enable_subscriber,
-                  r"DDS_Subscriber_enable:enabled"])
+                  r"DDS_Subscriber_enable:enabled",
+                  metadata(1, EVENTS, None)])
     regex.append([events.on_create_writer,
                   r"DDS_Publisher_create_datawriter_disabledI:(?:RTI0x\w+:)?" +
-                  r"created writer: topic=(.+)"])
+                  r"created writer: topic=(.+)",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_enable_writer,
-                  r"DDS_DataWriter_enableI:enabled"])
+                  r"DDS_DataWriter_enableI:enabled",
+                  metadata(1, EVENTS, None)])
     regex.append([events.on_create_reader,
                   r"DDS_Subscriber_create_datareader_disabledI:" +
-                  r"(?:RTI0x\w+:)?created reader: topic=(.+)"])
+                  r"(?:RTI0x\w+:)?created reader: topic=(.+)",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_create_builtin_reader,
                   r"DDS_Subscriber_create_builtin_datareader_disabledI:" +
-                  r"created reader: topic=(.+)"])
+                  r"created reader: topic=(.+)",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_enable_reader,
-                  r"DDS_DataReader_enableI:enabled"])
+                  r"DDS_DataReader_enableI:enabled",
+                  metadata(1, EVENTS, None)])
     regex.append([events.on_delete_writer,
                   r"DDS_Publisher_delete_datawriter:(?:RTI0x\w+:)?" +
-                  r"deleted writer: topic=(.+)"])
+                  r"deleted writer: topic=(.+)",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_delete_reader,
                   r"DDS_Subscriber_delete_datareader:(?:RTI0x\w+:)?" +
-                  r"deleted reader: topic=(.+)"])
+                  r"deleted reader: topic=(.+)",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_duplicate_topic_name_error,
                   r"PRESParticipant_createTopic:name '(.+)' " +
-                  r"is not unique"])
+                  r"is not unique",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_delete_topic_before_cft,
                   r"PRESParticipant_destroyOneTopicWithCursor:" +
-                  r"has (\d+) endpoints on topic"])
+                  r"has (\d+) endpoints on topic",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_fail_delete_flowcontrollers,
                   r"PRESParticipant_destroyOneFlowControllerWithCursor:" +
-                  r"has (\d+) writers on flowcontroller"])
+                  r"has (\d+) writers on flowcontroller",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_invalid_transport_discovery,
                   r"DDS_DomainParticipant_enableI:Automatic participant " +
                   r"index failed to initialize\. PLEASE VERIFY CONSISTENT " +
-                  r"TRANSPORT \/ DISCOVERY CONFIGURATION\."])
+                  r"TRANSPORT \/ DISCOVERY CONFIGURATION\.",
+                  metadata(0, EVENTS, None)])
 
     # Discover remote or local entities
     regex.append([events.on_eds_disabled,
                   r"DDS_DomainParticipantDiscovery_initialize:" +
-                  r"builtin discovery plugin PA Client disabled"])
+                  r"builtin discovery plugin PA Client disabled",
+                  metadata(2, EVENTS, None)])
     regex.append([events.on_discover_participant,
                   r"DISCSimpleParticipantDiscoveryPluginReaderListener_" +
                   r"onDataAvailable:(?:RTI0x\w+:)?discovered new " +
                   r"participant: host=0x([0-9A-Z]+), app=0x([0-9A-Z]+), " +
-                  r"instance=0x([0-9A-Z]+)"])
+                  r"instance=0x([0-9A-Z]+)",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([events.on_update_remote_participant,
                   r"DISCParticipantDiscoveryPlugin_assertRemoteParticipant:" +
                   r"(?:RTI0x\w+:)?plugin discovered/updated remote " +
-                  r"participant: 0X(\w+),0X(\w+),0X(\w+),0X(\w+)"])
+                  r"participant: 0X(\w+),0X(\w+),0X(\w+),0X(\w+)",
+                  metadata(1, NETWORK, NAMES)])
     regex.append([events.on_accept_remote_participant,
                   r"DISCPluginManager_activateEdpListenersFor" +
                   r"RemoteParticipant:plugin accepted new remote " +
-                  r"participant: 0X(\w+),0X(\w+),0X(\w+),0X(\w+)"])
+                  r"participant: 0X(\w+),0X(\w+),0X(\w+),0X(\w+)",
+                  metadata(1, NETWORK, NAMES)])
     regex.append([events.on_announce_local_participant,
                   r"DISCPluginManager_onAfterLocalParticipantEnabled:" +
                   r"announcing new local participant: " +
-                  r"0X([0-9A-Z]+),0X([0-9A-Z]+),0X([0-9A-Z]+),0X([0-9A-Z]+)"])
+                  r"0X([0-9A-Z]+),0X([0-9A-Z]+),0X([0-9A-Z]+),0X([0-9A-Z]+)",
+                  metadata(0, EVENTS, STATE)])
     regex.append([events.on_discover_publication,
                   r"DISCSimpleEndpointDiscoveryPlugin_" +
                   r"publicationReaderListenerOnDataAvailable:" +
                   r"(?:RTI0x\w+:)?discovered publication: 0X([0-9A-Z]+)," +
-                  r"0X([0-9A-Z]+),0X([0-9A-Z]+),0X([0-9A-Z]+)"])
+                  r"0X([0-9A-Z]+),0X([0-9A-Z]+),0X([0-9A-Z]+)",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([events.on_discover_subscription,
                   r"DISCSimpleEndpointDiscoveryPlugin_" +
                   r"subscriptionReaderListenerOnDataAvailable:" +
                   r"(?:RTI0x\w+:)?discovered subscription: 0X(\w+),0X(\w+)," +
-                  r"0X(\w+),0X(\w+)"])
+                  r"0X(\w+),0X(\w+)",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([events.on_update_endpoint,
                   r"DISCEndpointDiscoveryPlugin_assertRemoteEndpoint:" +
                   r"(?:RTI0x\w+:)?plugin discovered/updated remote endpoint:" +
-                  r" 0X([0-9A-Z]+),0X([0-9A-Z]+),0X([0-9A-Z]+),0X([0-9A-Z]+)"])
+                  r" 0X([0-9A-Z]+),0X([0-9A-Z]+),0X([0-9A-Z]+),0X([0-9A-Z]+)",
+                  metadata(1, NETWORK, NAMES)])
     regex.append([events.on_announce_local_publication,
                   r"DISCPluginManager_onAfterLocalEndpointEnabled:" +
                   r"(?:RTI0x\w+:)?announcing new local publication: " +
-                  r"0X(\w+),0X(\w+),0X(\w+),0X(\w+)"])
+                  r"0X(\w+),0X(\w+),0X(\w+),0X(\w+)",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([events.on_announce_local_publication_sed,
                   r"DISCSimpleEndpointDiscoveryPluginPDFListener_" +
                   r"onAfterLocalWriterEnabled:announcing new publication: " +
-                  r"0X(\w+),0X(\w+),0X(\w+),0X(\w+)"])
+                  r"0X(\w+),0X(\w+),0X(\w+),0X(\w+)",
+                  metadata(2, NETWORK, NAMES)])
     regex.append([events.on_announce_local_subscription,
                   r"DISCPluginManager_onAfterLocalEndpointEnabled:" +
                   r"(?:RTI0x\w+:)?announcing new local subscription: " +
-                  r"0X(\w+),0X(\w+),0X(\w+),0X(\w+)"])
+                  r"0X(\w+),0X(\w+),0X(\w+),0X(\w+)",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([events.on_announce_local_subscription_sed,
                   r"DISCSimpleEndpointDiscoveryPluginPDFListener_" +
                   r"onAfterLocalReaderEnabled:announcing new subscription: " +
-                  r"0X(\w+),0X(\w+),0X(\w+),0X(\w+)"])
+                  r"0X(\w+),0X(\w+),0X(\w+),0X(\w+)",
+                  metadata(2, NETWORK, NAMES)])
     regex.append([events.on_participant_ignore_itself,
                   r"PRESPsService_destroyLocalEndpointWithCursor:" +
-                  r"!remove remote endpoint"])
+                  r"!remove remote endpoint",
+                  metadata(0, NETWORK, None)])
     regex.append([events.on_lose_discovery_samples,
                   r"DISCSimpleEndpointDiscoveryPlugin_" +
                   r"(subscription|publication)OnSampleLost: (\w+); " +
-                  r"total (\w+), delta (\w+)"])
+                  r"total (\w+), delta (\w+)",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_cannot_reach_multicast,
                   r"COMMEND(Sr|Be)WriterService_assertRemoteReader:" +
                   r"Discovered remote reader using a non-addressable " +
-                  r"multicast locator for a transport with class ID (\d+)\."])
+                  r"multicast locator for a transport with class ID (\d+)\.",
+                  metadata(2, EVENTS, None)])
     regex.append([events.on_ignore_participant,
                   r"DISCParticipantDiscoveryPlugin_assertRemoteParticipant:" +
                   r"remote entity ignored by user: 0X(\w+),0X(\w+),0X(\w+)," +
-                  r"0X(\w+)"])
+                  r"0X(\w+)",
+                  metadata(0, NETWORK, NAMES)])
 
     # Match remote or local entities.
     regex.append([events.on_match_entity("reader", "remote"),
                   r"PRESPsService_linkToRemoteReader:(?:RTI0x\w+:)?" +
                   r"assert remote 0X(\w+),0X(\w+),0X(\w+),0X(\w+), " +
-                  r"local 0x(\w+) in (reliable|best effort) writer service"])
+                  r"local 0x(\w+) in (reliable|best effort) writer service",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([events.on_match_entity("writer", "local"),
                   r"PRESPsService_linkToLocalReader:(?:RTI0x\w+:)?" +
                   r"assert remote 0X(\w+),0X(\w+),0X(\w+),0X(\w+), " +
-                  r"local 0x(\w+) in (reliable|best effort) reader service"])
+                  r"local 0x(\w+) in (reliable|best effort) reader service",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([events.on_match_entity("writer", "remote"),
                   r"PRESPsService_linkToRemoteWriter:(?:RTI0x\w+:)?" +
                   r"assert remote 0X(\w+),0X(\w+),0X(\w+),0X(\w+), " +
-                  r"local 0x(\w+) in (reliable|best effort) reader service"])
+                  r"local 0x(\w+) in (reliable|best effort) reader service",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([events.on_match_entity("reader", "local"),
                   r"PRESPsService_linkToLocalWriter:(?:RTI0x\w+:)?" +
                   r"assert remote 0X(\w+),0X(\w+),0X(\w+),0X(\w+), " +
-                  r"local 0x(\w+) in (reliable|best effort) writer service"])
+                  r"local 0x(\w+) in (reliable|best effort) writer service",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([events.on_different_type_names,
                   r"PRESPsService_matchTopics: type names for topic '(.+)' " +
                   r"do not match \('(.+)', '(.+)'\) and type information " +
-                  r"is not available"])
+                  r"is not available",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_typeobject_received,
                   r"PRESPsService_assertRemoteEndpoint:TypeObject " +
-                  r"(succesfully stored|could not be stored|not received)"])
+                  r"(succesfully stored|could not be stored|not received)",
+                  metadata(2, NETWORK, None)])
     regex.append([events.on_reader_incompatible_durability,
                   r"PRESPsService_isRemoteWriterLocalReaderCompatible:" +
-                  r"incompatible durability: writer (\d+) reader (\d+)"])
+                  r"incompatible durability: writer (\d+) reader (\d+)",
+                  metadata(0, EVENTS, None)])
 
     # Bad usage of the API
     regex.append([events.on_register_unkeyed_instance,
                   r"DDS_DataWriter_register_instance_untypedI:" +
-                  r"registering unkeyed instance"])
+                  r"registering unkeyed instance",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_get_unkeyed_key,
                   r"DDS_Data(Writer|Reader)_get_key_value_untypedI:" +
-                  r"get key for unkeyed type"])
+                  r"get key for unkeyed type",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_unregister_unkeyed_instance,
                   r"DDS_DataWriter_unregister_instance_untyped_generalI:" +
-                  r"unregistering unkeyed instance"])
+                  r"unregistering unkeyed instance",
+                  metadata(0, EVENTS, None)])
 
     # General information
     regex.append([events.on_library_version,
-                  r"(\w+)_VERSION_([\d\.]+)_BUILD_.+_RTI_RELEASE"])
+                  r"(\w+)_VERSION_([\d\.]+)_BUILD_.+_RTI_RELEASE",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_participant_initial_peers,
                   r'DDS_DomainParticipantDiscovery_enableI:value of: ' +
-                  r'initial_peers="(.+)"'])
+                  r'initial_peers="(.+)"',
+                  metadata(0, EVENTS, STATE)])
     regex.append([events.on_envvar_file_not_found,
                   r"RTIOsapi_envVarOrFileGet:(environment variable|file) " +
-                  r"(\w+) not found"])
+                  r"(\w+) not found",
+                  metadata(0, EVENTS, None)])
     regex.append([events.on_envvar_file_found,
                   r"RTIOsapi_envVarOrFileGet:using " +
-                  r"(environment variable|file) (\w+)"])
+                  r"(environment variable|file) (\w+)",
+                  metadata(0, EVENTS, None)])
     return regex
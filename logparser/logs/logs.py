@@ -17,13 +17,22 @@
 
 Functions:
   + add_regex: Compile the regex and add it to the list.
+  + add_regex_list: Add the expressions of a module to the list.
   + create_regex_list: Create the list of regular expressions and functions.
+  + load_regex_profile: Load the number of hits of every regex from a file.
+  + save_regex_profile: Save the number of hits of every regex to a file.
+  + sort_regex_list: Sort the expressions by number of hits.
 """
 from __future__ import absolute_import
+import heapq
+import json
 import re
 from logparser.logs.custom.logs import get_regex_list as custom_regex
 from logparser.logs.debug.logs import get_regex_list as debug_regex
 from logparser.logs.events.logs import get_regex_list as events_regex
+from logparser.logs.debug.debug import on_ignored_message
+from logparser.logs.matchers import get_function_names, get_literals
+from logparser.logs.metadata import has_effects
 from logparser.logs.micro.logs import get_regex_list as micro_regex
 from logparser.logs.micro.micro import init as init_micro
 from logparser.logs.network.logs import get_regex_list as network_regex
@@ -31,23 +40,126 @@ from logparser.logs.routing.logs import get_regex_list as routing_regex
 
 
 def add_regex(log_list, method, regex):
-    """Compile the regex and add it to the list."""
-    log_list.append((method, re.compile(regex)))
+    """Compile the regex and add it to the list.
+
+    The list items contain the function, the compiled regex and the literal
+    substrings that the regex requires.
+    """
+    log_list.append((method, re.compile(regex), get_literals(regex)))
+
+
+def add_regex_list(log_list, regex_list, state):
+    """Add the expressions of a module to the list.
+
+    The functions that don't have any effect with the current options (by
+    their metadata) are replaced by a function that ignores the message. The
+    expression is kept so it still matches the same lines and the next
+    expressions don't match them instead.
+    """
+    for expr in regex_list:
+        method = expr[0]
+        if len(expr) > 2 and not has_effects(expr[2], state):
+            method = on_ignored_message
+        add_regex(log_list, method, expr[1])
 
 
 def create_regex_list(state):
     """Create the list of regular expressions and functions."""
     init_micro(state)
 
-    # pylint: disable=W0106
     expressions = []
-    [add_regex(expressions, expr[0], expr[1]) for expr in micro_regex()]
-    [add_regex(expressions, expr[0], expr[1]) for expr in network_regex()]
-    [add_regex(expressions, expr[0], expr[1]) for expr in events_regex()]
-    [add_regex(expressions, expr[0], expr[1]) for expr in routing_regex()]
-    [add_regex(expressions, expr[0], expr[1]) for expr in custom_regex()]
+    add_regex_list(expressions, micro_regex(), state)
+    add_regex_list(expressions, network_regex(), state)
+    add_regex_list(expressions, events_regex(), state)
+    add_regex_list(expressions, routing_regex(), state)
+    add_regex_list(expressions, custom_regex(), state)
 
     if state['debug']:
-        [add_regex(expressions, expr[0], expr[1]) for expr in debug_regex()]
+        add_regex_list(expressions, debug_regex(), state)
 
     return expressions
+
+
+def _may_overlap(names1, literals1, names2, literals2):
+    """Check if two expressions may match the same line.
+
+    The expressions are searched anywhere in the line and the messages of
+    several threads may be interleaved in the same line, so two expressions
+    for different functions may match the same line. The expressions
+    without a function name may match any line too. It assumes that a
+    function writes one message per line, so the expressions for the same
+    function (or when one function name is the end of the other) overlap
+    only if a required literal of one contains a required literal of the
+    other (e.g.: both on_send_ack expressions require the bitmap text).
+    """
+    if names1 is None or names2 is None:
+        return True
+
+    if not any(name1.endswith(name2) or name2.endswith(name1)
+               for name1 in names1 for name2 in names2):
+        return True
+    if not literals1 or not literals2:
+        return True
+    return any(lit1 in lit2 or lit2 in lit1
+               for lit1 in literals1 for lit2 in literals2)
+
+
+def sort_regex_list(expressions, hits):
+    """Sort the expressions by number of hits.
+
+    The expressions with more hits are tried first, but an expression never
+    goes before a previous one that may match the same line. In that way the
+    first expression that matches a line is always the same.
+
+    Args:
+        expressions: The list of expressions to sort.
+        hits: Dictionary with the number of hits of every regex pattern.
+
+    Returns:
+        A new list with the sorted expressions.
+    """
+    keys = [(get_function_names(expr[1].pattern), expr[2])
+            for expr in expressions]
+
+    # Number of previous expressions that must go before each expression.
+    blockers = [0] * len(expressions)
+    blocked = [[] for _ in expressions]
+    for i in range(len(expressions)):
+        for j in range(i):
+            if _may_overlap(*(keys[j] + keys[i])):
+                blockers[i] += 1
+                blocked[j].append(i)
+
+    heap = [(-hits.get(expressions[i][1].pattern, 0), i)
+            for i in range(len(expressions)) if blockers[i] == 0]
+    heapq.heapify(heap)
+    result = []
+    while heap:
+        i = heapq.heappop(heap)[1]
+        result.append(expressions[i])
+        for j in blocked[i]:
+            blockers[j] -= 1
+            if blockers[j] == 0:
+                heapq.heappush(
+                    heap, (-hits.get(expressions[j][1].pattern, 0), j))
+    return result
+
+
+def load_regex_profile(path):
+    """Load the number of hits of every regex from a file.
+
+    Returns:
+        A dictionary with the regex patterns and their number of hits. It's
+        empty if the file doesn't exist yet.
+    """
+    try:
+        with open(path) as profile:
+            return json.load(profile)
+    except IOError:
+        return {}
+
+
+def save_regex_profile(path, hits):
+    """Save the number of hits of every regex to a file."""
+    with open(path, "w") as profile:
+        json.dump(hits, profile, indent=2, sort_keys=True)
@@ -0,0 +1,455 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Match the log lines against the list of regular expressions.
+
+Classes:
+  + LiteralAutomaton: Find at once the literals from a set that are in a line.
+  + ListMatcher: Try all the expressions in order.
+  + IndexMatcher: Try only the expressions for the function names in the line.
+  + CombinedMatcher: Try all the expressions at once with a single regex.
+
+Functions:
+  + create_matcher: Create the matcher engine with the given name.
+  + get_function_names: Get the function names that a regex requires.
+  + get_literals: Get the literal substrings that a regex requires.
+  + starts_with_literal: Check if the regex starts with a literal character.
+
+Constants:
+  + MATCHERS: Available matcher engines by name.
+"""
+from __future__ import absolute_import
+import re
+
+# Words followed by a colon that contain at least one letter, but searching
+# in the reversed line. The regex starts with a literal so the engine can skip
+# quickly to the next colon and it won't try every position inside the words.
+# The clock fields (e.g.: "16:25:21") are skipped too.
+REVERSED_FUNCTION_REGEX = re.compile(r":(\d*[A-Za-z_]\w*)")
+WORD_REGEX = re.compile(r"\w+\Z")
+NAME_REGEX = re.compile(r"\w*[A-Za-z_]\w*\Z")
+SPECIAL_CHARS = ("", "\\", ".", "^", "$", "*", "+", "?", "{", "[", "(", "|")
+QUANTIFIERS = ("?", "*", "+", "{")
+MAX_CACHE_SIZE = 10000
+MIN_LITERAL_LENGTH = 4
+MAX_LITERALS = 2
+
+
+def get_function_names(regex):
+    """Get the function names that a regex requires.
+
+    The regex must start with the function name followed by a colon. The name
+    may contain simple groups like "COMMEND(Be|Sr)" or "on(?:Domain)?".
+
+    Returns:
+        A list with all the possible function names or None if the regex
+        doesn't start with a literal function name.
+    """
+    names = [""]
+    i = 0
+    while i < len(regex):
+        char = regex[i]
+        if char == ":":
+            valid = all(NAME_REGEX.match(name) for name in names)
+            return names if valid else None
+        elif char == "(":
+            end = regex.find(")", i)
+            if end == -1:
+                return None
+            group = regex[i + 1:end]
+            if group.startswith("?:"):
+                group = group[2:]
+            options = group.split("|")
+            if not all(WORD_REGEX.match(opt) for opt in options):
+                return None
+            i = end + 1
+            if regex[i:i + 1] == "?":
+                options.append("")
+                i += 1
+            names = [name + opt for name in names for opt in options]
+        elif WORD_REGEX.match(char):
+            i += 1
+            names = [name + char for name in names]
+        else:
+            return None
+
+        # Quantifiers would make the previous character or group optional.
+        if regex[i:i + 1] in QUANTIFIERS:
+            return None
+    return None
+
+
+def get_literals(regex):
+    """Get the literal substrings that a regex requires.
+
+    Only the literals outside groups and character classes are taken into
+    account. If the regex has alternatives at the top level, it doesn't
+    require any literal.
+
+    Returns:
+        A list with the longest literals of the regex.
+    """
+    literals = []
+    literal = ""
+    i = 0
+    while i < len(regex):
+        char = regex[i]
+        if char == "|":
+            return []
+        elif char in "([":
+            literals.append(literal)
+            literal = ""
+            i = _skip_quantifier(regex, _skip_group(regex, i))
+            continue
+        elif char in ".^$":
+            literals.append(literal)
+            literal = ""
+            i = _skip_quantifier(regex, i + 1)
+            continue
+        elif char == "\\" and regex[i + 1:i + 2].isalnum():
+            # Character classes like \d, \w or anchors like \b.
+            literals.append(literal)
+            literal = ""
+            i = _skip_quantifier(regex, i + 2)
+            continue
+        elif char == "\\":
+            char = regex[i + 1:i + 2]
+            i += 2
+        else:
+            i += 1
+
+        quantifier = regex[i:i + 1]
+        if quantifier in QUANTIFIERS:
+            # The character is optional or repeated so it ends the literal.
+            if quantifier == "+":
+                literal += char
+            literals.append(literal)
+            literal = ""
+            i = _skip_quantifier(regex, i)
+        else:
+            literal += char
+    literals.append(literal)
+
+    literals = [lit for lit in literals if len(lit) >= MIN_LITERAL_LENGTH]
+    return sorted(literals, key=len, reverse=True)[:MAX_LITERALS]
+
+
+def _skip_group(regex, i):
+    """Get the position after the group or character class at i."""
+    depth = 0
+    while i < len(regex):
+        char = regex[i]
+        if char == "\\":
+            i += 1
+        elif char == "[":
+            # The first character of the class could be a literal ']'.
+            i = regex.find("]", i + 2 if regex[i + 1:i + 2] != "^" else i + 3)
+            if i == -1:
+                return len(regex)
+            if depth == 0:
+                return i + 1
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return len(regex)
+
+
+def _skip_quantifier(regex, i):
+    """Get the position after the quantifier at i if any."""
+    char = regex[i:i + 1]
+    if char == "{":
+        i = regex.find("}", i) + 1 or len(regex)
+    elif char in QUANTIFIERS:
+        i += 1
+    else:
+        return i
+    # Non-greedy quantifier
+    return i + 1 if regex[i:i + 1] == "?" else i
+
+
+def starts_with_literal(regex):
+    """Check if the regex starts with a literal character."""
+    return regex[:1] not in SPECIAL_CHARS and \
+        regex[1:2] not in QUANTIFIERS
+
+
+class LiteralAutomaton(object):
+    """Find at once the literals from a set that are in a line.
+
+    The literals are alternatives of a single regex, sorted from the longest
+    to the shortest. The regex engine reports the longest literal in the
+    leftmost position and then it continues after the literal. It may miss
+    the literals that start inside a reported literal, so each literal
+    implies the literals that it contains or that may overlap its end. The
+    result may have more literals than the line but never less.
+
+    Functions:
+      + __init__: Compile the automaton for the given literals.
+      + search: Get the set of literals that may be in the line.
+    """
+
+    def __init__(self, literals):
+        """Compile the automaton for the given literals."""
+        literals = sorted(set(literals), key=len, reverse=True)
+        self._regex = re.compile(
+            "|".join(re.escape(lit) for lit in literals))
+        self._implied = {}
+        for lit in literals:
+            self._implied[lit] = [
+                other for other in literals
+                if other in lit or
+                any(other.startswith(lit[i:]) for i in range(1, len(lit)))]
+
+    def search(self, line):
+        """Get the set of literals that may be in the line."""
+        found = set()
+        for lit in self._regex.findall(line):
+            found.update(self._implied[lit])
+        return found
+
+
+class ListMatcher(object):
+    """Try all the expressions in order.
+
+    This is the reference engine: any other engine must return the same
+    results for the same lines. Every engine counts in the hits attribute how
+    many lines each expression of the list has matched.
+
+    Functions:
+      + __init__: Keep the expression list.
+      + match: Get the function and groups for the first matched expression.
+    """
+
+    def __init__(self, expressions):
+        """Keep the expression list."""
+        self._expressions = list(enumerate(expressions))
+        self.hits = [0] * len(expressions)
+
+    def match(self, line):
+        """Get the function and groups for the first matched expression.
+
+        Returns:
+            A tuple with the function, the match groups and the index of
+            the expression or None.
+        """
+        for i, expr in self._expressions:
+            match = expr[1].search(line)
+            if match:
+                self.hits[i] += 1
+                return expr[0], match.groups(), i
+        return None
+
+
+class IndexMatcher(object):
+    """Try only the expressions for the function names in the line.
+
+    The expressions are indexed by the Connext function name that starts
+    them. The names are reversed in the index to find them faster in the
+    reversed line. Expressions without a function name (e.g.: the Micro
+    errors or the custom logs) are tried for every line. The original order
+    of the expression list is kept so the first expression that matches
+    wins.
+
+    Many expressions share the same function name, so before trying them
+    a literal automaton finds which of their required literals are in the
+    line. Only the expressions with all their literals in the line are tried.
+
+    Functions:
+      + __init__: Create the index from the expression list.
+      + match: Get the function and groups for the first matched expression.
+      + _get_candidates: Get the expressions to try for the function names.
+    """
+
+    def __init__(self, expressions):
+        """Create the index from the expression list."""
+        self._index = {}
+        self._fallback = []
+        self._cache = {}
+        self._automata = {}
+        self.hits = [0] * len(expressions)
+        for i, expr in enumerate(expressions):
+            names = get_function_names(expr[1].pattern)
+            if names is None:
+                self._fallback.append((i, expr))
+                continue
+            for name in names:
+                self._index.setdefault(name[::-1], []).append((i, expr))
+
+    def match(self, line):
+        """Get the function and groups for the first matched expression.
+
+        Returns:
+            A tuple with the function, the match groups and the index of
+            the expression or None.
+        """
+        names = tuple(REVERSED_FUNCTION_REGEX.findall(line[::-1]))
+        candidates = self._cache.get(names)
+        if candidates is None:
+            candidates = self._get_candidates(names)
+
+        automaton, candidates = candidates
+        found = automaton.search(line) if automaton else ()
+        for i, expr, literals in candidates:
+            if literals and not literals.issubset(found):
+                continue
+            match = expr[1].search(line)
+            if match:
+                self.hits[i] += 1
+                return expr[0], match.groups(), i
+        return None
+
+    def _get_candidates(self, names):
+        """Get the expressions to try for the reversed function names.
+
+        Returns:
+            A tuple with the literal automaton and the list of expressions
+            with their required literals.
+        """
+        candidates = dict(self._fallback)
+        for name in names:
+            # The function name may be the end of a longer word.
+            for i in range(len(name)):
+                candidates.update(self._index.get(name[:i + 1], []))
+        indexes = tuple(sorted(candidates))
+        candidates = [(i, candidates[i], frozenset(candidates[i][2]))
+                      for i in indexes]
+
+        # Many function names share the same candidates.
+        if indexes not in self._automata:
+            literals = [lit for expr in candidates for lit in expr[2]]
+            self._automata[indexes] = \
+                LiteralAutomaton(literals) if literals else None
+
+        if len(self._cache) >= MAX_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[names] = (self._automata[indexes], candidates)
+        return self._cache[names]
+
+
+class CombinedMatcher(object):
+    """Try all the expressions at once with a single regex.
+
+    Every expression becomes a named alternative of a master regex, in the
+    same order as the expression list. The regex engine returns the leftmost
+    position where any expression matches and, for that position, the first
+    expression in the list. An earlier expression could still match later in
+    the line, so the search continues after the match until the end of the
+    line, keeping the first expression in the list. The branch that matched
+    gives the function and the slice of groups for the expression.
+
+    The regex engine only skips quickly the positions and alternatives that
+    can't match when all of them start with a literal character. For that
+    reason, the expressions that start with a group or a character class have
+    their own regex and they split the master regex into several ones.
+
+    Functions:
+      + __init__: Compile the master regex from the expression list.
+      + match: Get the function and groups for the first matched expression.
+      + _compile_chunks: Compile the expressions into one or more regex.
+      + _compile: Compile the expressions into a single regex.
+    """
+
+    def __init__(self, expressions):
+        """Compile the master regex from the expression list."""
+        self._regexes = []
+        self.hits = [0] * len(expressions)
+        chunk = []
+        for i, expr in enumerate(expressions):
+            if starts_with_literal(expr[1].pattern):
+                chunk.append((i, expr))
+                continue
+            if chunk:
+                self._regexes += self._compile_chunks(chunk)
+            self._regexes += self._compile_chunks([(i, expr)])
+            chunk = []
+        if chunk:
+            self._regexes += self._compile_chunks(chunk)
+
+    def match(self, line):
+        """Get the function and groups for the first matched expression.
+
+        Returns:
+            A tuple with the function, the match groups and the index of
+            the expression or None.
+        """
+        for regex, branches in self._regexes:
+            best = None
+            match = regex.search(line)
+            while match:
+                branch = branches[match.lastindex]
+                if best is None or branch[0] < best[0][0]:
+                    best = (branch, match)
+                if branch[0] == 0:
+                    break
+                match = regex.search(line, match.start() + 1)
+
+            if best:
+                branch, match = best
+                self.hits[branch[4]] += 1
+                return (branch[1], match.groups()[branch[2]:branch[3]],
+                        branch[4])
+        return None
+
+    def _compile_chunks(self, expressions):
+        """Compile the expressions into one or more regex."""
+        try:
+            return [self._compile(expressions)]
+        except AssertionError:
+            # Python 2.7 only supports up to 100 groups per regex.
+            if len(expressions) == 1:
+                raise
+            half = len(expressions) // 2
+            return self._compile_chunks(expressions[:half]) + \
+                self._compile_chunks(expressions[half:])
+
+    @staticmethod
+    def _compile(expressions):
+        """Compile the expressions into a single regex.
+
+        Returns:
+            The regex and a dictionary with the branches. The key is the group
+            index of the alternative and the value contains the position of
+            the expression in the regex, the function, the group slice and
+            the index of the expression in the list.
+        """
+        alternatives = []
+        branches = {}
+        num_groups = 0
+        for position, (i, expr) in enumerate(expressions):
+            # The empty group at the end identifies the alternative. It can't
+            # be at the beginning or the alternative wouldn't start with a
+            # literal anymore.
+            alternatives.append("(?:%s)(?P<e%d>)" % (expr[1].pattern, i))
+            start = num_groups
+            num_groups += expr[1].groups + 1
+            branches[num_groups] = (position, expr[0], start, num_groups - 1,
+                                    i)
+        regex = re.compile("|".join(alternatives))
+        return regex, branches
+
+
+MATCHERS = {
+    'list': ListMatcher,
+    'index': IndexMatcher,
+    'combined': CombinedMatcher}
+
+
+def create_matcher(name, expressions):
+    """Create the matcher engine with the given name."""
+    return MATCHERS[name](expressions)
@@ -0,0 +1,73 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Metadata of the log functions.
+
+The items of the regular expression lists can have the metadata of their
+function as third element. It describes when the function has any effect:
+  + level: minimum verbosity to log any message (including configurations,
+    warnings and errors) or None if it doesn't log anything.
+  + family: NETWORK if it only logs packet messages, that are hidden with
+    the --no-network option, or EVENTS otherwise.
+  + effects: the state that the function always changes: STATS for the
+    statistics, that are hidden with the --no-stats option, NAMES for the
+    assigned names and obfuscated texts, that are only changed without the
+    --show-ip option or with the --obfuscate option, STATE for any other
+    state (e.g.: sequence numbers), a tuple of them or None.
+
+The functions without metadata always have effects.
+
+Functions:
+  + metadata: Create the metadata of a log function.
+  + has_effects: Check if a log function has any effect.
+
+Constants:
+  + EVENTS: Family of the functions that log events or configurations.
+  + NETWORK: Family of the functions that only log packet messages.
+  + NAMES: Effects of the functions that assign names or obfuscate texts.
+  + STATE: Effects of the functions that change the state.
+  + STATS: Effects of the functions that only change the statistics.
+"""
+
+EVENTS = "events"
+NAMES = "names"
+NETWORK = "network"
+STATE = "state"
+STATS = "stats"
+
+
+def metadata(level=0, family=EVENTS, effects=None):
+    """Create the metadata of a log function."""
+    if not isinstance(effects, tuple):
+        effects = (effects,) if effects else ()
+    return {'level': level, 'family': family, 'effects': effects}
+
+
+def has_effects(meta, state):
+    """Check if a log function has any effect with the current options.
+
+    The --no-inline option doesn't matter since the warnings and errors are
+    always added to the summary.
+    """
+    effects = meta['effects']
+    if STATE in effects:
+        return True
+    if STATS in effects and not state['no_stats']:
+        return True
+    if NAMES in effects and (state['assign_names'] or state['obfuscate']):
+        return True
+    if meta['level'] is None or state['verbosity'] < meta['level']:
+        return False
+    return meta['family'] != NETWORK or not state['no_network']
@@ -20,6 +20,8 @@ Functions:
 """
 from __future__ import absolute_import
 import logparser.logs.network.network as network
+from logparser.logs.metadata import (EVENTS, NAMES, NETWORK, STATE, STATS,
+                                     metadata)
 
 
 def get_regex_list():
@@ -28,189 +30,238 @@ def get_regex_list():
     # Parser entity.
     regex.append([network.on_parse_packet,
                   r"MIGInterpreter_parse:(?:RTI0x\w+:)?(\w+) from " +
-                  r"0X(\w+),0X(\w+)"])
+                  r"0X(\w+),0X(\w+)",
+                  metadata(2, NETWORK, (STATS, NAMES))])
 
     # Send and receive data from transport layer.
     regex.append([network.on_udpv4_send,
                   r"NDDS_Transport_UDPv4_send:(?:RTI0x\w+:)?\w+ sent (\d+) " +
-                  r"bytes to 0X(\w+):(\d+)"])
+                  r"bytes to 0X(\w+):(\d+)",
+                  metadata(2, NETWORK, (STATS, NAMES))])
     regex.append([network.on_udpv4_receive,
                   r"NDDS_Transport_UDPv4_receive_rEA:(?:RTI0x\w+:)?\w+ " +
-                  r"received (\d+) bytes from 0X(\w+):(\d+)"])
+                  r"received (\d+) bytes from 0X(\w+):(\d+)",
+                  metadata(2, NETWORK, (STATS, NAMES))])
     regex.append([network.on_shmem_send,
                   r"NDDS_Transport_Shmem_send:(?:RTI0x\w+:)?\w+ signalling " +
-                  r"0X(\w+)"])
+                  r"0X(\w+)",
+                  metadata(2, NETWORK, None)])
     regex.append([network.on_shmem_receive,
                   r"NDDS_Transport_Shmem_receive_rEA:(?:RTI0x\w+:)?\w+ " +
-                  r"received (\d+) bytes"])
+                  r"received (\d+) bytes",
+                  metadata(2, NETWORK, STATS)])
 
     # Errors from transport layer.
     regex.append([network.on_error_unreachable_network,
                   r"NDDS_Transport_UDPv4_send:OS sendmsg\(\) failure, " +
-                  r"error 0X65: Network is unreachable"])
+                  r"error 0X65: Network is unreachable",
+                  metadata(1, EVENTS, None)])
     regex.append([network.on_error_no_transport_available,
                   r"RTINetioSender_addDestination:no transport for " +
-                  r"destination request (.+)"])
+                  r"destination request (.+)",
+                  metadata(1, EVENTS, NAMES)])
 
     # Messages from the participant entity
     regex.append([network.on_unregister_not_asserted_entity("Participant"),
                   r"DISCEndpointDiscoveryPlugin_unregisterParticipant" +
                   r"RemoteEndpoints:remote endpoint not previously asserted " +
-                  r"by plugin: 0X(\w+),0X(\w+),0X(\w+),(\w+)"])
+                  r"by plugin: 0X(\w+),0X(\w+),0X(\w+),(\w+)",
+                  metadata(2, EVENTS, NAMES)])
     regex.append([network.on_unregister_not_asserted_entity("DataWriter"),
                   r"DISCEndpointDiscoveryPlugin_unregisterRemoteWriter:" +
                   r"remote endpoint not previously asserted by plugin: " +
-                  r"0X(\w+),0X(\w+),0X(\w+),0X(\w+)"])
+                  r"0X(\w+),0X(\w+),0X(\w+),0X(\w+)",
+                  metadata(2, EVENTS, NAMES)])
     regex.append([network.on_unregister_not_asserted_entity("DataReader"),
                   r"DISCEndpointDiscoveryPlugin_unregisterRemoteReader:" +
                   r"remote endpoint not previously asserted by plugin: " +
-                  r"0X(\w+),0X(\w+),0X(\w+),0X(\w+)"])
+                  r"0X(\w+),0X(\w+),0X(\w+),0X(\w+)",
+                  metadata(2, EVENTS, NAMES)])
     regex.append([network.on_send_participant_announcement,
                   r"DISCSimpleParticipantDiscoveryPlugin_" +
                   r"remoteParticipantDiscovered:re-announcing participant " +
-                  r"self: 0X(\w+),0X(\w+),0X(\w+),0X(\w+)"])
+                  r"self: 0X(\w+),0X(\w+),0X(\w+),0X(\w+)",
+                  metadata(1, NETWORK, NAMES)])
 
     # Messages from write entity.
     regex.append([network.on_schedule_data,
                   r"COMMENDSrWriterService_write:\s?writer oid 0x(\w+) " +
-                  r"schedules job for sn \(([\d,]+)\)"])
+                  r"schedules job for sn \(([\d,]+)\)",
+                  metadata(0, NETWORK, STATE)])
     regex.append([network.on_send_data,
                   r"COMMENDSrWriterService_agentFunction:\s?writer " +
-                  r"oid 0x(\w+) sends sn \(([\d,]+)\)"])
+                  r"oid 0x(\w+) sends sn \(([\d,]+)\)",
+                  metadata(0, NETWORK, STATE)])
     regex.append([network.on_resend_data,
                   r"COMMENDSrWriterService_sendSyncRepairData:\[\d+,\d+\] " +
                   r"writer oid 0x(\w+) resends DATA to reader " +
                   r"\(0x(\w+),0x(\w+),0x(\w+),0x(\w+)\), sn " +
-                  r"\[\(([\d,]+)\)\]"])
+                  r"\[\(([\d,]+)\)\]",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([network.on_send_periodic_data,
                   r"COMMENDAnonWriterService_on(?:Domain)?BroadcastEvent:" +
                   r"writing periodic keyed data: SN=0x(\d+), " +
-                  r"key=\(16\)(\w+), \d+ bytes"])
+                  r"key=\(16\)(\w+), \d+ bytes",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([network.on_send_gap,
                   r"COMMENDSrWriterService_sendGapToLocator: writer oid " +
                   r"0x(\w+) sends GAP to reader " +
                   r"\(0x(\w+),0x(\w+),0x(\w+),0x(\w+)\) " +
-                  r"for sn \[\(([\d,]+)\)-\(([\d,]+)\)\)"])
+                  r"for sn \[\(([\d,]+)\)-\(([\d,]+)\)\)",
+                  metadata(0, EVENTS, STATE)])
     regex.append([network.on_send_preemptive_gap,
                   r"COMMENDSrWriterService_onSubmessage:\[\d+,\d+\] " +
                   r"writer oid 0x(\w+) sends preemptive GAP to volatile " +
-                  r"reader \(0x(\w+),0x(\w+),0x(\w+),0x(\w+)\)"])
+                  r"reader \(0x(\w+),0x(\w+),0x(\w+),0x(\w+)\)",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([network.on_send_preemptive_hb,
                   r"COMMENDSrWriterService_assertRemoteReader: " +
                   r"writer oid 0x(\w+) sends preemptive HB for sn " +
-                  r"\(([\d,]+)\)-\(([\d,]+)\)"])
+                  r"\(([\d,]+)\)-\(([\d,]+)\)",
+                  metadata(0, NETWORK, None)])
     regex.append([network.on_send_periodic_hb,
                   r"COMMENDSrWriterService_onSendHeartbeatEvent:\[\d+,\d+\] " +
                   r"writer oid 0x(\w+) sends periodic unicast HB for sn " +
-                  r"\(([\d,]+)\)-\(([\d,]+)\), epoch\((\d+)\)"])
+                  r"\(([\d,]+)\)-\(([\d,]+)\), epoch\((\d+)\)",
+                  metadata(0, NETWORK, None)])
     regex.append([network.on_send_piggyback_hb,
                   r"COMMENDSrWriterService_agentFunction:\s?writer oid " +
-                  r"0x(\w+) sends piggyback HB \(([\d,]+)\)-\(([\d,]+)\)"])
+                  r"0x(\w+) sends piggyback HB \(([\d,]+)\)-\(([\d,]+)\)",
+                  metadata(0, NETWORK, STATS)])
     regex.append([network.on_send_piggyback_hb_syncrepair,
                   r"COMMENDSrWriterService_sendSyncRepairData:\[\d+,\d+\] " +
                   r"writer oid 0x(\w+) sends piggyback HB for sn " +
-                  r"\(([\d,]+)\)-\(([\d,]+), epoch\((\d+)\)\)"])
+                  r"\(([\d,]+)\)-\(([\d,]+), epoch\((\d+)\)\)",
+                  metadata(0, NETWORK, STATS)])
     regex.append([network.on_send_hb_response,
                   r"COMMENDSrWriterService_onSubmessage:\[\d+,\d+\] " +
                   r"writer oid 0x(\w+) sends response HB for sn " +
-                  r"\(([\d,]+)\)-\(([\d,]+)\) epoch\((\d+)\)"])
+                  r"\(([\d,]+)\)-\(([\d,]+)\) epoch\((\d+)\)",
+                  metadata(0, NETWORK, None)])
     regex.append([network.on_receive_ack,
                   r"COMMENDSrWriterService_onSubmessage:\[\d+,\d+\] " +
                   r"writer oid 0x(\w+) receives ACKNACK from reader " +
                   r"0x([\w\.]+) for lead \[\(([\d,]+)\)\] bitcount\((\d+)\)," +
-                  r" epoch\((\d+)\), isPureNack\((\d+)\)"])
+                  r" epoch\((\d+)\), isPureNack\((\d+)\)",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([network.on_instance_not_found,
-                  r"WriterHistoryMemoryPlugin_addSample:instance not found"])
+                  r"WriterHistoryMemoryPlugin_addSample:instance not found",
+                  metadata(0, EVENTS, None)])
     regex.append([network.on_send_from_deleted_writer,
                   r"PRESPsWriter_writeInternal:" +
-                  r"pres psWriter already destroyed"])
+                  r"pres psWriter already destroyed",
+                  metadata(0, EVENTS, None)])
     regex.append([network.on_fail_serialize,
-                  r"PRESWriterHistoryDriver_initializeSample:!serialize"])
+                  r"PRESWriterHistoryDriver_initializeSample:!serialize",
+                  metadata(0, EVENTS, None)])
     regex.append([network.on_drop_unregister_no_ack_instance,
                   r"WriterHistoryMemoryPlugin_dropFullyAcked" +
                   r"UnregisteredInstance:unregistered instances " +
-                  r"not fully acked"])
+                  r"not fully acked",
+                  metadata(1, EVENTS, None)])
     regex.append([network.on_writer_exceed_max_entries,
                   r"WriterHistoryMemoryPlugin_addEntryToInstance:" +
-                  r"exceeded max entries"])
+                  r"exceeded max entries",
+                  metadata(0, EVENTS, None)])
     regex.append([network.on_writer_batching_exceed_max_entries,
                   r"WriterHistoryMemoryPlugin_getBatchSampleGroupEntry:" +
-                  r"exceeded max entries"])
+                  r"exceeded max entries",
+                  metadata(0, EVENTS, None)])
     regex.append([network.on_batch_serialize_failure,
                   r"PRESPsWriter_writeBatchInternal:!error serializing " +
-                  r"batch sample"])
+                  r"batch sample",
+                  metadata(0, EVENTS, None)])
     regex.append([network.on_ignore_ack,
                   r"COMMENDSrWriterService_onSubmessage:!ACK ignored: " +
-                  r"number of active RR is > 1, but sum of RR at is 0"])
+                  r"number of active RR is > 1, but sum of RR at is 0",
+                  metadata(0, NETWORK, None)])
 
     # Messages from read entity.
     regex.append([network.on_receive_data,
                   r"COMMEND(Be|Sr)ReaderService_onSubmessage:" +
                   r"(?:\[\d+,\d+\])?\s?reader oid 0x(\w+) received (\w+) of " +
-                  r"sn\(([\w,]+)\), vSn\(([\w,]+)\) from writer 0x([\w\.]+)"])
+                  r"sn\(([\w,]+)\), vSn\(([\w,]+)\) from writer 0x([\w\.]+)",
+                  metadata(0, EVENTS, STATE)])
     regex.append([network.on_receive_fragment,
                   r"COMMENDSrReaderService_onSubmessage:\[\d+,\d+\] " +
                   r"reader oid 0x(\w+) received fragments (\d+)-(\d+) " +
-                  r"for sn \(([\w,]+)\)"])
+                  r"for sn \(([\w,]+)\)",
+                  metadata(0, NETWORK, None)])
     regex.append([network.on_complete_fragment,
                   r"COMMENDSrReaderService_onSubmessage:\s+reader oid " +
-                  r"0x(\w+) fully received sn \(([\d,]+)\)"])
+                  r"0x(\w+) fully received sn \(([\d,]+)\)",
+                  metadata(0, NETWORK, None)])
     regex.append([network.on_receive_out_order_data,
                   r"COMMENDSrReaderService_onSubmessage:\[\d+,\d+\] reader " +
                   r"oid 0x(\w+) received (old|new) out-of-range DATA of sn " +
-                  r"\(([\d,]+)\) from writer 0x([\w\.]+)"])
+                  r"\(([\d,]+)\) from writer 0x([\w\.]+)",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([network.on_accept_data,
                   r"COMMENDSrReaderService_onSubmessage:\s+accepted " +
                   r"sn\(([\d,]+)\), dataRcvd\.lead\(([\d,]+)\), " +
-                  r"nextRelSn\(([\d,]+)\), reservedCount\((\d+)\)"])
+                  r"nextRelSn\(([\d,]+)\), reservedCount\((\d+)\)",
+                  metadata(1, NETWORK, None)])
     regex.append([network.on_rejected_data,
                   r"COMMENDSrReaderService_onSubmessage:\s+rejected " +
                   r"sn\(([\d,]+)\), dataRcvd\.lead\(([\d,]+)\), " +
-                  r"nextRelSn\(([\d,]+)\), reservedCount\((\d+)\)"])
+                  r"nextRelSn\(([\d,]+)\), reservedCount\((\d+)\)",
+                  metadata(0, EVENTS, None)])
     regex.append([network.on_receive_hb,
                   r"COMMENDSrReaderService_onSubmessage:\[\d+,\d+\] reader " +
                   r"oid 0x(\w+) received (HB|HB_BATCH|HB_SESSION) for " +
                   r"sn \(([\d,]+)\)-\(([\d,]+)\), epoch\((\d+)\) " +
-                  r"from writer 0x([\w\.]+)"])
+                  r"from writer 0x([\w\.]+)",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([network.on_received_gap,
                   r"COMMENDSrReaderService_onSubmessage:\[\d+,\d+\] reader " +
                   r"oid 0x(\w+) received GAP for sn \(([\d,]+)\) to lead " +
                   r"\(([\d,]+)\) bit count (\d+) from writer " +
-                  r"0x([\w\.]+)"])
+                  r"0x([\w\.]+)",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([network.on_send_ack,
                   r"COMMENDSrReaderService_onSubmessage:\[\d+,\d+\] reader " +
                   r"oid 0x(\w+) sent ACK of bitmap lead\(([\d,]+)\), " +
-                  r"bitcount\((\d+)\), epoch\((\d+)\) to writer 0x([\w\.]+)"])
+                  r"bitcount\((\d+)\), epoch\((\d+)\) to writer 0x([\w\.]+)",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([network.on_send_ack,
                   r"COMMENDSrReaderService_onAckOnceEvent:\[\d+,\d+\] reader" +
                   r" oid 0x(\w+) sent ACK of bitmap lead\(([\d,]+)\), " +
-                  r"bitcount\((\d+)\), epoch\((\d+)\) to writer ([\w\.]+)"])
+                  r"bitcount\((\d+)\), epoch\((\d+)\) to writer ([\w\.]+)",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([network.on_send_nack,
                   r"COMMENDSrReaderService_sendAckNacks:\[\d+,\d+\] reader " +
                   r"oid 0x(\w+) sent NACK of bitmap lead\(([\d,]+)\), " +
-                  r"bitcount\((\d+)\), epoch\((\d+)\) to writer 0x([\w\.]+)"])
+                  r"bitcount\((\d+)\), epoch\((\d+)\) to writer 0x([\w\.]+)",
+                  metadata(0, NETWORK, NAMES)])
     regex.append([network.on_send_nack_frag,
                   r"COMMENDSrReaderService_onSubmessage:\[\d+,\d+\] reader " +
-                  r"oid 0x(\d+) sends NACK_FRAG for sn \(([\d,]+)\)"])
+                  r"oid 0x(\d+) sends NACK_FRAG for sn \(([\d,]+)\)",
+                  metadata(0, NETWORK, None)])
     regex.append([network.on_suppress_hb,
                   r"COMMENDSrReaderService_onSubmessage:\s+reader oid " +
-                  r"0x(\w+) suppressed HEARTBEAT"])
+                  r"0x(\w+) suppressed HEARTBEAT",
+                  metadata(0, NETWORK, None)])
     regex.append([network.on_reader_exceed_max_entries,
                   r"PRESCstReaderCollator_addEntryToInstance:" +
-                  r"exceeded max entriesPerInstance"])
+                  r"exceeded max entriesPerInstance",
+                  metadata(0, EVENTS, None)])
     regex.append([network.on_write_max_blocking_time_expired,
-                  r"PRESPsWriter_writeInternal:max blocking time expired"])
+                  r"PRESPsWriter_writeInternal:max blocking time expired",
+                  metadata(0, EVENTS, None)])
     regex.append([network.on_sample_received_from_deleted_writer,
                   r"COMMENDBeReaderService_onSubmessage:" +
-                  r"!get ber remoteWriter"])
+                  r"!get ber remoteWriter",
+                  metadata(1, EVENTS, None)])
     regex.append([network.on_deserialize_failure,
                   r"PRES(PsReaderQueue|CstReaderCollator)_storeSampleData:" +
-                  r"(?:RTI0x\w+:)?!deserialize"])
+                  r"(?:RTI0x\w+:)?!deserialize",
+                  metadata(0, EVENTS, None)])
     regex.append([network.on_shmem_queue_full,
                   r"NDDS_Transport_Shmem_send:failed to add data. " +
                   r"shmem queue for port 0x(\w+) is full " +
                   r"\(received_message_count_max=(\d+), " +
                   r"receive_buffer_size=(\d+)\). Try to increase queue " +
-                  r"resource limits\."])
+                  r"resource limits\.",
+                  metadata(0, EVENTS, None)])
 
     return regex
@@ -55,6 +55,8 @@ Functions:
   + on_shmem_queue_full: it happens when the SharedMemory queue is full.
 """
 from __future__ import absolute_import
+from logparser.entities import EntityRegistry
+from logparser.pendingsamples import PendingSamples
 from logparser.utils import (add_statistics_bandwidth, add_statistics_packet,
                              get_data_packet_name, get_locator, get_oid,
                              get_participant, get_port_name, get_port_number,
@@ -70,7 +72,7 @@ from logparser.utils import (add_statistics_bandwidth, add_statistics_packet,
 def on_parse_packet(match, state, logger):
     """It happens when an RTPS message is parsed."""
     addr = parse_guid(state, match[1], match[2])
-    logger.recv(addr, "", "Received %s packet" % match[0], 2)
+    logger.recv(addr, "", "Received %s packet", match[0], level=2)
     add_statistics_packet(addr, 'receive', match[0], state)
 
 
@@ -81,45 +83,43 @@ def on_udpv4_send(match, state, logger):
     """It happens when sending an RTPS packet through UDPv4."""
     qty = int(match[0])
     addr = get_participant(hex2ip(match[1], True), state)
-    port = get_port_name(int(match[2]))
-    addr += ":(%s)" % port
-    logger.send(addr, "", "Sent %s bytes" % qty, 2)
-    add_statistics_bandwidth(addr, 'send', qty, state)
+    port = "(%s)" % get_port_name(int(match[2]))
+    logger.send(addr + ":" + port, "", "Sent %s bytes", qty, level=2)
+    add_statistics_bandwidth(addr, port, 'send', qty, state)
 
 
 def on_udpv4_receive(match, state, logger):
     """It happens when receiving an RTPS packet through UDPv4."""
     qty = int(match[0])
     addr = get_participant(hex2ip(match[1], True), state)
-    port = get_port_number(match[2], state)
-    addr += ":" + port.zfill(5)
-    logger.recv(addr, "", "Received %d bytes" % qty, 2)
-    add_statistics_bandwidth(addr, 'receive', qty, state)
+    port = get_port_number(match[2], state).zfill(5)
+    logger.recv(addr + ":" + port, "", "Received %d bytes", qty, level=2)
+    add_statistics_bandwidth(addr, port, 'receive', qty, state)
 
 
 def on_shmem_send(match, state, logger):
     """It happens when sending an RTPS packet through SharedMemory."""
     addr = "SHMEM:(%s)" % get_port_name(int(match[0], 16))
-    logger.send(addr, "", "Sent data", 2)
+    logger.send(addr, "", "Sent data", level=2)
 
 
 def on_shmem_receive(match, state, logger):
     """It happens when receiving an RTPS packet through SharedMemory."""
     qty = int(match[0])
-    logger.recv("SHMEM", "", "Received %d bytes" % qty, 2)
-    add_statistics_bandwidth("SHMEM", 'receive', qty, state)
+    logger.recv("SHMEM", "", "Received %d bytes", qty, level=2)
+    add_statistics_bandwidth("SHMEM", 0, 'receive', qty, state)
 
 
 def on_error_unreachable_network(match, state, logger):
     """It happens when the network is unreachable."""
-    logger.warning("Unreachable network for previous send", 1)
+    logger.warning("Unreachable network for previous send", level=1)
 
 
 def on_error_no_transport_available(match, state, logger):
     """It happens when there isn't transport."""
     loc = get_locator(match[0], state)
-    logger.warning("[LP-12] No transport available to reach locator %s" % loc,
-                   1)
+    logger.warning("[LP-12] No transport available to reach locator %s",
+                   loc, level=1)
 
 
 # --------------------------------------------------------------------------- #
@@ -131,9 +131,9 @@ def on_unregister_not_asserted_entity(entity):
         """Internal function for the specific entity."""
         remote_part = parse_guid(state, match[0], match[1], match[2])
         remote_oid = get_oid(match[3])
-        logger.warning("%s %s is unregistering " % (remote_part, remote_oid) +
-                       "remote %s not previously asserted" % entity,
-                       2)
+        logger.warning("%s %s is unregistering " +
+                       "remote %s not previously asserted",
+                       remote_part, remote_oid, entity, level=2)
     return on_unregister_given_not_asserted_entity
 
 
@@ -141,7 +141,8 @@ def on_send_participant_announcement(match, state, logger):
     """It happens when sending participant announcements."""
     addr = parse_guid(state, match[0], match[1], match[2])
     part_oid = get_oid(match[3])
-    logger.send("", part_oid, "Sent participant announcement for %s" % addr, 1)
+    logger.send("", part_oid, "Sent participant announcement for %s", addr,
+                level=1)
 
 
 # --------------------------------------------------------------------------- #
@@ -151,27 +152,22 @@ def on_schedule_data(match, state, logger):
     """It happens when a data is asynchronously scheduled."""
     writer_oid = get_oid(match[0])
     seqnum = parse_sn(match[1])
-    logger.process("", writer_oid, "Scheduled DATA [%d]" % seqnum)
+    logger.process("", writer_oid, "Scheduled DATA [%d]", seqnum)
 
     if 'packets_lost' not in state:
-        state['packets_lost'] = []
-    key = writer_oid + "-" + str(seqnum)
-    if key in state['packets_lost']:
-        state['packets_lost'].remove(key)
-    else:
-        state['packets_lost'].append(key)
+        state['packets_lost'] = PendingSamples()
+    state['packets_lost'].toggle(writer_oid, seqnum)
 
 
 def on_send_data(match, state, logger):
     """It happens when a DATA packet is sent."""
     writer_oid = get_oid(match[0])
     seqnum = parse_sn(match[1])
-    logger.send("", writer_oid, "Sent DATA [%d]" % seqnum)
+    logger.send("", writer_oid, "Sent DATA [%d]", seqnum)
     add_statistics_packet(writer_oid, "send", "DATA", state)
 
-    key = writer_oid + "-" + str(seqnum)
-    if 'packets_lost' in state and key in state['packets_lost']:
-        state['packets_lost'].remove(key)
+    if 'packets_lost' in state:
+        state['packets_lost'].remove(writer_oid, seqnum)
 
 
 def on_resend_data(match, state, logger):
@@ -182,10 +178,8 @@ def on_resend_data(match, state, logger):
     remote_oid = get_oid(match[4])
     seqnum = parse_sn(match[5])
     verb = 1 if is_builtin_entity(match[0]) else 0
-    logger.send(remote_part, writer_oid,
-                "Resent %s [%d] to reader %s"
-                % (packet_name, seqnum, remote_oid),
-                verb)
+    logger.send(remote_part, writer_oid, "Resent %s [%d] to reader %s",
+                packet_name, seqnum, remote_oid, level=verb)
 
 
 def on_send_periodic_data(match, state, logger):
@@ -196,10 +190,8 @@ def on_send_periodic_data(match, state, logger):
     oid = get_oid(key[24:32])
     data_name = get_data_packet_name(key[24:32])
     verb = 1 if is_builtin_entity(key[24:32]) else 0
-    logger.send("", oid,
-                "Sent periodic %s [%d] for %s" %
-                (data_name, seqnum, local_part),
-                verb)
+    logger.send("", oid, "Sent periodic %s [%d] for %s", data_name,
+                seqnum, local_part, level=verb)
 
 
 def on_send_gap(match, state, logger):
@@ -211,8 +203,8 @@ def on_send_gap(match, state, logger):
     sn_end = parse_sn(match[6]) - 1
     verb = 1 if is_builtin_entity(match[0]) else 0
     logger.send(remote_part, writer_oid,
-                "Sent GAP to reader %s for samples in [%d, %d]" %
-                (reader_oid, sn_start, sn_end), verb)
+                "Sent GAP to reader %s for samples in [%d, %d]",
+                reader_oid, sn_start, sn_end, level=verb)
     add_statistics_packet(writer_oid, 'send', 'GAP', state)
 
     # Check for large sequence number issues.
@@ -222,16 +214,9 @@ def on_send_gap(match, state, logger):
     # Check for reliable packet lost
     if 'packets_lost' not in state:
         return
-    losts = []
-    for k in state['packets_lost']:
-        info = k.split("-")
-        oid = info[0]
-        seqnum = int(info[1])
-        if oid == writer_oid and seqnum >= sn_start and seqnum < sn_end:
-            logger.warning("DATA [%d] may have been lost" % seqnum)
-            losts.append(k)
-    for k in losts:
-        state['packets_lost'].remove(k)
+    for seqnum in state['packets_lost'].pop_range(writer_oid, sn_start,
+                                                  sn_end):
+        logger.warning("DATA [%d] may have been lost", seqnum)
 
 
 def on_send_preemptive_gap(match, state, logger):
@@ -241,8 +226,8 @@ def on_send_preemptive_gap(match, state, logger):
     reader_oid = get_oid(match[4])
     verb = 1 if is_builtin_entity(match[0]) else 0
     logger.send(reader_addr, writer_oid,
-                "Sent preemptive GAP to volatile reader %s" % (reader_oid),
-                verb)
+                "Sent preemptive GAP to volatile reader %s", reader_oid,
+                level=verb)
 
 
 def on_send_preemptive_hb(match, state, logger):
@@ -251,11 +236,9 @@ def on_send_preemptive_hb(match, state, logger):
     sn_start = parse_sn(match[1])
     sn_end = parse_sn(match[2])
     verb = 1 if is_builtin_entity(match[0]) else 0
-    logger.send("",
-                writer_oid,
-                "Sent preemptive HB to let know about samples in [%d, %d]" %
-                (sn_start, sn_end),
-                verb)
+    logger.send("", writer_oid,
+                "Sent preemptive HB to let know about samples in [%d, %d]",
+                sn_start, sn_end, level=verb)
 
 
 def on_send_periodic_hb(match, state, logger):
@@ -266,9 +249,8 @@ def on_send_periodic_hb(match, state, logger):
     epoch = int(match[3])
     verb = 1 if is_builtin_entity(match[0]) else 0
     logger.send("", writer_oid,
-                "Sent periodic HB [%d] for samples in [%d, %d]" %
-                (epoch, sn_start, sn_end),
-                verb)
+                "Sent periodic HB [%d] for samples in [%d, %d]", epoch,
+                sn_start, sn_end, level=verb)
 
 
 def on_send_piggyback_hb(match, state, logger):
@@ -278,8 +260,8 @@ def on_send_piggyback_hb(match, state, logger):
     sn_last = parse_sn(match[2])
     verb = 1 if is_builtin_entity(match[0]) else 0
     logger.send("", writer_oid,
-                "Sent piggyback HB to acknowledge samples in [%d, %d]" %
-                (sn_first, sn_last), verb)
+                "Sent piggyback HB to acknowledge samples in [%d, %d]",
+                sn_first, sn_last, level=verb)
     add_statistics_packet(writer_oid, "send", "PIGGYBACK HB", state)
 
 
@@ -290,12 +272,10 @@ def on_send_piggyback_hb_syncrepair(match, state, logger):
     sn_last = parse_sn(match[2])
     epoch = int(match[3])
     verb = 1 if is_builtin_entity(match[0]) else 0
-    logger.send("",
-                writer_oid,
-                ("Sent piggyback HB [%d] from synchronous reparation"
-                 % epoch) + " to acknowledge samples in [%d, %d]"
-                % (sn_first, sn_last),
-                verb)
+    logger.send("", writer_oid,
+                "Sent piggyback HB [%d] from synchronous reparation" +
+                " to acknowledge samples in [%d, %d]",
+                epoch, sn_first, sn_last, level=verb)
     add_statistics_packet(writer_oid, "send", "PIGGYBACK HB", state)
 
 
@@ -306,11 +286,9 @@ def on_send_hb_response(match, state, logger):
     sn_start = parse_sn(match[2])
     epoch = int(match[3])
     verb = 1 if is_builtin_entity(match[0]) else 0
-    logger.send("",
-                writer_oid,
-                "Sent HB [%d] to verify GAP for samples in [%d, %d]" %
-                (epoch, sn_start, sn_end),
-                verb)
+    logger.send("", writer_oid,
+                "Sent HB [%d] to verify GAP for samples in [%d, %d]",
+                epoch, sn_start, sn_end, level=verb)
 
 
 def on_receive_ack(match, state, logger):
@@ -323,11 +301,9 @@ def on_receive_ack(match, state, logger):
     bitcount = int(match[3])
     epoch = int(match[4])
     verb = 1 if is_builtin_entity(match[0]) else 0
-    logger.recv(reader_addr,
-                writer_oid,
-                "Received ACKNACK [%d] from reader %s for %d +%d" %
-                (epoch, reader_oid, seqnum, bitcount),
-                verb)
+    logger.recv(reader_addr, writer_oid,
+                "Received ACKNACK [%d] from reader %s for %d +%d", epoch,
+                reader_oid, seqnum, bitcount, level=verb)
 
 
 def on_instance_not_found(match, state, logger):
@@ -347,7 +323,8 @@ def on_fail_serialize(match, state, logger):
 
 def on_drop_unregister_no_ack_instance(match, state, logger):
     """It happens when unregistering fails because missing ACK."""
-    logger.warning("[LP-9] Cannot drop unregistered instance, missing ACKs", 1)
+    logger.warning("[LP-9] Cannot drop unregistered instance, missing ACKs",
+                   level=1)
 
 
 def on_writer_exceed_max_entries(match, state, logger):
@@ -394,26 +371,33 @@ def on_receive_data(match, state, logger):
     writer_oid = get_oid(remote[3])
     packet = get_data_packet_name(remote[3]) if packet == "DATA" else packet
 
-    # Sequece number check
-    full_id = writer_addr + "." + writer_oid + ' to ' + reader_oid
+    # Sequece number check by the IDs of the writer and reader.
+    if 'entities' not in state:
+        state['entities'] = EntityRegistry()
     if 'last_sn' not in state:
         state['last_sn'] = {}
-    if full_id in state['last_sn']:
-        prev_seqnum = state['last_sn'][full_id]
-        diff = seqnum - prev_seqnum
-        # Add a warning message per missing packet to have a good count in
-        # the warning summary.
-        for _ in range(diff - 1):
-            logger.warning("Missing sample from %s" % full_id)
-    if full_id not in state['last_sn'] or state['last_sn'][full_id] < seqnum:
-        state['last_sn'][full_id] = seqnum
+    entities = state['entities']
+    key = (entities.get_id(remote[0], remote[1], remote[2], remote[3]),
+           entities.get_id(None, None, None, match[1]))
+    prev_seqnum = state['last_sn'].get(key)
+    if prev_seqnum is not None:
+        missing = seqnum - prev_seqnum - 1
+        # Log the range once, but count every missing packet in the warning
+        # summary.
+        if missing > 0:
+            full_id = writer_addr + "." + writer_oid + ' to ' + reader_oid
+            logger.repeated_warning(
+                missing, "Missing sample from " + full_id,
+                "Missing %d sample(s) in [%d, %d] from %s", missing,
+                prev_seqnum + 1, seqnum - 1, full_id)
+    if prev_seqnum is None or prev_seqnum < seqnum:
+        state['last_sn'][key] = seqnum
 
     # Show the message after any possible warning.
     verb = 1 if is_builtin_entity(remote[3]) else 0
     logger.recv(writer_addr, reader_oid,
-                "Received %s [%d] from writer %s (%s)" %
-                (packet, seqnum, writer_oid, comm),
-                verb)
+                "Received %s [%d] from writer %s (%s)", packet, seqnum,
+                writer_oid, comm, level=verb)
 
 
 def on_receive_fragment(match, state, logger):
@@ -423,16 +407,16 @@ def on_receive_fragment(match, state, logger):
     frag_end = int(match[2])
     seqnum = parse_sn(match[3])
     logger.recv("", reader_oid,
-                "Received DATA fragments %d to %d for sample %d" %
-                (frag_start, frag_end, seqnum))
+                "Received DATA fragments %d to %d for sample %d",
+                frag_start, frag_end, seqnum)
 
 
 def on_complete_fragment(match, state, logger):
     """It happens when the fragment is complete."""
     reader_oid = get_oid(match[0])
     seqnum = parse_sn(match[1])
-    logger.process("", reader_oid,
-                   "Fragmented sample %d is complete" % seqnum)
+    logger.process("", reader_oid, "Fragmented sample %d is complete",
+                   seqnum)
 
 
 def on_receive_out_order_data(match, state, logger):
@@ -445,22 +429,21 @@ def on_receive_out_order_data(match, state, logger):
     writer_oid = get_oid(remote[3])
     packet_name = get_data_packet_name(remote[3])
     verb = 1 if is_builtin_entity(remote[3]) else 0
-    logger.recv(writer_addr, reader_oid, "Received %s %s [%d] from writer %s" %
-                (kind, packet_name, seqnum, writer_oid),
-                verb)
+    logger.recv(writer_addr, reader_oid, "Received %s %s [%d] from writer %s",
+                kind, packet_name, seqnum, writer_oid, level=verb)
 
 
 def on_accept_data(match, state, logger):
     """It happens when the reader accepts data."""
     seqnum = parse_sn(match[0])
-    logger.process("", "", "Reader accepted DATA (%d)" % seqnum, 1)
+    logger.process("", "", "Reader accepted DATA (%d)", seqnum, level=1)
 
 
 def on_rejected_data(match, state, logger):
     """It happens when the reader rejects data."""
     seqnum = parse_sn(match[0])
-    logger.process("", "", "Reader rejected DATA (%d)" % seqnum)
-    logger.warning("A DataReader rejected sample %d" % seqnum)
+    logger.process("", "", "Reader rejected DATA (%d)", seqnum)
+    logger.warning("A DataReader rejected sample %d", seqnum)
 
 
 def on_receive_hb(match, state, logger):
@@ -474,11 +457,9 @@ def on_receive_hb(match, state, logger):
     writer_addr = parse_guid(state, remote[0], remote[1], remote[2])
     writer_oid = get_oid(remote[3])
     verb = 1 if is_builtin_entity(remote[3]) else 0
-    logger.recv(writer_addr,
-                reader_oid,
-                "Received %s [%d] from writer %s for samples in [%d, %d]" %
-                (packet, epoch, writer_oid, sn_start, sn_end),
-                verb)
+    logger.recv(writer_addr, reader_oid,
+                "Received %s [%d] from writer %s for samples in [%d, %d]",
+                packet, epoch, writer_oid, sn_start, sn_end, level=verb)
 
 
 def on_received_gap(match, state, logger):
@@ -491,11 +472,9 @@ def on_received_gap(match, state, logger):
     writer_addr = parse_guid(state, remote[0], remote[1], remote[2])
     writer_oid = get_oid(remote[3])
     verb = 1 if is_builtin_entity(remote[3]) else 0
-    logger.recv(writer_addr,
-                reader_oid,
-                "Received GAP from writer %s for [%d, %d] (+%d)" %
-                (writer_oid, seqnum, lead, bitcount),
-                verb)
+    logger.recv(writer_addr, reader_oid,
+                "Received GAP from writer %s for [%d, %d] (+%d)",
+                writer_oid, seqnum, lead, bitcount, level=verb)
 
 
 def on_send_ack(match, state, logger):
@@ -508,11 +487,9 @@ def on_send_ack(match, state, logger):
     writer_addr = parse_guid(state, remote[0], remote[1], remote[2])
     writer_oid = get_oid(remote[3])
     verb = 1 if is_builtin_entity(remote[3]) else 0
-    logger.send(writer_addr,
-                reader_oid,
-                "Sent ACK [%d] to writer %s for %d count %d" %
-                (epoch, writer_oid, lead, bitcount),
-                verb)
+    logger.send(writer_addr, reader_oid,
+                "Sent ACK [%d] to writer %s for %d count %d", epoch,
+                writer_oid, lead, bitcount, level=verb)
 
 
 def on_send_nack(match, state, logger):
@@ -525,11 +502,9 @@ def on_send_nack(match, state, logger):
     writer_addr = parse_guid(state, remote[0], remote[1], remote[2])
     writer_oid = get_oid(remote[3])
     verb = 1 if is_builtin_entity(remote[3]) else 0
-    logger.send(writer_addr,
-                reader_oid,
-                "Sent NACK [%d] to writer %s for %d count %d" %
-                (epoch, writer_oid, lead, bitcount),
-                verb)
+    logger.send(writer_addr, reader_oid,
+                "Sent NACK [%d] to writer %s for %d count %d", epoch,
+                writer_oid, lead, bitcount, level=verb)
 
 
 def on_send_nack_frag(match, state, logger):
@@ -537,9 +512,8 @@ def on_send_nack_frag(match, state, logger):
     reader_oid = get_oid(match[0])
     seqnum = parse_sn(match[1])
     verb = 1 if is_builtin_entity(match[0]) else 0
-    logger.send("", reader_oid,
-                "Sent NACK_FRAG for sample %d" % seqnum,
-                verb)
+    logger.send("", reader_oid, "Sent NACK_FRAG for sample %d", seqnum,
+                level=verb)
 
 
 def on_suppress_hb(match, state, logger):
@@ -548,18 +522,19 @@ def on_suppress_hb(match, state, logger):
     verb = 1 if is_builtin_entity(match[0]) else 0
     logger.process("", reader_oid,
                    "Ignored HB due to heartbeat_suppression_duration QoS",
-                   verb)
+                   level=verb)
 
 
 def on_sample_received_from_deleted_writer(match, state, logger):
     """It happens when the remote writer is deleted."""
-    logger.warning("Sample received from an already gone remote DataWriter", 1)
+    logger.warning("Sample received from an already gone remote DataWriter",
+                   level=1)
 
 
 def on_deserialize_failure(match, state, logger):
     """It happens when the reader is not able to deserialize a sample."""
     kind = "keyed" if match[0] == "CstReaderCollator" else "unkeyed"
-    logger.error("[LP-17] Cannot deserialize %s sample" % kind)
+    logger.error("[LP-17] Cannot deserialize %s sample", kind)
 
 
 def on_shmem_queue_full(match, state, logger):
@@ -569,7 +544,7 @@ def on_shmem_queue_full(match, state, logger):
     count_max = match[1]
     max_size = match[2]
     logger.cfg("SharedMemory limits for queue " +
-               "%s (%s) are: max_num=%s, max_size=%s"
-               % (port, port_name, count_max, max_size))
-    logger.error("[LP-19] Sample dropped because SharedMemory queue %s is full"
-                 % port)
+               "%s (%s) are: max_num=%s, max_size=%s",
+               port, port_name, count_max, max_size)
+    logger.error("[LP-19] Sample dropped because SharedMemory queue %s " +
+                 "is full", port)
@@ -0,0 +1,67 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Record of a log message.
+
+Classes:
+  + Message: Log message with a fixed set of fields.
+"""
+
+
+class Message(object):
+    """Log message with a fixed set of fields.
+
+    The fields are slots instead of dictionary items, so creating a message
+    and reading its fields is faster. The fields not set are None.
+
+    Attributes:
+        FIELDS (tuple): name of the fields in the output order
+        description (str): the text of the message
+        kind (str): the kind or remark for the message (e.g.: |WARNING)
+        timestamp (str): the timestamp of the message
+        input_line (int): the current input line
+        output_line (int): the current output line
+        inout (str): [packets-only] 'in' if it's input packet,
+            'out' otherwise
+        remote (str): [packets-only] the remote address of
+            the sender/receiver
+        entity (str): [packets-only] the local entity sending/receiving
+
+    Functions:
+      + __init__: Create the message.
+      + items: Get the name and value of the fields that are set.
+    """
+
+    FIELDS = ("input_line", "output_line", "timestamp", "kind", "inout",
+              "remote", "entity", "description")
+
+    __slots__ = FIELDS
+
+    def __init__(self, description, kind=None, remote=None, entity=None,
+                 inout=None):
+        """Create the message."""
+        self.description = description
+        self.kind = kind
+        self.remote = remote
+        self.entity = entity
+        self.inout = inout
+        self.timestamp = None
+        self.input_line = None
+        self.output_line = None
+
+    def items(self):
+        """Get the name and value of the fields that are set."""
+        return [(name, getattr(self, name)) for name in self.FIELDS
+                if getattr(self, name) is not None]
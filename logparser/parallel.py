@@ -0,0 +1,258 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Match the lines of a log file in parallel.
+
+The log file is split into chunks of lines. A pool of processes cleans the
+lines, parses the clocks and matches the expressions of every chunk. These
+steps don't depend on the previous lines. The functions of the expressions
+change the state, so they must run in the main process in the original order
+of the lines. They decode the fields of the logs too, so the main process
+limits the speed-up with many processes.
+
+The processes only receive the patterns of the expressions, so they can be
+started with any method (e.g.: spawn on Windows and macOS). They return the
+index of the matched expression and the main process runs its function. Only
+the lines that matched or that changed the clocks in a way that the main
+process must check are returned.
+
+Classes:
+  + ChunkParser: Iterate over the lines of a file matched in parallel.
+
+Functions:
+  + get_chunks: Split a file into chunks of lines.
+  + parse_chunk: Clean, parse the clocks and match the lines of a chunk.
+
+Constants:
+  + CHUNK_SIZE: Approximated size in bytes of every chunk.
+  + ERROR: Expression index for the lines that raised an exception.
+"""
+from __future__ import absolute_import, print_function
+import re
+from collections import deque
+from locale import getpreferredencoding
+from multiprocessing import Pool, cpu_count
+from os import fstat
+from signal import SIG_IGN, SIGINT, signal
+
+from logparser.clocks import (exceeds_distance, get_header, parse_clocks,
+                              parse_header)
+from logparser.logs.matchers import create_matcher
+
+CHUNK_SIZE = 4 * 1024 * 1024
+ERROR = -1
+
+# Matcher and prefilters of the worker process.
+_MATCHER = None
+_PREFILTERS = []
+
+
+def get_chunks(file_path, chunk_size=CHUNK_SIZE):
+    """Split a file into chunks of lines.
+
+    Returns:
+        A list of tuples with the start and end offset of every chunk.
+    """
+    chunks = []
+    with open(file_path, "rb") as stream:
+        file_size = fstat(stream.fileno()).st_size
+        start = 0
+        while start < file_size:
+            stream.seek(start + chunk_size)
+            stream.readline()
+            end = min(stream.tell(), file_size)
+            chunks.append((start, end))
+            start = end
+    return chunks
+
+
+def _init_worker(engine, patterns, prefilters):
+    """Create the matcher of the worker process.
+
+    The function of every expression is replaced by its index.
+    """
+    global _MATCHER, _PREFILTERS  # pylint: disable=W0603
+    # The main process handles the SIGINT.
+    signal(SIGINT, SIG_IGN)
+    _MATCHER = create_matcher(engine, [
+        (i, re.compile(pattern), literals)
+        for i, (pattern, literals) in enumerate(patterns)])
+    _PREFILTERS = [re.compile(regex) for regex in prefilters]
+
+
+def _decode(line):
+    """Decode the line like the input file device."""
+    if isinstance(line, str):  # Python 2.7
+        return line
+    try:
+        return line.decode(getpreferredencoding(False))
+    except UnicodeDecodeError as ex:
+        print("[InputError] %s" % ex)
+        return ""
+
+
+def parse_chunk(file_path, start, end, keep_lines):
+    """Clean, parse the clocks and match the lines of a chunk.
+
+    The clock changes are returned with the next matched line. They are
+    returned at once if the main process may warn about the distance
+    between the clocks or it doesn't know the previous clocks (e.g.: the
+    first change of the chunk). The last change is returned at the end of
+    the chunk.
+
+    Returns:
+        A tuple with the list of records, the number of lines and the end
+        offset of the chunk. The records contain the line number in the
+        chunk, the line (only if keep_lines is set or it raised an
+        exception), the clock change (None or a tuple with the previous
+        clocks, None if the main process has them, and the new clocks), the
+        index of the matched expression (None if not matched or it doesn't
+        match the prefilters) and the groups. If keep_lines is set there is
+        a record for every non-empty line.
+    """
+    with open(file_path, "rb") as stream:
+        stream.seek(start)
+        data = stream.read(end - start)
+
+    records = []
+    last_header = clocks = change = None
+    number = 0
+    for number, line in enumerate(data.splitlines(), 1):
+        line = _decode(line).replace("\x00", " ")
+        if not line:
+            continue
+
+        try:
+            new_clocks = None
+            header = get_header(line)
+            if header is None or header != last_header:
+                new_clocks = parse_header(header) if header else None
+                if not new_clocks:
+                    header = None
+                    new_clocks = parse_clocks(line)
+                if new_clocks:
+                    last_header = header
+            match = None
+            if all(regex.search(line) for regex in _PREFILTERS):
+                match = _MATCHER.match(line)
+        except Exception:  # pylint: disable=W0703
+            # The main process will parse it again to report the error.
+            records.append((number, line, change, ERROR, None))
+            last_header = clocks = change = None
+            continue
+
+        send = False
+        if new_clocks and new_clocks != clocks:
+            send = clocks is None or exceeds_distance(clocks, new_clocks)
+            change = (clocks, new_clocks)
+            clocks = new_clocks
+        if match or send or keep_lines:
+            records.append((number,
+                            line if keep_lines else None,
+                            change,
+                            match[2] if match else None,
+                            match[1] if match else None))
+            change = None
+
+    if change:
+        records.append((number, None, change, None, None))
+    return records, number, end
+
+
+class ChunkParser(object):
+    """Iterate over the lines of a file matched in parallel.
+
+    The chunks are sent to the pool of processes as the previous ones are
+    parsed, so only a few of them are in memory at once. The iteration can
+    continue after an exception like KeyboardInterrupt.
+
+    The number of the line of a record is the lines attribute plus the line
+    number in the record. At the end of the iteration the lines attribute is
+    the number of lines of the file.
+
+    Functions:
+      + __init__: Create the pool of processes.
+      + __next__: Get the next record.
+      + close: Wait for the processes to finish.
+      + _send_chunks: Send the next chunks to the pool of processes.
+    """
+
+    def __init__(self, device, file_path, expressions, engine, jobs,
+                 keep_lines, prefilters=()):
+        """Create the pool of processes.
+
+        Args:
+            device: The input file device to show the progress.
+            file_path: The path of the log file.
+            expressions: The list of expressions to match.
+            engine: The name of the matcher engine.
+            jobs: The number of processes or None to use all the CPUs.
+            keep_lines: Return a record with the line for every line.
+            prefilters: The regex that the lines must match to match them.
+        """
+        self._device = device
+        self._file_path = file_path
+        self._keep_lines = keep_lines
+        jobs = jobs or cpu_count()
+        patterns = [(expr[1].pattern, expr[2]) for expr in expressions]
+        self._pool = Pool(jobs, _init_worker, (
+            engine, patterns, [regex.pattern for regex in prefilters]))
+        self._chunks = deque(get_chunks(file_path, CHUNK_SIZE))
+        self._pending = deque()
+        self._max_pending = 2 * jobs
+        self._records = []
+        self._chunk_lines = 0
+        self._index = 0
+        self.lines = 0
+
+    def __iter__(self):
+        """Return the iterator."""
+        return self
+
+    def __next__(self):
+        """Get the next record."""
+        while self._index >= len(self._records):
+            self.lines += self._chunk_lines
+            self._records = []
+            self._chunk_lines = 0
+            self._send_chunks()
+            if not self._pending:
+                raise StopIteration
+
+            # Remove the result after getting it in case of SIGINT.
+            self._records, self._chunk_lines, end = self._pending[0].get()
+            self._pending.popleft()
+            self._index = 0
+
+            # The input device follows the chunks to show the progress.
+            self._device.seek(end)
+
+        self._index += 1
+        return self._records[self._index - 1]
+
+    next = __next__  # Python 2.7
+
+    def close(self):
+        """Wait for the processes to finish."""
+        self._pool.close()
+        self._pool.join()
+
+    def _send_chunks(self):
+        """Send the next chunks to the pool of processes."""
+        while self._chunks and len(self._pending) < self._max_pending:
+            start, end = self._chunks.popleft()
+            self._pending.append(self._pool.apply_async(
+                parse_chunk,
+                (self._file_path, start, end, self._keep_lines)))
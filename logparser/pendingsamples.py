@@ -0,0 +1,143 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Samples pending to be sent.
+
+The module contains the PendingSamples class.
+"""
+from bisect import bisect_left
+
+# Minimum number of removed sequence numbers before compacting a list.
+MIN_STALE = 64
+
+
+class _WriterSamples(object):
+    """Pending samples of a writer.
+
+    Attributes:
+        pending (set): sequence numbers of the pending samples
+        seqnums (list): sorted sequence numbers from the head index, with
+            the pending samples and some removed ones
+        head (int): index of the first sequence number in the list
+    """
+
+    __slots__ = ('pending', 'seqnums', 'head')
+
+    def __init__(self):
+        """Constructor of the class."""
+        self.pending = set()
+        self.seqnums = []
+        self.head = 0
+
+    def add(self, seqnum):
+        """Add a sample that is not pending."""
+        self.pending.add(seqnum)
+        seqnums = self.seqnums
+        if len(seqnums) == self.head or seqnum > seqnums[-1]:
+            seqnums.append(seqnum)
+            return
+        index = bisect_left(seqnums, seqnum, self.head)
+        if index == len(seqnums) or seqnums[index] != seqnum:
+            seqnums.insert(index, seqnum)
+
+    def compact(self):
+        """Remove from the list the samples that are not pending."""
+        stale = len(self.seqnums) - self.head - len(self.pending)
+        if stale > max(len(self.pending), MIN_STALE):
+            self.seqnums = [seqnum for seqnum in self.seqnums[self.head:]
+                            if seqnum in self.pending]
+            self.head = 0
+        elif self.head > len(self.seqnums) // 2:
+            del self.seqnums[:self.head]
+            self.head = 0
+
+
+class PendingSamples(object):
+    """Sequence numbers of the samples pending for every writer.
+
+    Every writer has a set of pending samples and a sorted list of sequence
+    numbers. Removing a sample only removes it from the set, so the list
+    may have sequence numbers that are not pending anymore. The list is
+    compacted when it has more removed sequence numbers than pending ones,
+    so every operation takes O(log n) amortized time except adding a sample
+    before other pending samples. The samples are usually scheduled in
+    order, so adding them appends to the end of the list.
+    """
+
+    def __init__(self):
+        """Constructor of the class."""
+        self.writers = {}
+
+    def toggle(self, writer, seqnum):
+        """Add the sample if it's not pending, otherwise remove it.
+
+        Args:
+            writer (str): the writer of the sample
+            seqnum (int): the sequence number of the sample
+        """
+        samples = self.writers.get(writer)
+        if samples and seqnum in samples.pending:
+            self.remove(writer, seqnum)
+            return
+        if samples is None:
+            samples = self.writers[writer] = _WriterSamples()
+        samples.add(seqnum)
+
+    def remove(self, writer, seqnum):
+        """Remove the sample if it's pending.
+
+        Args:
+            writer (str): the writer of the sample
+            seqnum (int): the sequence number of the sample
+        """
+        samples = self.writers.get(writer)
+        if not samples or seqnum not in samples.pending:
+            return
+        samples.pending.remove(seqnum)
+        if samples.pending:
+            samples.compact()
+        else:
+            del self.writers[writer]
+
+    def pop_range(self, writer, start, end):
+        """Remove the pending samples in a range.
+
+        Args:
+            writer (str): the writer of the samples
+            start (int): the first sequence number of the range
+            end (int): the sequence number after the range
+
+        Returns:
+            The list of sequence numbers removed in order.
+        """
+        samples = self.writers.get(writer)
+        if not samples:
+            return []
+        seqnums = samples.seqnums
+        first = bisect_left(seqnums, start, samples.head)
+        last = bisect_left(seqnums, end, first)
+        removed = [seqnum for seqnum in seqnums[first:last]
+                   if seqnum in samples.pending]
+        samples.pending.difference_update(removed)
+        if not samples.pending:
+            del self.writers[writer]
+            return removed
+
+        if first == samples.head:
+            samples.head = last
+        else:
+            del seqnums[first:last]
+        samples.compact()
+        return removed
@@ -0,0 +1,111 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Show the progress of the parsing.
+
+The progress is printed periodically from a background thread, so reading
+and parsing the lines don't check the time. The thread only reads the
+counters of the input device and the state.
+
+Classes:
+  + ProgressReporter: Print the progress and throughput from a thread.
+"""
+from __future__ import absolute_import, division
+from sys import stdout
+from threading import Event, Thread
+from time import time
+
+
+class ProgressReporter(object):
+    """Print the progress and throughput from a thread.
+
+    For files it prints a progress bar with the estimated remaining time. For
+    the standard input it prints the running time. In both cases it prints
+    the bytes and lines per second and the ratio of matched lines.
+
+    Functions:
+      + __init__: Initialize the reporter.
+      + start: Start the thread printing the progress.
+      + stop: Stop the thread and print the last progress.
+      + print_progress: Print the current progress.
+      + _run: Print the progress periodically until stopped.
+    """
+
+    # Seconds between the updates of the progress.
+    INTERVAL = 0.2
+
+    # Number of characters of the progress bar.
+    BAR_LENGTH = 51
+
+    def __init__(self, state):
+        """Initialize the reporter."""
+        self.state = state
+        self.device = state['input_device']
+        self.file_size = getattr(self.device, "file_size", None)
+        self.start_time = time()
+        self.stop_event = Event()
+        self.thread = None
+
+    def start(self):
+        """Start the thread printing the progress."""
+        self.start_time = time()
+        self.thread = Thread(target=self._run)
+        # Don't wait for the thread if the program finishes with an error.
+        self.thread.daemon = True
+        self.thread.start()
+
+    def stop(self):
+        """Stop the thread and print the last progress."""
+        if self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+        self.print_progress()
+
+    def _run(self):
+        """Print the progress periodically until stopped."""
+        while not self.stop_event.wait(self.INTERVAL):
+            self.print_progress()
+
+    def print_progress(self):
+        """Print the current progress."""
+        elapsed = max(time() - self.start_time, 1e-6)
+        position = self.device.tell()
+        lines = self.state['input_line']
+        matched = self.state['matched_lines']
+
+        throughput = "%.1f MB/s | %d lines/s | %.1f%% matched" % (
+            position / elapsed / (1024 * 1024),
+            lines / elapsed,
+            100.0 * matched / lines if lines else 0)
+
+        if self.file_size:
+            # Based on @Greenstick's reply:
+            # https://stackoverflow.com/a/34325723
+            position = min(position, self.file_size)
+            ratio = position / self.file_size
+            filled_length = int(round(self.BAR_LENGTH * ratio))
+            bar_text = '*' * filled_length + \
+                '-' * (self.BAR_LENGTH - filled_length)
+            eta = elapsed * (1 - ratio) / ratio if ratio else 0
+            text = "%s| %06.2f%% Completed | %s | ETA %d sec" % (
+                bar_text, 100 * ratio, throughput, eta)
+        else:
+            text = "Running for %.2f sec | %s" % (elapsed, throughput)
+
+        # 33[K is an ANSI code to clear the rest of the line.
+        stdout.write(text + "\033[K\r")
+        stdout.flush()
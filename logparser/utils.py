@@ -23,6 +23,9 @@ Functions:
   + add_statistics_packets: Add the given packet to the packet statistics.
   + add_statistics_bandwidth: Add the given packet to the bandwidth statistics.
   + obfuscate: Obfuscate the given text.
+  + create_obfuscation_hash: Create the salted hash function to obfuscate.
+  + load_obfuscation_map: Load the obfuscation map from a file.
+  + save_obfuscation_map: Save the obfuscation map to a file.
   + get_oid: Get a name for the entity ID in hexadecimal text format.
   + is_builtin_entity: Return if the OID hex number is for a built-in entity.
   + get_data_packet_name: Return the DATA packet name.
@@ -35,23 +38,78 @@ Functions:
   + get_assign_name: Get the assigned name for the entity.
   + set_participant: Set the name of a participant.
   + set_local_address: Set the local address.
+  + set_initial_peers: Set the initial peers.
+  + clear_guid_cache: Clear the cached names of the GUIDs.
   + hex2ip: Convert the hexadecimal host ID into an IP address.
   + parse_guid: Parse the entity GUID field and conver to text.
   + parse_sn: Parse the sequence number and return as a number.
 
+The functions that decode the same IDs many times cache their results. The
+names of the GUIDs are cached in the state until a change of the participant
+names, the local address or the initial peers.
+
 Constants:
   + INSTANCE_STATES: States for an instance.
   + VIEW_STATES: View states for an instance.
+  + BUILTIN_NAMES: Names of the built-in entity IDs.
+  + ENTITY_ORIGINS: Names of the entity origins.
+  + ENTITY_KINDS: Names of the entity kinds.
+  + PACKET_NAMES: DATA packet names of the built-in writers.
+  + INTERFACE_FLAGS: Names of the network interface flags.
+  + CACHE_SIZE: Maximum number of cached results of every function.
+  + OBFUSCATION_HASHES: Hash functions to obfuscate.
 """
 from __future__ import absolute_import
 
-from calendar import timegm
-from datetime import timedelta
+import json
 from hashlib import md5
 
+try:
+    from hashlib import blake2b
+except ImportError:  # Python < 3.6
+    blake2b = None
+
+from logparser.bandwidth import BandwidthStatistics
+from logparser.cache import LruCache, memoize
+from logparser.clocks import MICROSECONDS, to_seconds, to_timedelta
+
 INSTANCE_STATES = ["invalid", "alive", "disposed", "", "no_writers"]
 VIEW_STATES = ["invalid", "new", "not_new"]
 
+# Information from RTPS Spec: http://www.omg.org/spec/DDSI-RTPS/
+# Security entities: http://www.omg.org/spec/DDS-SECURITY/1.0/Beta2/
+BUILTIN_NAMES = {
+    # Built-in Entity GUIDs
+    0x00000000: "UNKNOWN", 0x000001c1: "PARTICIPANT",
+    0x000002c2: "SED_TOPIC_WRITER", 0x000002c7: "SED_TOPIC_READER",
+    0x000003c2: "SED_PUB_WRITER", 0x000003c7: "SED_PUB_READER",
+    0x000004c2: "SED_SUB_WRITER", 0x000004c7: "SED_SUB_READER",
+    0x000100c2: "SPD_PART_WRITER", 0x000100c7: "SPD_PART_READER",
+    0x000200c2: "MESSAGE_WRITER", 0x000200c7: "MESSAGE_READER",
+    # Security Built-in Entity GUIDs
+    0xff0003c2: "SED_PUB_SEC_WRITER", 0xff0003c7: "SED_PUB_SEC_READER",
+    0xff0004c2: "SED_SUB_SEC_WRITER", 0xff0004c7: "SED_SUB_SEC_READER",
+    0xff0200c2: "MSG_SEC_WRITER", 0xff0200c7: "MSG_SEC_READER",
+    0x000201c2: "MSG_STA_SEC_WRITER", 0x000201c7: "MSG_STA_SEC_READER",
+    0xff0202c2: "MSG_VOL_SEC_WRITER", 0xff0202c7: "MSG_VOL_SEC_READER"}
+ENTITY_ORIGINS = {
+    0x00: "USER", 0x40: "VEND", 0x80: "BLVD", 0xc0: "BUILTIN"}
+ENTITY_KINDS = {
+    0x00: "UNK", 0x01: "PART",
+    0x02: "W+K", 0x03: "W-K",
+    0x04: "R-K", 0x07: "R+K"}
+PACKET_NAMES = {
+    "SED_PUB_WRITER": "DATA(w)", "SED_SUB_WRITER": "DATA(r)",
+    "SPD_PART_WRITER": "DATA(p)", "MESSAGE_WRITER": "DATA(m)",
+    "PARTICIPANT": "DATA(p)"}
+INTERFACE_FLAGS = {
+    0x01: "UP", 0x02: "BROADCAST", 0x04: "LOOPBACK", 0x08: "POINTOPOINT",
+    0x10: "MULTICAST", 0x20: "RUNNING"}
+
+CACHE_SIZE = 4096
+
+OBFUSCATION_HASHES = ("md5", "blake2b")
+
 
 def check_periodic(state, name, logger, msg=""):
     """Check if the given event is periodic."""
@@ -85,11 +143,12 @@ def check_periodic(state, name, logger, msg=""):
         return True
 
     # Compare times.
-    tolerance = 0.1 if has_monotonic else timedelta(milliseconds=100)
-    result = compare_times(previous_period, period, tolerance)
+    result = compare_times(previous_period, period, MICROSECONDS // 10)
     if result:
-        logger.warning("%s not periodic (%s by %s) %s" %
-                       (name, result[0], result[1], msg))
+        diff = to_seconds(result[1]) if has_monotonic \
+            else to_timedelta(result[1])
+        logger.warning("%s not periodic (%s by %s) %s", name, result[0],
+                       diff, msg)
 
 
 def compare_times(past, future, tolerance):
@@ -124,71 +183,91 @@ def add_statistics_packet(guid, typ, packet, state):
     stats[guid][typ][packet] += 1
 
 
-def add_statistics_bandwidth(addr, typ, qty, state):
+def add_statistics_bandwidth(addr, port, typ, qty, state):
     """Add the given packet to the bandwidth statistics."""
     if 'statistics' not in state:
-        state['statistics'] = {}
-    stats = state['statistics']
-
-    addr = addr.split(":")
-    port = addr[1] if len(addr) > 1 else 0
-    addr = addr[0]
+        state['statistics'] = BandwidthStatistics()
 
     # Get the monotonic clock if possible, otherwise use the system clock.
     if 'clocks' in state:
         clock = state['clocks'][0]
         if clock is None:
-            clock = timegm(state['clocks'][1].timetuple())
+            clock = state['clocks'][1]
     else:
         clock = 0
 
-    # Add to the host counter
-    if addr not in stats:
-        stats[addr] = {}
-    if typ not in stats[addr]:
-        stats[addr][typ] = [clock, clock, 0]
-    stats[addr][typ][1] = clock
-    stats[addr][typ][2] += qty
-
-    # Add to the host + port counter
-    if port not in stats[addr]:
-        stats[addr][port] = {}
-    if typ not in stats[addr][port]:
-        stats[addr][port][typ] = [clock, clock, 0]
-    stats[addr][port][typ][1] = clock
-    stats[addr][port][typ][2] += qty
+    state['statistics'].add(addr, port, typ, qty, clock)
 
 
 def obfuscate(text, state):
-    """Obfuscate the given text."""
-    return md5((text + state['salt']).encode('utf-8')).hexdigest()
+    """Obfuscate the given text.
+
+    The obfuscated texts are memoized in the obfuscation map of the state.
+    """
+    mapping = state['obfuscation_map']
+    digest = mapping.get(text)
+    if digest is None:
+        digest = state['obfuscation_hash'](text)
+        mapping[text] = digest
+    return digest
+
+
+def create_obfuscation_hash(name, salt):
+    """Create the salted hash function to obfuscate.
+
+    The MD5 hash has the salt after the text, so it can't be precomputed.
+    The blake2b hash uses the salt (up to 64 bytes) as key and copies the
+    keyed state for every text. Both digests have 32 hexadecimal digits.
+
+    Args:
+        name (str): the name of the hash: md5 or blake2b
+        salt (str): the salt of the hash
+
+    Returns:
+        A function that returns the hexadecimal digest of a text.
+    """
+    salt = salt.encode('utf-8')
+    if name == "blake2b":
+        keyed = blake2b(key=salt[:64], digest_size=16)
+
+        def hash_text(text):
+            """Get the keyed blake2b digest of the text."""
+            digest = keyed.copy()
+            digest.update(text.encode('utf-8'))
+            return digest.hexdigest()
+    else:
+        def hash_text(text):
+            """Get the salted MD5 digest of the text."""
+            return md5(text.encode('utf-8') + salt).hexdigest()
+    return hash_text
+
+
+def load_obfuscation_map(path):
+    """Load the obfuscation map from a file.
+
+    Returns:
+        A dictionary with the hash name, the salt and the mapping of the
+        texts to their digests. It's empty if the file doesn't exist yet.
+    """
+    try:
+        with open(path) as obfuscation:
+            return json.load(obfuscation)
+    except IOError:
+        return {}
 
 
+def save_obfuscation_map(path, state):
+    """Save the obfuscation map to a file."""
+    with open(path, "w") as obfuscation:
+        json.dump({'hash': state['obfuscation_hash_name'],
+                   'salt': state['salt'],
+                   'mapping': state['obfuscation_map']},
+                  obfuscation, indent=2, sort_keys=True)
+
+
+@memoize(CACHE_SIZE)
 def get_oid(oid):
     """Get a name for the entity ID in hexadecimal text format."""
-    # Information from RTPS Spec: http://www.omg.org/spec/DDSI-RTPS/
-    # Security entities: http://www.omg.org/spec/DDS-SECURITY/1.0/Beta2/
-    BUILTIN_NAMES = {
-        # Built-in Entity GUIDs
-        0x00000000: "UNKNOWN", 0x000001c1: "PARTICIPANT",
-        0x000002c2: "SED_TOPIC_WRITER", 0x000002c7: "SED_TOPIC_READER",
-        0x000003c2: "SED_PUB_WRITER", 0x000003c7: "SED_PUB_READER",
-        0x000004c2: "SED_SUB_WRITER", 0x000004c7: "SED_SUB_READER",
-        0x000100c2: "SPD_PART_WRITER", 0x000100c7: "SPD_PART_READER",
-        0x000200c2: "MESSAGE_WRITER", 0x000200c7: "MESSAGE_READER",
-        # Security Built-in Entity GUIDs
-        0xff0003c2: "SED_PUB_SEC_WRITER", 0xff0003c7: "SED_PUB_SEC_READER",
-        0xff0004c2: "SED_SUB_SEC_WRITER", 0xff0004c7: "SED_SUB_SEC_READER",
-        0xff0200c2: "MSG_SEC_WRITER", 0xff0200c7: "MSG_SEC_READER",
-        0x000201c2: "MSG_STA_SEC_WRITER", 0x000201c7: "MSG_STA_SEC_READER",
-        0xff0202c2: "MSG_VOL_SEC_WRITER", 0xff0202c7: "MSG_VOL_SEC_READER"}
-    ENTITY_ORIGINS = {
-        0x00: "USER", 0x40: "VEND", 0x80: "BLVD", 0xc0: "BUILTIN"}
-    ENTITY_KINDS = {
-        0x00: "UNK", 0x01: "PART",
-        0x02: "W+K", 0x03: "W-K",
-        0x04: "R-K", 0x07: "R+K"}
-
     # Convert the hexadecimal text representation to a number
     oid_num = int(oid, 16)
 
@@ -206,6 +285,7 @@ def get_oid(oid):
     return name
 
 
+@memoize(CACHE_SIZE)
 def is_builtin_entity(oid):
     """Return if the OID hex number is for a built-in entity."""
     # More information in get_oid
@@ -217,10 +297,6 @@ def get_data_packet_name(oid):
     """Return the DATA packet name."""
     # More information in get_oid
     entity_name = get_oid(oid)
-    PACKET_NAMES = {
-        "SED_PUB_WRITER": "DATA(w)", "SED_SUB_WRITER": "DATA(r)",
-        "SPD_PART_WRITER": "DATA(p)", "MESSAGE_WRITER": "DATA(m)",
-        "PARTICIPANT": "DATA(p)"}
     return PACKET_NAMES[entity_name] if entity_name in PACKET_NAMES else "DATA"
 
 
@@ -239,6 +315,7 @@ def get_port_number(port, state):
     return obfuscate(port, state)[:5] if state['obfuscate'] else port
 
 
+@memoize(CACHE_SIZE)
 def get_port_name(port):
     """Get the domain ID and index of the port."""
     port_base = 7400
@@ -364,6 +441,7 @@ def set_participant(guid, name, state):
         guid = " ".join(address)
         name = obfuscate(name, state)[:20]
     state['participants'][guid] = name
+    clear_guid_cache(state)
 
 
 def set_local_address(guid, state, logger):
@@ -377,23 +455,27 @@ def set_local_address(guid, state, logger):
     elif local_address not in state['local_address']:
         logger.warning("You may have written output from two different apps.")
     state['local_address'].add(local_address)
+    clear_guid_cache(state)
 
     if state['obfuscate']:
         address[0] = obfuscate(address[0], state)[:15]
         address[1] = obfuscate(address[1], state)[:5]
-    logger.cfg("Local address: %s %s" % (address[0], address[1]))
+    logger.cfg("Local address: %s %s", address[0], address[1])
+
+
+def set_initial_peers(initial_peers, state):
+    """Set the initial peers."""
+    state['initial_peers'] = initial_peers
+    clear_guid_cache(state)
 
 
 def get_interface_props(props):
     """Get the interface properties."""
-    FLAGS = {
-        0x01: "UP", 0x02: "BROADCAST", 0x04: "LOOPBACK", 0x08: "POINTOPOINT",
-        0x10: "MULTICAST", 0x20: "RUNNING"}
     flag = int(props, 16)
     flag_name = ""
-    for bit in FLAGS:
+    for bit in INTERFACE_FLAGS:
         if flag & bit != 0:
-            flag_name += FLAGS[bit] + "|"
+            flag_name += INTERFACE_FLAGS[bit] + "|"
     return flag_name
 
 
@@ -403,6 +485,7 @@ def get_ip(ip, state, hexadecimal=True, reverse=True):
     return obfuscate(ip, state)[:15] if state['obfuscate'] else ip
 
 
+@memoize(CACHE_SIZE)
 def hex2ip(host_id, reverse=False):
     """Convert the hexadecimal host ID into an IP address."""
     host_id = int(host_id, 16)
@@ -416,7 +499,18 @@ def hex2ip(host_id, reverse=False):
 
 
 def parse_guid(state, host_id, app_id, instance_id=None):
-    """Parse the entity GUID field and conver to text."""
+    """Parse the entity GUID field and conver to text.
+
+    The name is cached by the hexadecimal fields. The first time it assigns
+    the name if needed.
+    """
+    if 'guid_cache' not in state:
+        state['guid_cache'] = LruCache(CACHE_SIZE)
+    key = (host_id, app_id, instance_id)
+    name = state['guid_cache'].get(key)
+    if name is not None:
+        return name
+
     addr = hex2ip(host_id)
     app_id = str(int(app_id, 16))
     guid = addr + " " + app_id.zfill(5)
@@ -424,7 +518,15 @@ def parse_guid(state, host_id, app_id, instance_id=None):
     if instance_id:
         guid += " " + str(int(instance_id, 16))
 
-    return get_participant(guid, state)
+    name = get_participant(guid, state)
+    state['guid_cache'].put(key, name)
+    return name
+
+
+def clear_guid_cache(state):
+    """Clear the cached names of the GUIDs."""
+    if 'guid_cache' in state:
+        state['guid_cache'].clear()
 
 
 def parse_sn(seqnum, base=10):
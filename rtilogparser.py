@@ -25,7 +25,10 @@ from __future__ import absolute_import, print_function
 from argparse import ArgumentParser
 from os.path import exists
 from logparser import __version__
+from logparser.devices.outputdevices import OUTPUT_POLICIES
 from logparser.logparser import LogParser
+from logparser.logs.matchers import MATCHERS
+from logparser.utils import OBFUSCATION_HASHES, blake2b
 
 
 def read_arguments():
@@ -35,12 +38,18 @@ def read_arguments():
 
     parser.add_argument("-i", "--input",
                         help="log file path, by default stdin")
+    parser.add_argument("--mmap", action='store_true',
+                        help="map the input file into memory to read it")
     parser.add_argument("-v", action='count',
                         help="verbosity level - increased by multiple 'v'")
     parser.add_argument("--output", "-o",
                         help="write the output into the specified file")
     parser.add_argument("--overwrite-output", "-oo",
                         help="write the output into a new/truncated file")
+    parser.add_argument("--format", choices=("markdown", "jsonl", "sqlite"),
+                        default="markdown",
+                        help="output format - 'jsonl' writes a JSON object " +
+                        "per line and 'sqlite' a database into the output")
     parser.add_argument("--write-original",
                         help="write the original log output into a file")
     parser.add_argument("--show-ip", action='store_true',
@@ -49,12 +58,27 @@ def read_arguments():
                         help="hide sensitive information like IP addresses")
     parser.add_argument("--salt", "-s",
                         help="salt for obfuscation - from random if not set")
+    parser.add_argument("--obfuscation-hash", choices=OBFUSCATION_HASHES,
+                        default="md5",
+                        help="hash for obfuscation - 'blake2b' is keyed " +
+                        "with the salt")
+    parser.add_argument("--obfuscation-map", metavar="FILE",
+                        help="load the obfuscated texts and the salt from " +
+                        "FILE and save them with the new ones")
     parser.add_argument("--show-timestamp", "-t", action='store_true',
                         help="show timestamp log field")
     parser.add_argument("--show-lines", action='store_true',
                         help="print the original and parsed log lines")
     parser.add_argument("--only",
                         help="show only log messages that match the regex")
+    parser.add_argument("--only-raw",
+                        help="parse only input lines that match the regex")
+    parser.add_argument("--only-prefilter", action='store_true',
+                        help="parse only input lines that match the --only " +
+                        "regex too")
+    parser.add_argument("--only-joined", action='store_true',
+                        help="search the --only and --highlight regex once " +
+                        "in all the message fields joined")
     parser.add_argument("--colors", "-c", action='store_true',
                         help="apply colors to log messages (e.g.: warnings)")
     parser.add_argument("--highlight",
@@ -69,7 +93,33 @@ def read_arguments():
                         help="do not show the network and packet statistics")
     parser.add_argument("--no-progress", action='store_true',
                         help="do not show the interative info at the bottom")
+    parser.add_argument("--summary-size", type=int, metavar="K",
+                        help="keep only the K most frequent warnings, " +
+                        "errors and configurations, and count them by " +
+                        "template too")
 
+    parser.add_argument("--pipeline", type=int, metavar="DEPTH",
+                        help="read, parse and write the logs from stdin " +
+                        "in different threads with queues of DEPTH logs")
+    parser.add_argument("--output-policy", choices=OUTPUT_POLICIES,
+                        help="write every log at once ('low-latency') or " +
+                        "in large blocks ('throughput') - by default " +
+                        "'low-latency' only for stdin")
+    parser.add_argument("--engine", choices=sorted(MATCHERS),
+                        default="index",
+                        help="engine to match the logs - 'list' is the " +
+                        "reference implementation")
+    parser.add_argument("--profile", metavar="FILE",
+                        help="sort the regular expressions with the hits " +
+                        "from the profile FILE and save the new hits")
+    parser.add_argument("--adaptive", action='store_true',
+                        help="sort the regular expressions periodically " +
+                        "by their hits while parsing")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="number of processes to match the input file " +
+                        "- 0 to use all the CPUs - the logs are still " +
+                        "processed by a single process that limits the " +
+                        "speed-up")
     parser.add_argument("--debug", action='store_true',
                         help="debug mode - export unmatched logs")
     parser.add_argument("--version", action='version',
@@ -83,6 +133,13 @@ def validate(args):
     if args.input and not exists(args.input):
         print("\033[91mERROR: The input file does not exists\033[0m")
         return False
+    if args.format == "sqlite" and not (args.output or args.overwrite_output):
+        print("\033[91mERROR: The sqlite format requires an output file" +
+              "\033[0m")
+        return False
+    if args.obfuscation_hash == "blake2b" and blake2b is None:
+        print("\033[91mERROR: The blake2b hash requires Python 3.6\033[0m")
+        return False
     return True
 
 
@@ -0,0 +1,159 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Tests of the bandwidth statistics."""
+from __future__ import absolute_import
+import sys
+import unittest
+
+from logparser.bandwidth import BandwidthStatistics
+from logparser.clocks import MICROSECONDS
+
+CLOCK = 1462983921 * MICROSECONDS
+TYPES = ("send", "receive")
+
+
+def add_dict_statistics(stats, addr, port, typ, qty, clock):
+    """Add a packet to the statistics like the previous dictionary store."""
+    if addr not in stats:
+        stats[addr] = {}
+    if typ not in stats[addr]:
+        stats[addr][typ] = [clock, clock, 0]
+    stats[addr][typ][1] = clock
+    stats[addr][typ][2] += qty
+
+    if port not in stats[addr]:
+        stats[addr][port] = {}
+    if typ not in stats[addr][port]:
+        stats[addr][port][typ] = [clock, clock, 0]
+    stats[addr][port][typ][1] = clock
+    stats[addr][port][typ][2] += qty
+
+
+def get_size(obj, seen):
+    """Get the size of an object and the objects that it contains."""
+    if id(obj) in seen or isinstance(obj, int) and -5 <= obj <= 256:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(get_size(key, seen) + get_size(value, seen)
+                    for key, value in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(get_size(item, seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += get_size(obj.__dict__, seen)
+    return size
+
+
+def add_traffic(add, stats, num_addresses, num_ports, seconds):
+    """Add a packet every second to the counters of every address and port.
+
+    Returns:
+        The size of the statistics without the addresses and ports, since
+        the parser keeps them too.
+    """
+    addresses = ["10.0.%d.%d" % (i // 256, i % 256)
+                 for i in range(num_addresses)]
+    ports = ["%05d" % (7410 + i) for i in range(num_ports)]
+    clock = CLOCK
+    for second in range(seconds):
+        for i, addr in enumerate(addresses):
+            for port in ports:
+                for typ in TYPES:
+                    clock += 1
+                    add(stats, addr, port, typ, 100 + i + second % 10 * 1000,
+                        clock + second * MICROSECONDS)
+    return get_size(stats, set(id(key) for key in addresses + ports))
+
+
+class BandwidthStatisticsTest(unittest.TestCase):
+    """Check the memory and the throughput of the bandwidth statistics."""
+
+    @staticmethod
+    def add(stats, *args):
+        """Add a packet to a bandwidth store."""
+        stats.add(*args)
+
+    def get_info(self, stats, address, typ):
+        """Get the information of an address counter."""
+        return stats.get_info(stats.get_tree()[address][typ])
+
+    def test_memory(self):
+        """Use less memory than the dictionary store."""
+        for num_ports in (1, 2, 4):
+            old = add_traffic(add_dict_statistics, {}, 50, num_ports, 20)
+            new = add_traffic(self.add, BandwidthStatistics(), 50,
+                              num_ports, 20)
+            self.assertLess(new, old)
+
+    def test_long_capture(self):
+        """Don't use more memory for long captures."""
+        short = add_traffic(self.add, BandwidthStatistics(), 2, 2, 10)
+        long_ = add_traffic(self.add, BandwidthStatistics(), 2, 2, 10000)
+        # The size of the dictionaries may change a few bytes.
+        self.assertLess(long_, short * 1.01)
+
+    def test_percentiles(self):
+        """Get the peak and percentiles of the throughput."""
+        stats = BandwidthStatistics()
+        rates = [1000] * 80 + [0] * 10 + [100000] * 9 + [5000000]
+        for second, rate in enumerate(rates):
+            # Two packets per second.
+            for i in range(2 if rate else 0):
+                stats.add("A", 7410, "send", rate // 2,
+                          CLOCK + second * MICROSECONDS + i)
+
+        info = self.get_info(stats, "A", "send")
+        self.assertEqual(info['bytes'], sum(rates))
+        self.assertEqual(info['packets'], 180)
+        self.assertEqual(info['peak'], 5000000)
+        self.assertAlmostEqual(info['percentiles'][50] / 1000, 1, delta=0.19)
+        self.assertAlmostEqual(info['percentiles'][90] / 1000, 1, delta=0.19)
+        self.assertAlmostEqual(info['percentiles'][99] / 100000, 1,
+                               delta=0.19)
+
+        # The address + port counters only have the totals.
+        info = stats.get_info(stats.get_tree()["A"][7410]["send"])
+        self.assertEqual(info['bytes'], sum(rates))
+        self.assertNotIn('peak', info)
+
+    def test_zero_buckets(self):
+        """Count the seconds without traffic."""
+        stats = BandwidthStatistics()
+        stats.add("A", 7410, "send", 1000, CLOCK)
+        stats.add("A", 7410, "send", 2000, CLOCK + 9 * MICROSECONDS)
+        info = self.get_info(stats, "A", "send")
+        self.assertEqual(info['percentiles'][50], 0)
+        self.assertAlmostEqual(info['percentiles'][90] / 1000, 1, delta=0.19)
+        self.assertEqual(info['percentiles'][99], 2000)
+        self.assertEqual(info['peak'], 2000)
+
+    def test_halve_bins(self):
+        """Keep the proportions of the bins after they are full."""
+        stats = BandwidthStatistics()
+        seconds = BandwidthStatistics.MAX_BIN_COUNT * 2
+        for second in range(seconds):
+            rate = 100000 if second % 50 == 0 else 1000
+            stats.add("A", 7410, "send", rate, CLOCK + second * MICROSECONDS)
+
+        info = self.get_info(stats, "A", "send")
+        self.assertAlmostEqual(info['percentiles'][50] / 1000, 1, delta=0.19)
+        self.assertAlmostEqual(info['percentiles'][99] / 100000, 1,
+                               delta=0.19)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Tests of the message summaries."""
+from __future__ import absolute_import
+import random
+import unittest
+
+from logparser.countset import CountSet, get_template
+from logparser.logger import Logger
+from logparser.logs.events import events
+from logparser.logs.routing import routing
+
+
+def add_min_eviction(countset, max_size, element):
+    """Add an element evicting the lowest count with a linear search."""
+    if element in countset:
+        countset[element][1] += 1
+        return
+    error = 0
+    if len(countset) >= max_size:
+        evicted = min(countset, key=lambda k: countset[k][1])
+        error = countset.pop(evicted)[1]
+    countset[element] = [len(countset), error + 1, error]
+
+
+class CountSetTest(unittest.TestCase):
+    """Check the bounded mode and the templates of the summaries."""
+
+    def test_eviction(self):
+        """Evict the same elements as a linear search of the lowest count."""
+        stream = random.Random(1)
+        countset = CountSet(20, False)
+        expected = {}
+        for _ in range(20000):
+            element = int(stream.paretovariate(1.2))
+            countset.add(element)
+            add_min_eviction(expected, 20, element)
+        self.assertEqual(
+            dict((obj, (count, countset.get_error(obj)))
+                 for _, obj, count in countset.elements()),
+            dict((obj, tuple(info[1:])) for obj, info in expected.items()))
+
+    def test_templates(self):
+        """Replace the variable fields of the messages."""
+        for message, template in (
+                ("[LP-21] Decreased message_size_max for UDPv4 from " +
+                 "65530 to 65507",
+                 "[LP-21] Decreased message_size_max for UDPv4 from # to #"),
+                ("Missing sample from H1.A1.P1.W-K_800000 to R-K_800000",
+                 "Missing sample from # to #"),
+                ("Missing sample from 10.70.2.213 01264 1.W+K_000100 to " +
+                 "R+K_000200", "Missing sample from # to #"),
+                ("Missing sample from 0001:0001:0001:0000:0000:0000:0000:" +
+                 "0000 01264 1.W-K_800000 to R-K_800000",
+                 "Missing sample from # to #"),
+                ("Writer oid 0x8000000A sends preemptive HB",
+                 "Writer oid # sends preemptive HB"),
+                ("[LP-18] Cannot match remote entity in topic 'Square': " +
+                 "Different type names found ('Shape', 'ShapeType')",
+                 "[LP-18] Cannot match remote entity in topic #: " +
+                 "Different type names found (#, #)")):
+            self.assertEqual(get_template(message), template)
+
+    def test_handler_templates(self):
+        """Use the description templates of the handlers."""
+        state = {'format_device': None, 'errors': CountSet(10),
+                 'warnings': CountSet(10)}
+        logger = Logger(state)
+        logger.inline = False
+        routing.on_typecode_not_found(["Square"], state, logger)
+        routing.on_typecode_not_found(["Circle"], state, logger)
+        events.on_lose_discovery_samples(
+            ["publication", "000003c2", "12", "2"], state, logger)
+        self.assertEqual(
+            [(obj, count) for _, obj, count in
+             state['errors'].templates.elements()],
+            [("Typecode for # is unavailable. Route will not work", 2)])
+        self.assertEqual(
+            [obj for _, obj, _ in state['warnings'].templates.elements()],
+            ["# discovery samples lost for # # (# in total)"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Tests of the input devices."""
+from __future__ import absolute_import
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from locale import getpreferredencoding
+
+from logparser.devices.inputdevices import InputFileDevice, InputMmapDevice
+
+LINES = [u"[1462983921.393995] COMMENDSrWriterService_write: writer oid " +
+         u"0x80000002 schedules job for sn (0000000000,00000001)",
+         u"",
+         u"#Custom: Topic 'Sqüare' été créé",
+         u"#Custom: 日本語"] * 20
+
+
+def read_all(device, size):
+    """Read all the lines of the device in blocks."""
+    lines = []
+    while True:
+        block = device.read_lines(size)
+        if not block:
+            return lines
+        lines.extend(block)
+
+
+class InputMmapDeviceTest(unittest.TestCase):
+    """Compare the lines of the memory-mapped file with the text file."""
+
+    def setUp(self):
+        """Create a temporary directory."""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "log.txt")
+        self.encoding = getpreferredencoding(False)
+        try:
+            u"".join(LINES).encode(self.encoding)
+        except UnicodeEncodeError:
+            self.skipTest("the encoding %s is not Unicode" % self.encoding)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.directory)
+
+    def write_log(self, newline):
+        """Write the lines with the end of line."""
+        with io.open(self.path, "w", encoding=self.encoding,
+                     newline="") as log:
+            log.write(newline.join(LINES) + newline)
+
+    def compare_devices(self, newline):
+        """Read the same lines with both devices."""
+        self.write_log(newline)
+        text_device = InputFileDevice(self.path, {})
+        expected = read_all(text_device, 1024)
+        text_device.close()
+        self.assertEqual(expected, LINES)
+        for size in (7, 64, 1024):
+            mmap_device = InputMmapDevice(self.path, {})
+            mmap_device.MAX_LINE_LENGTH = 200
+            self.assertEqual(read_all(mmap_device, size), expected)
+            mmap_device.close()
+
+    def test_lf(self):
+        """Split the lines with LF."""
+        self.compare_devices(u"\n")
+
+    def test_crlf(self):
+        """Split the lines with CRLF."""
+        self.compare_devices(u"\r\n")
+
+    def test_cr(self):
+        """Split the lines with CR."""
+        self.compare_devices(u"\r")
+
+    def test_truncated(self):
+        """Truncate the long lines after a whole character."""
+        with io.open(self.path, "w", encoding="utf-8", newline="") as log:
+            log.write(u"a" + u"é" * 10 + u"\r\nb\r\n")
+        device = InputMmapDevice(self.path, {})
+        device.encoding = "utf-8"
+        device.MAX_LINE_LENGTH = 10
+        self.assertEqual(read_all(device, 4),
+                         [u"a" + u"é" * 4, u"b"])
+        device.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Tests of the logger."""
+from __future__ import absolute_import
+import unittest
+import warnings
+
+from logparser.countset import CountSet
+from logparser.logger import Logger
+
+
+class LoggerTest(unittest.TestCase):
+    """Check the arguments of the log methods."""
+
+    def setUp(self):
+        """Create a logger that only counts the warnings."""
+        self.state = {'format_device': None, 'warnings': CountSet()}
+        self.logger = Logger(self.state)
+        self.logger.inline = False
+
+    def get_warnings(self):
+        """Get the counted warnings."""
+        return [obj for _, obj, _ in self.state['warnings'].elements()]
+
+    def test_level(self):
+        """Discard the messages with a higher verbosity level."""
+        self.logger.verbosity = 1
+        self.logger.warning("DATA [%d] may have been lost", 0)
+        self.logger.warning("DATA [%d] may have been lost", 1, level=1)
+        self.logger.warning("DATA [%d] may have been lost", 2, level=2)
+        self.assertEqual(self.get_warnings(),
+                         ["DATA [0] may have been lost",
+                          "DATA [1] may have been lost"])
+
+    def test_positional_level(self):
+        """Accept the positional level of the previous versions."""
+        self.logger.verbosity = 1
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.logger.warning("DATA [0] may have been lost", 1)
+            self.logger.warning("DATA [1] may have been lost", 2)
+            self.logger.warning("DATA [%d] may have been lost", 2, 1)
+            self.logger.warning("%d%% of DATA [%d] lost", 50, 3, 1)
+        self.assertEqual(len(caught), 4)
+        self.assertTrue(all(issubclass(warning.category, DeprecationWarning)
+                            for warning in caught))
+        self.assertEqual(self.get_warnings(),
+                         ["DATA [0] may have been lost",
+                          "DATA [2] may have been lost",
+                          "50% of DATA [3] lost"])
+
+    def test_template_arguments(self):
+        """Format the integer arguments of the template."""
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            self.logger.warning("DATA [%d] may have been lost", 1)
+            self.logger.warning("%d%% of DATA [%d] lost", 50, 2)
+        self.assertEqual(caught, [])
+        self.assertEqual(self.get_warnings(),
+                         ["DATA [1] may have been lost",
+                          "50% of DATA [2] lost"])
+
+    def test_unexpected_keyword(self):
+        """Reject the keyword arguments other than the level."""
+        with self.assertRaises(TypeError):
+            self.logger.warning("DATA [%d] may have been lost", 0, verb=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
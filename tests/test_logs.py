@@ -0,0 +1,52 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Tests of the list of regular expressions."""
+from __future__ import absolute_import
+import unittest
+
+from logparser.logs.events.events import on_create_topic, on_enable_topic
+from logparser.logs.logs import create_regex_list, sort_regex_list
+from logparser.logs.matchers import MATCHERS, create_matcher
+
+# Two messages of log1.txt from different threads in the same line.
+INTERLEAVED_LINE = (
+    "[1462983921.401995] DDS_DomainParticipant_create_topic_disabledI:" +
+    "created topic: topic=Example async, type=async" +
+    "[1462983921.401995] DDS_Topic_enable:enabled")
+
+
+class SortRegexListTest(unittest.TestCase):
+    """Check the order of the sorted expressions."""
+
+    def setUp(self):
+        """Create the list of expressions."""
+        state = {'debug': False, 'verbosity': 4, 'no_network': False,
+                 'no_stats': False, 'assign_names': True, 'obfuscate': False}
+        self.expressions = create_regex_list(state)
+
+    def test_interleaved_line(self):
+        """Match the same expression in a line with two functions."""
+        hits = dict((expr[1].pattern, 100) for expr in self.expressions
+                    if expr[0] == on_enable_topic)
+        expressions = sort_regex_list(self.expressions, hits)
+        for engine in MATCHERS:
+            for exprs in (self.expressions, expressions):
+                match = create_matcher(engine, exprs).match(INTERLEAVED_LINE)
+                self.assertIs(match[0], on_create_topic, engine)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Tests of the metadata of the log functions."""
+from __future__ import absolute_import
+import unittest
+
+from logparser.logs.debug.debug import on_ignored_message
+from logparser.logs.logs import create_regex_list
+
+NAME_HANDLERS = ['on_receive_ack', 'on_receive_hb', 'on_received_gap',
+                 'on_send_ack', 'on_send_nack', 'on_discover_publication']
+
+
+class PruneHandlersTest(unittest.TestCase):
+    """Count the handlers replaced because they don't have any effect."""
+
+    @staticmethod
+    def get_pruned(**options):
+        """Get the names of the pruned handlers with the options."""
+        state = {'debug': False, 'verbosity': 4, 'no_network': False,
+                 'no_stats': False, 'assign_names': True, 'obfuscate': False}
+        names = dict((expr[1].pattern, expr[0].__name__)
+                     for expr in create_regex_list(state))
+        state.update(verbosity=0, **options)
+        return [names[expr[1].pattern] for expr in create_regex_list(state)
+                if expr[0] is on_ignored_message]
+
+    def test_show_ip(self):
+        """Prune the handlers that only assign names with --show-ip."""
+        pruned = self.get_pruned(no_network=True)
+        pruned_show_ip = self.get_pruned(no_network=True, assign_names=False)
+        self.assertEqual(len(pruned), 29)
+        self.assertEqual(len(pruned_show_ip), 59)
+        for name in NAME_HANDLERS:
+            self.assertNotIn(name, pruned)
+            self.assertIn(name, pruned_show_ip)
+
+    def test_obfuscate(self):
+        """Keep the handlers that only assign names with --obfuscate."""
+        pruned = self.get_pruned(no_network=True, assign_names=False,
+                                 obfuscate=True)
+        self.assertEqual(pruned, self.get_pruned(no_network=True))
+
+    def test_verbosity(self):
+        """Prune the handlers of higher levels with --show-ip."""
+        pruned = self.get_pruned(assign_names=False)
+        self.assertEqual(len(pruned), 30)
+        self.assertIn('on_update_remote_participant', pruned)
+        self.assertIn('on_error_no_transport_available', pruned)
+        self.assertNotIn('on_udpv4_send', pruned)
+        self.assertIn('on_udpv4_send', self.get_pruned(assign_names=False,
+                                                       no_stats=True))
+
+    def test_state(self):
+        """Never prune the handlers that change other state."""
+        pruned = self.get_pruned(no_network=True, no_stats=True,
+                                 assign_names=False)
+        for name in ['on_schedule_data', 'on_send_data', 'on_receive_data',
+                     'on_send_gap', 'on_announce_local_participant']:
+            self.assertNotIn(name, pruned)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Tests of the output devices."""
+from __future__ import absolute_import
+import os
+import select
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+from logparser.devices.outputdevices import (OutputFileDevice,
+                                             OutputThreadDevice)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class OutputDevicesTest(unittest.TestCase):
+    """Check when the buffered logs are written."""
+
+    def setUp(self):
+        """Create a temporary directory."""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "output.md")
+        self.state = {'output_line': 0, 'output_policy': "throughput"}
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.directory)
+
+    def read_output(self):
+        """Read the output file."""
+        with open(self.path) as output:
+            return output.read()
+
+    def test_check_flush(self):
+        """Write the buffer after the flush time."""
+        device = OutputFileDevice(self.state, self.path, True)
+        device.write("log")
+        device.check_flush()
+        self.assertEqual(self.read_output(), "")
+        device.flush_clock -= device.FLUSH_TIME + 1
+        device.check_flush()
+        self.assertEqual(self.read_output(), "log\n")
+        device.close()
+
+    def test_thread_flush(self):
+        """Write the buffer when there aren't new logs."""
+        device = OutputFileDevice(self.state, self.path, True)
+        device.FLUSH_TIME = 0.1
+        thread_device = OutputThreadDevice(self.state, device, 10)
+        thread_device.write("log")
+        time.sleep(1)
+        self.assertEqual(self.read_output(), "log\n")
+        thread_device.close()
+
+    def test_thread_state(self):
+        """Count the logs once in the state of both devices."""
+        device = OutputFileDevice(self.state, self.path, True)
+        thread_device = OutputThreadDevice(self.state, device, 10)
+        thread_device.write("log")
+        thread_device.write("log")
+        thread_device.close()
+        self.assertIs(device.state, self.state)
+        self.assertEqual(self.state['output_line'], 2)
+        self.assertEqual(self.read_output(), "log\nlog\n")
+
+    def test_low_latency_file(self):
+        """Flush the file stream after the flush time."""
+        self.state['output_policy'] = "low-latency"
+        device = OutputFileDevice(self.state, self.path, True)
+        device.write("log")
+        self.assertEqual(device.buffer, [])
+        self.assertEqual(self.read_output(), "")
+        device.flush_clock -= device.FLUSH_TIME + 1
+        device.write("log")
+        self.assertEqual(self.read_output(), "log\nlog\n")
+        device.close()
+
+    @unittest.skipUnless(hasattr(select, "poll"), "no poll")
+    def test_live_input(self):
+        """Write the logs before waiting for new input lines."""
+        process = subprocess.Popen(
+            [sys.executable, os.path.join(ROOT, "rtilogparser.py"),
+             "--no-progress", "--output-policy", "throughput"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        try:
+            process.stdin.write(b"#Custom: Writing async, count 0\n")
+            process.stdin.flush()
+            poll = select.poll()
+            poll.register(process.stdout, select.POLLIN)
+            output = b""
+            while b"Writing async" not in output:
+                self.assertTrue(poll.poll(10000), "no output")
+                output += os.read(process.stdout.fileno(), 4096)
+        finally:
+            process.stdin.close()
+            process.stdout.read()
+            process.stdout.close()
+            process.wait()
+
+
+if __name__ == "__main__":
+    unittest.main()
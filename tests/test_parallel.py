@@ -0,0 +1,107 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Tests of the parallel parsing of the log files."""
+from __future__ import absolute_import
+import multiprocessing
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOG1 = os.path.join(ROOT, "tutorial", "logs", "log1.txt")
+
+# Run the log parser with a start method and a chunk size.
+SCRIPT = """
+import multiprocessing, sys
+import logparser.parallel
+import rtilogparser
+multiprocessing.set_start_method(sys.argv.pop(1), force=True)
+logparser.parallel.CHUNK_SIZE = int(sys.argv.pop(1))
+rtilogparser.main()
+"""
+
+
+def run_parser(args, start_method="fork", chunk_size=4 * 1024 * 1024):
+    """Run the log parser and get its output."""
+    return subprocess.check_output(
+        [sys.executable, "-c", SCRIPT, start_method, str(chunk_size),
+         "--no-progress", "-s", "salt"] + args,
+        cwd=ROOT, stderr=subprocess.STDOUT)
+
+
+def create_jumping_log(path):
+    """Create a log from log1.txt with clocks that go forward and backward.
+
+    The small steps add up to a large distance without any warning.
+    """
+    steps = [0, 25, 25, 25, 90, -150, 0, 0]
+    clock = 1462983921
+    with open(LOG1) as log, open(path, "w") as output:
+        for i, line in enumerate(log):
+            if line.startswith("["):
+                clock += steps[i % len(steps)]
+                line = "[%d.000000]%s" % (clock, line[19:])
+            output.write(line)
+
+
+@unittest.skipUnless(hasattr(multiprocessing, "set_start_method"),
+                     "no start methods")
+class ParallelTest(unittest.TestCase):
+    """Compare the output of the parallel and sequential parsing."""
+
+    def setUp(self):
+        """Create a temporary directory."""
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.directory)
+
+    def test_spawn(self):
+        """Parse with processes created by spawn."""
+        args = ["-i", LOG1, "-vvvv"]
+        expected = run_parser(args)
+        self.assertEqual(run_parser(args + ["-j", "2"], "spawn"), expected)
+
+    def test_clocks(self):
+        """Check the distance of the clocks in unmatched lines and chunks."""
+        path = os.path.join(self.directory, "log.txt")
+        create_jumping_log(path)
+        for args in (["-vvvv"], ["--only-raw", "DATA"]):
+            args += ["-i", path]
+            expected = run_parser(args)
+            self.assertIn(b"System clock went backward", expected)
+            for chunk_size in (1, 512, 4096):
+                self.assertEqual(
+                    run_parser(args + ["-j", "2"], chunk_size=chunk_size),
+                    expected)
+
+    def test_write_original(self):
+        """Write all the lines of the original log."""
+        paths = [os.path.join(self.directory, "original%d.txt" % jobs)
+                 for jobs in (1, 2)]
+        for jobs, path in enumerate(paths, 1):
+            run_parser(["-i", LOG1, "-j", str(jobs), "--write-original",
+                        path], chunk_size=512)
+        with open(paths[0]) as expected, open(paths[1]) as original:
+            self.assertEqual(original.read(), expected.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Tests of the pending samples."""
+from __future__ import absolute_import
+import random
+import unittest
+
+from logparser.pendingsamples import MIN_STALE, PendingSamples
+
+
+class PendingSamplesTest(unittest.TestCase):
+    """Compare the pending samples with sorted lists."""
+
+    def test_random_operations(self):
+        """Keep the same samples as a sorted list."""
+        stream = random.Random(1)
+        samples = PendingSamples()
+        expected = {}
+        for _ in range(20000):
+            writer = stream.choice("AB")
+            seqnums = expected.setdefault(writer, [])
+            seqnum = stream.randint(0, 300)
+            operation = stream.random()
+            if operation < 0.5:
+                samples.toggle(writer, seqnum)
+                if seqnum in seqnums:
+                    seqnums.remove(seqnum)
+                else:
+                    seqnums.append(seqnum)
+                    seqnums.sort()
+            elif operation < 0.9:
+                samples.remove(writer, seqnum)
+                if seqnum in seqnums:
+                    seqnums.remove(seqnum)
+            else:
+                end = seqnum + stream.randint(0, 50)
+                removed = [sn for sn in seqnums if seqnum <= sn < end]
+                self.assertEqual(samples.pop_range(writer, seqnum, end),
+                                 removed)
+                expected[writer] = [sn for sn in seqnums
+                                    if sn not in removed]
+        for writer, seqnums in expected.items():
+            self.assertEqual(samples.pop_range(writer, 0, 301), seqnums)
+        self.assertEqual(samples.writers, {})
+
+    def test_compact(self):
+        """Remove the sent samples from the list of the writer."""
+        samples = PendingSamples()
+        for seqnum in range(10000):
+            samples.toggle("A", seqnum)
+            samples.toggle("A", seqnum + 10000)
+            samples.remove("A", seqnum)
+            writer = samples.writers["A"]
+            self.assertLessEqual(len(writer.seqnums) - writer.head,
+                                 2 * len(writer.pending) + MIN_STALE + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+# Log Parser for RTI Connext.
+#
+#   Copyright 2016 Real-Time Innovations, Inc.
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+"""Tests of the SQLite format device."""
+from __future__ import absolute_import
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LOG1 = os.path.join(ROOT, "tutorial", "logs", "log1.txt")
+TABLES = ("info", "messages", "config", "warnings", "errors", "templates",
+          "locators", "names", "bandwidth", "packets", "threads")
+
+
+def export(output, *args):
+    """Export the first tutorial log into a database."""
+    subprocess.check_call(
+        [sys.executable, os.path.join(ROOT, "rtilogparser.py"), "-i", LOG1,
+         "--no-progress", "-vvvv", "--summary-size", "10", "--format",
+         "sqlite"] + list(args) + [output])
+
+
+class SqliteFormatDeviceTest(unittest.TestCase):
+    """Check the runs of the SQLite databases."""
+
+    def setUp(self):
+        """Create a temporary directory."""
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "log.db")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.directory)
+
+    def get_counts(self):
+        """Get the number of rows by run of every table."""
+        connection = sqlite3.connect(self.path)
+        counts = dict(
+            (table, connection.execute(
+                "SELECT run_id, COUNT(*) FROM %s GROUP BY run_id" % table
+            ).fetchall())
+            for table in TABLES)
+        counts['runs'] = connection.execute(
+            "SELECT id, input FROM runs").fetchall()
+        connection.close()
+        return counts
+
+    def test_runs(self):
+        """Add the rows of every run with its ID."""
+        export(self.path, "-o")
+        first = self.get_counts()
+        self.assertEqual(first['runs'], [(1, LOG1)])
+        for table in ("messages", "config", "templates", "names",
+                      "bandwidth", "packets"):
+            self.assertEqual([run for run, _ in first[table]], [1], table)
+
+        export(self.path, "-o")
+        second = self.get_counts()
+        self.assertEqual(second['runs'], [(1, LOG1), (2, LOG1)])
+        for table in TABLES:
+            self.assertEqual(second[table], first[table] + [
+                (2, count) for _, count in first[table]], table)
+
+    def test_durability(self):
+        """Wait for the disk only when there are previous runs."""
+        export(self.path, "-o")
+        connection = sqlite3.connect(self.path)
+        self.assertEqual(connection.execute(
+            "PRAGMA journal_mode").fetchone(), ("delete",))
+        connection.close()
+
+        export(self.path, "-o")
+        connection = sqlite3.connect(self.path)
+        self.assertEqual(connection.execute(
+            "PRAGMA journal_mode").fetchone(), ("wal",))
+        connection.close()
+
+    def test_overwrite(self):
+        """Create the database again."""
+        export(self.path, "-o")
+        export(self.path, "-oo")
+        self.assertEqual(self.get_counts()['runs'], [(1, LOG1)])
+
+
+if __name__ == "__main__":
+    unittest.main()